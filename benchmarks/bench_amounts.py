@@ -0,0 +1,65 @@
+"""Summing payment amounts by status, with Decimal and with
+collect_amounts().
+
+"collect + group_by" is the same work as the Decimal loop. The time is the
+median of --repeats runs.
+
+    python -m benchmarks.bench_amounts --payments 100000
+"""
+import argparse
+import statistics
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from benchmarks.payloads import payment
+from mollie.api import money
+from mollie.api.money import collect_amounts
+
+
+def decimal_by_status(payments: List[Dict[str, Any]]) -> Dict[Any, Decimal]:
+    totals: Dict[Any, Decimal] = {}
+    for item in payments:
+        amount = Decimal(item["amount"]["value"])
+        totals[item["status"]] = totals.get(item["status"], 0) + amount
+    return totals
+
+
+def measure(func: Callable[[], Any], repeats: int) -> float:
+    """Return the median milliseconds that func takes."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payments", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    payments = [payment(index) for index in range(args.payments)]
+    amounts = collect_amounts(payments, key="status")
+    cases = {
+        "Decimal loop": lambda: decimal_by_status(payments),
+        "collect_amounts": lambda: collect_amounts(payments, key="status"),
+        "collect + group_by": lambda: collect_amounts(payments, key="status")[
+            "EUR"
+        ].group_by(),
+        "sum": lambda: amounts["EUR"].sum(),
+        "group_by": lambda: amounts["EUR"].group_by(),
+        "histogram": lambda: amounts["EUR"].histogram(
+            ["10.00", "100.00", "250.00"]
+        ),
+    }
+    print(f"arrays: {'numpy' if money.numpy is not None else 'array'}")
+    print(f"{'case':<20}{'ms':>10}")
+    for name, func in cases.items():
+        print(f"{name:<20}{measure(func, args.repeats):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Per-request latency of the payment and webhook routes, with and without
+the shared Mollie clients of src.website0.helper_mollie_client.
+
+The routes are reduced to their Mollie API calls, which run against a
+local mock API that delays every new connection to mimic a TLS handshake.
+The object cache is disabled for the shared clients, so they measure the
+reuse of connections. The "object cache" rows show the cache on its own,
+as the payment is never invalidated they are all hits for the webhook.
+
+    python -m benchmarks.bench_client_reuse --requests 200
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.mock_api import start_mock_api
+
+API_KEY: str = "test_benchmarkbenchmarkbenchmark00"
+PAYMENT_DATA: Dict[str, Any] = {
+    "amount": {"currency": "EUR", "value": "120.00"},
+    "description": "My first API payment",
+    "webhookUrl": "https://example.org/02-webhook-verification",
+    "redirectUrl": "https://example.org/03-return-page?my_webshop_id=1",
+    "metadata": {"my_webshop_id": "1"},
+}
+
+
+def measure(route: Callable[[], Any], requests: int) -> List[float]:
+    """Return the latency in milliseconds of each call to route."""
+    route()  # warm up
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        route()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--connect-delay",
+        type=float,
+        default=0.02,
+        help="seconds spent setting up each new connection",
+    )
+    args = parser.parse_args()
+
+    _, endpoint = start_mock_api(connect_delay=args.connect_delay)
+    os.environ["MOLLIE_API_ENDPOINT"] = endpoint
+    os.environ["MOLLIE_OBJECT_CACHE"] = "0"
+
+    # pylint: disable=import-outside-toplevel
+    from mollie.api.cache import ObjectCache
+    from mollie.api.client import Client
+    from src.website0.helper_mollie_client import get_mollie_client
+
+    def new_client() -> Client:
+        client = Client(api_endpoint=endpoint)
+        client.set_api_key(API_KEY)
+        return client
+
+    def shared_client() -> Client:
+        return get_mollie_client(api_key=API_KEY)
+
+    cached = new_client()
+    cached.set_object_cache(ObjectCache())
+
+    def cached_client() -> Client:
+        return cached
+
+    routes = {
+        "payment creation": lambda c: c().payments.create(PAYMENT_DATA),
+        "webhook": lambda c: c().payments.get("tr_7UhSN1zuXS"),
+    }
+    print(f"{'route':<18}{'client':<14}{'median ms':>10}{'p95 ms':>10}")
+    for name, route in routes.items():
+        for label, factory in (
+            ("per request", new_client),
+            ("shared", shared_client),
+            ("object cache", cached_client),
+        ):
+            latencies = measure(lambda: route(factory), args.requests)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            median = statistics.median(latencies)
+            print(f"{name:<18}{label:<14}{median:>10.2f}{p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
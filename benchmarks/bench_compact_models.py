@@ -0,0 +1,64 @@
+"""Memory and attribute access of dict-based and compact payments.
+
+Builds an in-memory mirror of payments, once as Payment objects and once
+as CompactPayment objects, and reads a few fields of every payment. The
+nested values (amounts, metadata) are shared by both mirrors when they
+are built, so the memory reported is that of the objects themselves.
+
+    python -m benchmarks.bench_compact_models --payments 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.payloads import payment
+from mollie.api.objects.compact import CompactPayment
+from mollie.api.objects.payment import Payment
+
+
+def build(factory: Callable[[Any], Any], data: List[Any]) -> Tuple[Any, int]:
+    """Return the objects made by factory, and the memory they take after
+    their fields were read once."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(item) for item in data]
+    read(objects)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, size
+
+
+def read(objects: List[Any]) -> float:
+    """Return the nanoseconds per object to read a few of its fields."""
+    start = time.perf_counter()
+    for obj in objects:
+        obj.id
+        obj.status
+        obj.created_at
+        obj.amount_refunded
+        obj.settlement_id
+    return (time.perf_counter() - start) * 1e9 / len(objects)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payments", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = [payment(index) for index in range(args.payments)]
+    print(f"{'model':<16}{'bytes/object':>14}{'MiB':>10}{'read ns':>10}")
+    for name, factory in (
+        ("Payment", lambda item: Payment(item, None)),
+        ("CompactPayment", CompactPayment),
+    ):
+        objects, size = build(factory, data)
+        ns = read(objects)
+        per_object = size / len(objects)
+        print(f"{name:<16}{per_object:>14.0f}{size / 2**20:>10.1f}{ns:>10.0f}")
+        del objects
+
+
+if __name__ == "__main__":
+    main()
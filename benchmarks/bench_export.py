@@ -0,0 +1,108 @@
+"""Peak memory and time of exporting payments to CSV and NDJSON.
+
+The pages of the payments list are served by an in-memory transport, so
+the measured peak is that of the exporter, which should not grow with the
+number of payments.
+
+    python -m benchmarks.bench_export --payments 5000 25000
+"""
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from benchmarks.payloads import payment
+from mollie.api.client import Client
+from mollie.api.export import Exporter
+from mollie.api.transport import Timeout, Transport
+
+
+class PagesTransport(Transport):
+    """Serves the pages of a list of `total` payments, made on request."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        query = parse_qs(urlsplit(url).query)
+        limit = int(query["limit"][0])
+        start = int(query["from"][0][3:]) if "from" in query else 0
+        stop = min(start + limit, self.total)
+        next_link = None
+        if stop < self.total:
+            next_link = {
+                "href": f"https://api.mollie.com/v2/payments"
+                f"?from=tr_{stop:010d}&limit={limit}"
+            }
+        body = json.dumps(
+            {
+                "count": stop - start,
+                "_embedded": {
+                    "payments": [
+                        payment(index) for index in range(start, stop)
+                    ]
+                },
+                "_links": {"next": next_link},
+            }
+        ).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/hal+json"}
+        )
+        response.raw = io.BytesIO(body)
+        return response
+
+
+def measure(total: int, path: str) -> Tuple[float, int]:
+    """Return the seconds and the peak memory of an export."""
+    client = Client()
+    client.set_api_key("test_benchmarkbenchmarkbenchmark00")
+    client.set_transport(PagesTransport(total))
+    exporter = Exporter(client.payments, batch_size=5000)
+    tracemalloc.start()
+    start = time.perf_counter()
+    exporter.export(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--payments", type=int, nargs="+", default=[5_000, 25_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'format':<8}{'payments':>10}{'seconds':>10}{'peak MiB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for format in ("csv", "ndjson"):
+            for total in args.payments:
+                path = os.path.join(directory, f"payments.{format}")
+                seconds, peak = measure(total, path)
+                print(
+                    f"{format:<8}{total:>10}{seconds:>10.2f}"
+                    f"{peak / 2**20:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
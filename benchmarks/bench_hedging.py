@@ -0,0 +1,68 @@
+"""Latency percentiles of payments.get(), with and without hedging.
+
+The mock API answers a fraction of the requests much slower than the
+others, like the occasional slow response of the real API.
+
+    python -m benchmarks.bench_hedging --requests 500
+"""
+import argparse
+import time
+from typing import List
+
+from benchmarks.mock_api import start_mock_api
+from mollie.api.client import Client
+from mollie.api.hedging import HedgePolicy
+
+API_KEY: str = "test_benchmarkbenchmarkbenchmark00"
+
+
+def measure(client: Client, requests: int) -> List[float]:
+    """Return the sorted latencies in milliseconds of payments.get()."""
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.payments.get("tr_7UhSN1zuXS")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * percent))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--response-delay", type=float, default=0.005)
+    parser.add_argument(
+        "--slow-ratio",
+        type=float,
+        default=0.03,
+        help="fraction of the responses that is slow",
+    )
+    parser.add_argument("--slow-delay", type=float, default=0.3)
+    args = parser.parse_args()
+
+    _, endpoint = start_mock_api(
+        response_delay=args.response_delay,
+        slow_ratio=args.slow_ratio,
+        slow_delay=args.slow_delay,
+    )
+
+    print(f"{'':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for policy in (None, HedgePolicy(percentile=95, max_ratio=0.1)):
+        client = Client(api_endpoint=endpoint)
+        client.set_api_key(API_KEY)
+        client.set_hedge_policy(policy)
+        latencies = measure(client, args.requests)
+        name = "hedged" if policy else "plain"
+        print(
+            f"{name:>10}{percentile(latencies, 0.5):>10.1f}"
+            f"{percentile(latencies, 0.99):>10.1f}{latencies[-1]:>10.1f}"
+        )
+        if policy:
+            print(f"{'':>10}{policy.stats}")
+
+
+if __name__ == "__main__":
+    main()
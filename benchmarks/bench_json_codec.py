@@ -0,0 +1,67 @@
+"""Decoding and encoding cost of the JSON codecs on realistic payloads.
+
+Decoding is compared with `Response.json()`, which the resources used
+before the codecs were introduced and which converts the body to text
+first. Codecs whose package is not installed are skipped.
+
+    python -m benchmarks.bench_json_codec
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+import requests
+
+from benchmarks.payloads import order, payments_page
+from mollie.api.codec import CODECS, JSONCodec
+
+
+def make_response(body: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    response.headers["Content-Type"] = "application/hal+json"
+    response.encoding = "utf-8"
+    return response
+
+
+def best_time(func: Callable[[], Any], number: int) -> float:
+    """Return the best time per call in milliseconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    codecs: Dict[str, JSONCodec] = {}
+    for name, codec_class in CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            print(f"skipping codec '{name}', it is not installed")
+
+    payloads = {
+        "payments list (250)": payments_page(250),
+        "order (50 lines)": order(50),
+    }
+    for label, body in payloads.items():
+        response = make_response(body)
+        size = len(response.content) / 1024
+        print(f"\n{label}, {size:.0f} KiB")
+        print(f"{'':<22}{'decode ms':>10}{'encode ms':>10}")
+        decode = best_time(response.json, args.number)
+        print(f"{'Response.json()':<22}{decode:>10.3f}{'':>10}")
+        for name, codec in codecs.items():
+            decode = best_time(
+                lambda: codec.loads(response.content), args.number
+            )
+            encode = best_time(lambda: codec.dumps(body), args.number)
+            print(f"{name:<22}{decode:>10.3f}{encode:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
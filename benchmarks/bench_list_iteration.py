@@ -0,0 +1,75 @@
+"""Time and memory of iterating, indexing and slicing 250-item pages.
+
+The embedded list of a page is looked up once. The 'lookup' rows look it
+up in the page on each access, as the lists did before.
+
+    python -m benchmarks.bench_list_iteration --passes 20
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from benchmarks.payloads import payments_page
+from mollie.api.client import Client
+from mollie.api.objects.list import PaginationList
+from mollie.api.objects.payment import Payment
+
+
+def measure(func: Callable[[], Any], passes: int) -> Tuple[float, int, int]:
+    """Return the milliseconds per pass, and the peak and the retained
+    allocated memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(passes):
+        func()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000 / passes, peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=250)
+    parser.add_argument("--passes", type=int, default=20)
+    args = parser.parse_args()
+
+    client = Client()
+    client.set_api_key("test_benchmarkbenchmarkbenchmark00")
+    data = payments_page(args.page_size)
+    size = args.page_size
+
+    first = PaginationList(data, client.payments, client)
+    ms, peak, retained = measure(lambda: [p.id for p in first], 1)
+    print(f"{'case':<20}{'ms per pass':>12}{'peak KiB':>12}{'kept KiB':>12}")
+    print(
+        f"{'first iteration':<20}{ms:>12.3f}{peak / 1024:>12.1f}"
+        f"{retained / 1024:>12.1f}"
+    )
+
+    page = PaginationList(data, client.payments, client)
+    list(page)
+    cases = {
+        "iterate": lambda: [payment.id for payment in page],
+        "iterate (lookup)": lambda: [
+            Payment(page["_embedded"]["payments"][index], client).id
+            for index in range(size)
+        ],
+        "index": lambda: [page[index].id for index in range(size)],
+        "slice [:50]": lambda: [payment.id for payment in page[:50]],
+        "slice (lookup)": lambda: [
+            Payment(item, client).id
+            for item in [page["_embedded"]["payments"][x] for x in range(50)]
+        ],
+    }
+    for name, func in cases.items():
+        ms, peak, retained = measure(func, args.passes)
+        print(
+            f"{name:<20}{ms:>12.3f}{peak / 1024:>12.1f}"
+            f"{retained / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Per-call overhead of building an API request in the Client.
+
+Compares the cached request template and the recursive querystring
+encoder with the previous implementation, which rebuilt the headers, the
+user agent and the URL prefix on every call.
+
+    python -m benchmarks.bench_request_building
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from mollie.api.client import Client
+
+PARAMS: Dict[str, Any] = {
+    "amount": {"value": "120.00", "currency": "EUR"},
+    "locale": "nl_NL",
+    "sequenceType": "oneoff",
+    "include": "issuers,pricing",
+}
+
+
+def previous_querystring(params: Dict[str, Any]) -> Optional[str]:
+    parts = []
+    for param, value in params.items():
+        if not isinstance(value, dict):
+            parts.append(urlencode({param: value}))
+        else:
+            for key, sub_value in value.items():
+                parts.append(urlencode({f"{param}[{key}]": sub_value}))
+    return "&".join(parts)
+
+
+def previous_request(
+    client: Client, path: str, params: Dict[str, Any]
+) -> Tuple[str, str, Dict[str, str]]:
+    if path.startswith(f"{client.api_endpoint}/{client.api_version}"):
+        url = path
+    else:
+        url = f"{client.api_endpoint}/{client.api_version}/{path}"
+    payload = json.dumps({})
+    querystring = previous_querystring(dict(params))
+    if querystring:
+        url += "?" + querystring
+    headers = {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {client.api_key}",
+        "Content-Type": "application/json",
+        "User-Agent": client.user_agent,
+        "X-Mollie-Client-Info": client.UNAME,
+    }
+    return url, payload, headers
+
+
+def current_request(
+    client: Client, path: str, params: Dict[str, Any]
+) -> Tuple[str, str, Dict[str, str]]:
+    url, payload, _ = client._format_request_data(path, {}, dict(params))
+    return url, payload, client._get_request_headers("")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    client = Client()
+    client.set_api_key("test_benchmarkbenchmarkbenchmark00")
+    assert previous_request(client, "methods", PARAMS) == current_request(
+        client, "methods", PARAMS
+    )
+
+    results = {}
+    for name, func in (
+        ("previous", previous_request),
+        ("current", current_request),
+    ):
+        timer = timeit.Timer(lambda: func(client, "methods", PARAMS))
+        best = min(timer.repeat(repeat=5, number=args.number))
+        results[name] = best / args.number * 1e6
+        print(f"{name:<10}{results[name]:>8.2f} us per call")
+    print(f"speedup   {results['previous'] / results['current']:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Cold-start time of the Mollie client, measured with python -X importtime.
+
+Every run starts a new interpreter that imports requests first, so the
+import time reported for mollie.api.client is the time spent by the
+client itself. The benchmark fails (exit status 1) when the median import
+or Client() time exceeds its threshold, or when a module that should be
+imported lazily was imported on start. The bytecode must be compiled
+(python -m compileall mollie), otherwise compiling is measured too.
+
+    python -m benchmarks.bench_startup --runs 10 --max-import-ms 25
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+LAZY_MODULES: Tuple[str, ...] = (
+    "requests_oauthlib",
+    "platform",
+    "mollie.api.resources.payments",
+    "mollie.api.methods_catalog",
+    "mollie.api.cache",
+    "mollie.api.circuit",
+    "mollie.api.hedging",
+    "mollie.api.ratelimit",
+    "mollie.api.retry",
+    "mollie.api.singleflight",
+)
+
+SCRIPT: str = """
+import sys, time
+import requests
+import mollie.api.client
+start = time.perf_counter()
+mollie.api.client.Client()
+print((time.perf_counter() - start) * 1000)
+print(",".join(name for name in {lazy!r} if name in sys.modules))
+"""
+
+
+def run() -> Tuple[float, float, List[str]]:
+    """Return the import and Client() milliseconds, and the lazy modules
+    that were imported, of a new interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            SCRIPT.format(lazy=LAZY_MODULES),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "mollie.api.client":
+            import_us = int(parts[1])
+    client_ms, imported = result.stdout.splitlines()
+    return import_us / 1000, float(client_ms), imported.split(",")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=25)
+    parser.add_argument("--max-client-ms", type=float, default=2)
+    args = parser.parse_args()
+
+    runs = [run() for _ in range(args.runs)]
+    import_ms = statistics.median(result[0] for result in runs)
+    client_ms = statistics.median(result[1] for result in runs)
+    imported = sorted({name for result in runs for name in result[2] if name})
+
+    print(f"{'measure':<22}{'median ms':>10}{'max ms':>10}")
+    print(
+        f"{'import client':<22}{import_ms:>10.1f}{args.max_import_ms:>10.1f}"
+    )
+    print(f"{'Client()':<22}{client_ms:>10.2f}{args.max_client_ms:>10.2f}")
+
+    failures = []
+    if import_ms > args.max_import_ms:
+        failures.append("the import of mollie.api.client is too slow")
+    if client_ms > args.max_client_ms:
+        failures.append("Client() is too slow")
+    if imported:
+        failures.append(f"imported on start: {', '.join(imported)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Peak memory of iterating a page of payments, with list() and stream().
+
+The response body is prepared before measuring, like bytes waiting on a
+socket, so the measured peak is what decoding the page costs.
+
+    python -m benchmarks.bench_streaming_memory
+"""
+import argparse
+import io
+import json
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import requests
+
+from benchmarks.payloads import payments_page
+from mollie.api.client import Client
+
+
+class CannedSession(requests.Session):
+    """Session that answers every request with the same response body."""
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+
+    def request(self, *args: Any, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/hal+json"
+        response.raw = io.BytesIO(self.body)
+        return response
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[50, 250, 1000, 4000]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'page size':>10}{'body KiB':>10}{'list() KiB':>12}{'stream() KiB':>14}"
+    )
+    for size in args.page_sizes:
+        body = json.dumps(payments_page(size)).encode("utf-8")
+        client = Client()
+        client.set_api_key("test_benchmarkbenchmarkbenchmark00")
+        client._client = CannedSession(body)
+
+        def consume_list() -> None:
+            for payment in client.payments.list(limit=size):
+                payment.amount
+
+        def consume_stream() -> None:
+            for payment in client.payments.stream(limit=size):
+                payment.amount
+
+        results: Dict[str, int] = {
+            "list": peak_memory(consume_list),
+            "stream": peak_memory(consume_stream),
+        }
+        print(
+            f"{size:>10}{len(body) / 1024:>10.0f}"
+            f"{results['list'] / 1024:>12.0f}{results['stream'] / 1024:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Per-call overhead of the transports of the Mollie client.
+
+Fetches a payment with the default requests transport and with the urllib3
+transport against the local mock API, and with the in-memory transport,
+which shows the time spent in the client itself.
+
+    python -m benchmarks.bench_transport --requests 2000
+"""
+import argparse
+import statistics
+import time
+from typing import List
+
+from benchmarks.mock_api import start_mock_api
+from benchmarks.payloads import payment
+from mollie.api.client import Client
+from mollie.api.transport import InMemoryTransport, Transport, Urllib3Transport
+
+API_KEY: str = "test_benchmarkbenchmarkbenchmark00"
+PAYMENT_ID: str = "tr_7UhSN1zuXS"
+
+
+def measure(client: Client, requests: int) -> List[float]:
+    """Return the latency in microseconds of each payments.get()."""
+    client.payments.get(PAYMENT_ID)  # warm up
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.payments.get(PAYMENT_ID)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    _, endpoint = start_mock_api()
+    in_memory = InMemoryTransport()
+    in_memory.add("GET", f"payments/{PAYMENT_ID}", payment(1))
+
+    transports = {
+        "requests": None,
+        "urllib3": Urllib3Transport.for_client,
+        "in-memory": lambda client: in_memory,
+    }
+    print(f"{'transport':<12}{'median us':>12}{'p95 us':>12}{'calls/s':>12}")
+    for label, factory in transports.items():
+        client = Client(api_endpoint=endpoint)
+        client.set_api_key(API_KEY)
+        transport = factory(client) if factory is not None else None
+        client.set_transport(transport)
+        latencies = measure(client, args.requests)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        median = statistics.median(latencies)
+        rate = 1_000_000 / statistics.mean(latencies)
+        print(f"{label:<12}{median:>12.1f}{p95:>12.1f}{rate:>12.0f}")
+        if isinstance(transport, Transport):
+            transport.close()
+
+
+if __name__ == "__main__":
+    main()
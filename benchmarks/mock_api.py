@@ -0,0 +1,100 @@
+"""A local stand-in for the Mollie API, used by the benchmarks.
+
+The server answers every request with a canned payment. To mimic the
+cost of a TLS handshake with the real API, every new connection can be
+delayed before it is served. To mimic tail latency, a fraction of the
+responses can be delayed further.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+PAYMENT: Dict[str, Any] = {
+    "resource": "payment",
+    "id": "tr_7UhSN1zuXS",
+    "mode": "test",
+    "createdAt": "2023-10-01T12:00:00+00:00",
+    "amount": {"value": "120.00", "currency": "EUR"},
+    "description": "My first API payment",
+    "method": None,
+    "metadata": {"my_webshop_id": "1696161600"},
+    "status": "open",
+    "isCancelable": False,
+    "expiresAt": "2023-10-01T12:15:00+00:00",
+    "profileId": "pfl_QkEhN94Ba",
+    "sequenceType": "oneoff",
+    "redirectUrl": "https://example.org/03-return-page?my_webshop_id=1",
+    "webhookUrl": "https://example.org/02-webhook-verification",
+    "_links": {
+        "self": {
+            "href": "https://api.mollie.com/v2/payments/tr_7UhSN1zuXS",
+            "type": "application/hal+json",
+        },
+        "checkout": {
+            "href": "https://www.mollie.com/checkout/select-method/7UhSN1zuXS",
+            "type": "text/html",
+        },
+    },
+}
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connect_delay: float = 0.0
+    response_delay: float = 0.0
+    slow_ratio: float = 0.0
+    slow_delay: float = 0.0
+
+    def setup(self) -> None:
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(self.response_delay)
+        if self.slow_ratio and random.random() < self.slow_ratio:
+            time.sleep(self.slow_delay)
+        body = json.dumps(PAYMENT).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/hal+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PATCH = _respond
+    do_DELETE = _respond
+
+
+def start_mock_api(
+    connect_delay: float = 0.0,
+    response_delay: float = 0.0,
+    slow_ratio: float = 0.0,
+    slow_delay: float = 0.0,
+) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the mock API in a background thread and return its URL."""
+    handler = type(
+        "ConfiguredMockApiHandler",
+        (MockApiHandler,),
+        {
+            "connect_delay": connect_delay,
+            "response_delay": response_delay,
+            "slow_ratio": slow_ratio,
+            "slow_delay": slow_delay,
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
@@ -0,0 +1,144 @@
+"""Realistic Mollie API response bodies for the benchmarks."""
+from typing import Any, Dict, List
+
+
+def payment(index: int) -> Dict[str, Any]:
+    payment_id = f"tr_{index:010d}"
+    return {
+        "resource": "payment",
+        "id": payment_id,
+        "mode": "live",
+        "createdAt": f"2023-10-{index % 28 + 1:02d}T12:{index % 60:02d}:00+00:00",
+        "amount": {
+            "value": f"{index % 500 + 1}.{index % 100:02d}",
+            "currency": "EUR",
+        },
+        "amountRefunded": {"value": "0.00", "currency": "EUR"},
+        "amountRemaining": {
+            "value": f"{index % 500 + 26}.{index % 100:02d}",
+            "currency": "EUR",
+        },
+        "settlementAmount": {
+            "value": f"{index % 500 + 1}.{index % 100:02d}",
+            "currency": "EUR",
+        },
+        "description": f"Order #{100000 + index}",
+        "method": "ideal",
+        "metadata": {"order_id": str(100000 + index), "channel": "webshop"},
+        "status": "paid",
+        "paidAt": f"2023-10-{index % 28 + 1:02d}T12:{index % 60:02d}:30+00:00",
+        "isCancelable": False,
+        "locale": "nl_NL",
+        "countryCode": "NL",
+        "profileId": "pfl_QkEhN94Ba",
+        "sequenceType": "oneoff",
+        "settlementId": "stl_jDk30akdN",
+        "redirectUrl": f"https://webshop.example.org/order/{100000 + index}/",
+        "webhookUrl": "https://webshop.example.org/payments/webhook/",
+        "details": {
+            "consumerName": "T. TEST",
+            "consumerAccount": "NL17RABO0213698412",
+            "consumerBic": "TESTNL99",
+        },
+        "_links": {
+            "self": {
+                "href": f"https://api.mollie.com/v2/payments/{payment_id}",
+                "type": "application/hal+json",
+            },
+            "dashboard": {
+                "href": f"https://www.mollie.com/dashboard/org_12345678/payments/{payment_id}",
+                "type": "text/html",
+            },
+            "settlement": {
+                "href": "https://api.mollie.com/v2/settlements/stl_jDk30akdN",
+                "type": "application/hal+json",
+            },
+        },
+    }
+
+
+def payments_page(count: int = 250, offset: int = 0) -> Dict[str, Any]:
+    """Return a page of the payments list, linking to a next page."""
+    payments: List[Dict[str, Any]] = [
+        payment(offset + index) for index in range(count)
+    ]
+    next_id = f"tr_{offset + count:010d}"
+    return {
+        "count": count,
+        "_embedded": {"payments": payments},
+        "_links": {
+            "documentation": {
+                "href": "https://docs.mollie.com/reference/v2/payments-api/list-payments",
+                "type": "text/html",
+            },
+            "self": {
+                "href": f"https://api.mollie.com/v2/payments?limit={count}",
+                "type": "application/hal+json",
+            },
+            "previous": None,
+            "next": {
+                "href": f"https://api.mollie.com/v2/payments?from={next_id}&limit={count}",
+                "type": "application/hal+json",
+            },
+        },
+    }
+
+
+def order(lines: int = 20) -> Dict[str, Any]:
+    return {
+        "resource": "order",
+        "id": "ord_kEn1PlbGa",
+        "profileId": "pfl_URR55HPMGx",
+        "method": "klarnapaylater",
+        "amount": {"value": f"{lines * 10}.00", "currency": "EUR"},
+        "status": "created",
+        "isCancelable": True,
+        "metadata": None,
+        "createdAt": "2023-10-01T12:00:00+00:00",
+        "mode": "live",
+        "locale": "nl_NL",
+        "billingAddress": {
+            "organizationName": "Mollie B.V.",
+            "streetAndNumber": "Keizersgracht 126",
+            "postalCode": "1015 CW",
+            "city": "Amsterdam",
+            "country": "nl",
+            "givenName": "Luke",
+            "familyName": "Skywalker",
+            "email": "luke@skywalker.com",
+        },
+        "orderNumber": "18475",
+        "redirectUrl": "https://example.org/redirect",
+        "lines": [
+            {
+                "resource": "orderline",
+                "id": f"odl_{index:06d}",
+                "orderId": "ord_kEn1PlbGa",
+                "name": f"Product {index}",
+                "sku": f"SKU-{index:05d}",
+                "type": "physical",
+                "status": "created",
+                "isCancelable": True,
+                "quantity": 1,
+                "quantityShipped": 0,
+                "quantityRefunded": 0,
+                "quantityCanceled": 0,
+                "unitPrice": {"value": "10.00", "currency": "EUR"},
+                "vatRate": "21.00",
+                "vatAmount": {"value": "1.74", "currency": "EUR"},
+                "totalAmount": {"value": "10.00", "currency": "EUR"},
+                "createdAt": "2023-10-01T12:00:00+00:00",
+            }
+            for index in range(lines)
+        ],
+        "_links": {
+            "self": {
+                "href": "https://api.mollie.com/v2/orders/ord_kEn1PlbGa",
+                "type": "application/hal+json",
+            },
+            "checkout": {
+                "href": "https://www.mollie.com/payscreen/order/checkout/kEn1PlbGa",
+                "type": "text/html",
+            },
+        },
+    }
@@ -0,0 +1,194 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from .client import Client, cancel_event
+from .objects.list import PaginationList
+from .resources.base import ResourceBase
+
+__all__ = [
+    "AsyncClient",
+    "AsyncPaginationList",
+    "AsyncResource",
+]
+
+
+class AsyncClient:
+    """Asyncio front-end for the Mollie API client.
+
+    All resources of the regular Client are available with the same
+    names, but their methods are coroutines:
+
+        client = AsyncClient()
+        client.set_api_key("test_...")
+        payment = await client.payments.get("tr_12345")
+        refunds = await client.wrap(payment.refunds).list()
+
+    The HTTP calls themselves are performed by a regular Client on a
+    bounded pool of worker threads, so connection pooling and retries
+    behave the same as in synchronous code. When the awaiting coroutine
+    is cancelled, a call that has not started yet is dropped and a call
+    that is in flight stops retrying and raises RequestCancelledError in
+    the worker.
+    """
+
+    DEFAULT_MAX_CONCURRENCY: int = 100
+
+    client: Client
+    _executor: ThreadPoolExecutor
+    _resources: Dict[str, "AsyncResource"]
+
+    def __init__(
+        self,
+        client: Optional[Client] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **client_kwargs: Any,
+    ) -> None:
+        """Initialize a new asynchronous Mollie API client.
+
+        :param client: An existing Client to perform the calls with. When
+            omitted, a new Client is created using client_kwargs.
+        :param max_concurrency: The maximum number of API calls that can be
+            in flight at the same time (integer).
+        """
+        self.client = client or Client(**client_kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="mollie"
+        )
+        self._resources = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Return resources as AsyncResource, anything else from the
+        Client."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if isinstance(attr, ResourceBase):
+            if name not in self._resources:
+                self._resources[name] = AsyncResource(self, attr)
+            return self._resources[name]
+        return attr
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for running calls to finish and release the worker
+        threads."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+
+    def wrap(self, resource: ResourceBase) -> "AsyncResource":
+        """Return an asynchronous handler for a (nested) resource.
+
+        Use this for resources that are reached through objects, such as
+        `payment.refunds` or `order.lines`.
+        """
+        return AsyncResource(self, resource)
+
+    async def run(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a synchronous call on a worker thread and await the result.
+
+        Paginated results are returned as an AsyncPaginationList.
+        """
+        result = await self._run(func, *args, **kwargs)
+        if isinstance(result, PaginationList):
+            return AsyncPaginationList(self, result)
+        return result
+
+    async def _run(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        event = threading.Event()
+        context = contextvars.copy_context()
+        context.run(cancel_event.set, event)
+        call = functools.partial(context.run, func, *args, **kwargs)
+        try:
+            return await loop.run_in_executor(self._executor, call)
+        except asyncio.CancelledError:
+            event.set()
+            raise
+
+
+class AsyncResource:
+    """Asynchronous wrapper around a resource handler.
+
+    Every method of the wrapped resource is exposed as a coroutine
+    function with the same signature.
+    """
+
+    _client: AsyncClient
+    _resource: ResourceBase
+
+    def __init__(self, client: AsyncClient, resource: ResourceBase) -> None:
+        self._client = client
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._resource, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self._client.run(attr, *args, **kwargs)
+
+        return method
+
+
+class AsyncPaginationList:
+    """Asynchronous counterpart of PaginationList.
+
+    Indexing and `len()` work on the page that was retrieved. Iterating
+    with `async for` yields the objects on this page, followed by those
+    on all next pages, which are retrieved when needed.
+    """
+
+    _client: AsyncClient
+    _page: PaginationList
+
+    def __init__(self, client: AsyncClient, page: PaginationList) -> None:
+        self._client = client
+        self._page = page
+
+    def __len__(self) -> int:
+        return len(self._page)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._page[key]
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        page: Optional[PaginationList] = self._page
+        while page is not None:
+            for item in page:
+                yield item
+            page = await self._client._run(page.get_next)
+
+    @property
+    def count(self) -> Optional[int]:
+        return self._page.count
+
+    def has_next(self) -> bool:
+        return self._page.has_next()
+
+    def has_previous(self) -> bool:
+        return self._page.has_previous()
+
+    async def get_next(self) -> Optional["AsyncPaginationList"]:
+        """Return the next set of objects in the paginated list."""
+        return await self._client.run(self._page.get_next)
+
+    async def get_previous(self) -> Optional["AsyncPaginationList"]:
+        """Return the previous set of objects in the paginated list."""
+        return await self._client.run(self._page.get_previous)
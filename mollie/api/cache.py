@@ -0,0 +1,253 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+__all__ = [
+    "ObjectCache",
+    "ResponseCache",
+]
+
+CacheKey = Tuple[str, ...]
+
+
+class CacheEntry:
+    __slots__ = ("body", "expires_at", "etag")
+
+    def __init__(self, body: bytes, expires_at: float, etag: str) -> None:
+        self.body = body
+        self.expires_at = expires_at
+        self.etag = etag
+
+
+class ResponseCache:
+    """Cache for the bodies of GET responses of near-static resources.
+
+    Only resources that define a CACHE_TTL are cached, such as methods,
+    profiles and permissions. The TTL per resource can be changed with
+    `ttl_policies`, keyed by the name of the resource class:
+
+        cache = ResponseCache(ttl_policies={"Methods": 60, "Profiles": 0})
+        client.set_response_cache(cache)
+
+    A TTL of 0 disables caching for the resource. The least recently used
+    entries are evicted when more than `maxsize` responses are cached.
+    When an expired entry has an ETag, the response is revalidated with
+    If-None-Match, and a 304 response renews the entry.
+
+    Subclass this to store the responses elsewhere: override get(), set()
+    and clear(). Entries are never changed in place, new and renewed
+    entries are both stored with set().
+    """
+
+    DEFAULT_MAXSIZE: int = 1024
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl_policies: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_policies = ttl_policies or {}
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "evictions": 0,
+        }
+
+    def get_ttl(self, resource_name: str, default: float) -> float:
+        """Return the TTL in seconds for responses of a resource."""
+        return self.ttl_policies.get(resource_name, default)
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Return the entry for a key, also when it has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[bytes], str]:
+        """Return the cached body when it is fresh.
+
+        Otherwise the body is None, and the ETag to revalidate an expired
+        entry is returned, if there is one.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None, ""
+        if entry.expires_at > self.clock():
+            self._count("hits")
+            return entry.body, ""
+        return None, entry.etag
+
+    def store(self, key: CacheKey, body: bytes, ttl: float, etag: str) -> None:
+        """Cache the body of a new response."""
+        self._count("misses")
+        self.set(key, CacheEntry(body, self.clock() + ttl, etag))
+
+    def renew(self, key: CacheKey, ttl: float) -> Optional[bytes]:
+        """Renew an entry that was revalidated, and return its body."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        self._count("revalidations")
+        # Store a new entry, so that subclasses see the renewal in set().
+        self.set(key, CacheEntry(entry.body, self.clock() + ttl, entry.etag))
+        return entry.body
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss, revalidation and eviction counters."""
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+
+class ObjectEntry:
+    __slots__ = ("data", "expires_at")
+
+    def __init__(
+        self, data: Dict[str, Any], expires_at: Optional[float]
+    ) -> None:
+        self.data = data
+        self.expires_at = expires_at
+
+
+class ObjectCache:
+    """Cache for payments and orders, with a TTL depending on their status.
+
+    Every resource has its own TTLs by status, see STATUS_TTLS of the
+    resources. Payments that are paid, failed, expired or canceled, and
+    orders that are completed, expired or canceled, are final and kept much
+    longer than objects that can still change status. The TTLs can be
+    changed by object type:
+
+        cache = ObjectCache(status_ttls={"Payment": {"paid": None, "open": 2}})
+        client.set_object_cache(cache)
+
+    A TTL of None keeps the object until it is invalidated or evicted, a TTL
+    of 0 disables caching for the status. Objects returned by create(),
+    update() and delete() are stored as well. When the webhook of an
+    object is received, retrieve it from the API with `cache=False`, which
+    stores the new status in the cache:
+
+        client.payments.get(payment_id, cache=False, coalesce=False)
+
+    Only calls to get() without parameters are cached, since parameters
+    such as `embed` change the response. The cache is kept in the memory of
+    one process: with several worker processes, a webhook only invalidates
+    the cache of the worker that received it.
+    """
+
+    DEFAULT_MAXSIZE: int = 10000
+    DEFAULT_TTL: float = 5
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        status_ttls: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param status_ttls: TTLs in seconds by status, by the name of the
+            object type, these extend the TTLs of the resources.
+        :param default_ttl: The TTL for a status without a TTL.
+        """
+        self.maxsize = maxsize
+        self.status_ttls = status_ttls or {}
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, ObjectEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "evictions": 0,
+        }
+
+    def get_ttl(
+        self,
+        object_name: str,
+        status: str,
+        default_ttls: Dict[str, Optional[float]],
+    ) -> Optional[float]:
+        """Return the TTL in seconds for an object with a status.
+
+        :param object_name: The name of the object type, such as 'Payment'.
+        :param default_ttls: The TTLs by status of the resource.
+        """
+        ttls = self.status_ttls.get(object_name, {})
+        if status in ttls:
+            return ttls[status]
+        return default_ttls.get(status, self.default_ttl)
+
+    def lookup(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return a copy of the object data when it is fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.expires_at is None or entry.expires_at > self.clock()
+            ):
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry.data)
+            self._stats["misses"] += 1
+            return None
+
+    def store(
+        self, key: CacheKey, data: Dict[str, Any], ttl: Optional[float]
+    ) -> None:
+        """Cache a copy of the object data, see get_ttl()."""
+        with self._lock:
+            if ttl == 0:
+                self._entries.pop(key, None)
+                return
+            expires_at = None if ttl is None else self.clock() + ttl
+            self._entries[key] = ObjectEntry(copy.deepcopy(data), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, resource_id: str) -> None:
+        """Drop an object, for example when its webhook is received."""
+        with self._lock:
+            for key in [
+                key for key in self._entries if key[-1] == resource_id
+            ]:
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss, invalidation and eviction counters."""
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
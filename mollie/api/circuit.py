@@ -0,0 +1,206 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .error import CircuitOpenError
+from .latency import endpoint_template
+
+__all__ = [
+    "CircuitBreaker",
+    "endpoint_family",
+]
+
+StateListener = Callable[[str, str, str], None]
+
+
+def endpoint_family(path: str) -> str:
+    """Return the part of the API a path or URL belongs to, such as
+    'payments', 'orders' or 'methods'."""
+    return endpoint_template(path).partition("/")[0]
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "requests",
+        "failures",
+        "window_start",
+        "opened_at",
+        "probes",
+    )
+
+    def __init__(self, now: float) -> None:
+        self.state = CircuitBreaker.CLOSED
+        self.requests = 0
+        self.failures = 0
+        self.window_start = now
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Stops sending requests to a part of the API that keeps failing.
+
+    Each part of the API (payments, orders, methods and so on) has its own
+    circuit. When at least `failure_ratio` of the requests in a window of
+    `window` seconds failed, with at least `min_requests` requests, the
+    circuit opens: requests fail immediately with a CircuitOpenError,
+    instead of waiting for a timeout. After `open_duration` seconds the
+    circuit is half-open and up to `probes` requests are sent. When they
+    succeed the circuit closes, otherwise it opens again.
+
+    Failed requests are connection errors, timeouts and responses with a
+    5xx status. Listeners are called on every state change with the part
+    of the API, the old state and the new state:
+
+        breaker = CircuitBreaker()
+        breaker.add_listener(
+            lambda family, old, new: logger.warning(f"{family}: {new}")
+        )
+        client.set_circuit_breaker(breaker)
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30,
+        open_duration: float = 15,
+        probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param failure_ratio: The fraction of failed requests that opens
+            the circuit (float).
+        :param min_requests: The minimum number of requests in a window
+            before the circuit can open (int).
+        :param window: The seconds over which requests are counted (float).
+        :param open_duration: The seconds that the circuit stays open
+            (float).
+        :param probes: The number of requests sent when half-open (int).
+        """
+        self.failure_ratio = failure_ratio
+        self.min_requests = min_requests
+        self.window = window
+        self.open_duration = open_duration
+        self.probes = probes
+        self.clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[StateListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Call listener(family, old_state, new_state) on state changes."""
+        self._listeners.append(listener)
+
+    def before_call(self, family: str) -> None:
+        """Raise CircuitOpenError when a request may not be sent.
+
+        Every call that is allowed must be followed by record_success(),
+        record_failure() or release().
+        """
+        changed = None
+        with self._lock:
+            now = self.clock()
+            circuit = self._get_circuit(family, now)
+            if circuit.state == self.OPEN:
+                remaining = circuit.opened_at + self.open_duration - now
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Requests to '{family}' are failing, not sending "
+                        f"the request for another {remaining:.1f} seconds.",
+                        family,
+                        remaining,
+                    )
+                changed = self._set_state(circuit, self.HALF_OPEN, now)
+            if circuit.state == self.HALF_OPEN:
+                if circuit.probes >= self.probes:
+                    raise CircuitOpenError(
+                        f"Requests to '{family}' are failing, waiting for "
+                        "the result of a probe request.",
+                        family,
+                        0.0,
+                    )
+                circuit.probes += 1
+        self._notify(family, changed)
+
+    def record_success(self, family: str) -> None:
+        self._record(family, failed=False)
+
+    def record_failure(self, family: str) -> None:
+        self._record(family, failed=True)
+
+    def release(self, family: str) -> None:
+        """End a call without a result, for example when it was
+        cancelled."""
+        with self._lock:
+            circuit = self._get_circuit(family, self.clock())
+            if circuit.state == self.HALF_OPEN and circuit.probes:
+                circuit.probes -= 1
+
+    def _record(self, family: str, failed: bool) -> None:
+        changed = None
+        with self._lock:
+            now = self.clock()
+            circuit = self._get_circuit(family, now)
+            if circuit.state == self.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                new_state = self.OPEN if failed else self.CLOSED
+                changed = self._set_state(circuit, new_state, now)
+            elif circuit.state == self.CLOSED:
+                if now - circuit.window_start >= self.window:
+                    circuit.requests = circuit.failures = 0
+                    circuit.window_start = now
+                circuit.requests += 1
+                circuit.failures += failed
+                if (
+                    circuit.requests >= self.min_requests
+                    and circuit.failures
+                    >= circuit.requests * self.failure_ratio
+                ):
+                    changed = self._set_state(circuit, self.OPEN, now)
+        self._notify(family, changed)
+
+    def _get_circuit(self, family: str, now: float) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(now)
+        return circuit
+
+    def _set_state(
+        self, circuit: _Circuit, state: str, now: float
+    ) -> Tuple[str, str]:
+        """Change the state, and return the old and the new state."""
+        old_state = circuit.state
+        circuit.state = state
+        circuit.requests = circuit.failures = circuit.probes = 0
+        circuit.window_start = now
+        if state == self.OPEN:
+            circuit.opened_at = now
+        return old_state, state
+
+    def _notify(self, family: str, changed: Optional[Tuple[str, str]]) -> None:
+        if changed is None:
+            return
+        old_state, new_state = changed
+        for listener in self._listeners:
+            listener(family, old_state, new_state)
+
+    def state(self, family: str) -> str:
+        """Return the state of the circuit for a part of the API."""
+        with self._lock:
+            circuit = self._circuits.get(family)
+            return circuit.state if circuit is not None else self.CLOSED
+
+    @property
+    def states(self) -> Dict[str, str]:
+        """Return the states of the circuits by part of the API."""
+        with self._lock:
+            return {
+                family: circuit.state
+                for family, circuit in self._circuits.items()
+            }
@@ -1,53 +1,248 @@
+import contextvars
 import json
-import platform
 import re
 import ssl
+import sys
+import threading
+import time
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-from urllib.parse import urlencode
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from urllib.parse import quote_plus
 
 import requests
-from requests_oauthlib import OAuth2Session
 from urllib3.util import Retry
 
-from .error import RequestError, RequestSetupError
-from .resources import (
-    Balances,
-    Chargebacks,
-    Clients,
-    Customers,
-    Invoices,
-    Methods,
-    Onboarding,
-    Orders,
-    Organizations,
-    PaymentLinks,
-    Payments,
-    Permissions,
-    Profiles,
-    Refunds,
-    Settlements,
-    Subscriptions,
+from .codec import JSONCodec, StdlibJSONCodec, get_json_codec
+from .error import (
+    DeadlineExceeded,
+    RequestCancelledError,
+    RequestError,
+    RequestSetupError,
 )
+from .latency import AdaptiveTimeouts, LatencyRecorder, endpoint_template
+from .pool import PoolStatsAdapter
+from .transport import RequestsTransport, Transport
 from .version import VERSION
 
+if TYPE_CHECKING:
+    from requests_oauthlib import OAuth2Session
+
+    from .cache import ObjectCache, ResponseCache
+    from .circuit import CircuitBreaker
+    from .hedging import HedgePolicy
+    from .methods_catalog import MethodsCatalog
+    from .ratelimit import RateLimiter
+    from .resources import (
+        Balances,
+        Chargebacks,
+        Clients,
+        Customers,
+        Invoices,
+        Methods,
+        Onboarding,
+        Orders,
+        Organizations,
+        PaymentLinks,
+        Payments,
+        Permissions,
+        Profiles,
+        Refunds,
+        Settlements,
+        Subscriptions,
+    )
+    from .retry import RetryPolicy
+    from .singleflight import SingleFlight
+
+ResourceT = TypeVar("ResourceT")
+
+# Set by the AsyncClient for the duration of a call. When the awaiting
+# coroutine is cancelled, the event is set and any pending attempt or
+# retry of the request is abandoned.
+cancel_event: ContextVar[Optional[threading.Event]] = ContextVar(
+    "mollie_cancel_event", default=None
+)
+
+
+# Set by Client.deadline(): the time.monotonic() by which the current
+# operation must be completed.
+deadline_at: ContextVar[Optional[float]] = ContextVar(
+    "mollie_deadline_at", default=None
+)
+
+
+# Set by Client.coalescing(): whether identical concurrent GET requests may
+# share one HTTP call, when request coalescing is enabled.
+coalesce_requests: ContextVar[bool] = ContextVar(
+    "mollie_coalesce_requests", default=True
+)
+
+
+def raise_if_cancelled() -> None:
+    """Raise RequestCancelledError when the current call was cancelled."""
+    event = cancel_event.get()
+    if event is not None and event.is_set():
+        raise RequestCancelledError("The request was cancelled.")
+
+
+def get_remaining_time() -> Optional[float]:
+    """Return the seconds until the deadline of the current operation, or
+    None when it has no deadline."""
+    deadline = deadline_at.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def raise_if_stopped() -> None:
+    """Raise RequestCancelledError when the current call was cancelled, or
+    DeadlineExceeded when its deadline has passed."""
+    raise_if_cancelled()
+    remaining = get_remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("The deadline of the operation has passed.")
+
+
+def sleep_unless_cancelled(seconds: float) -> None:
+    """Sleep, but raise RequestCancelledError as soon as the current call
+    is cancelled.
+
+    DeadlineExceeded is raised right away when the deadline of the current
+    operation would pass during the sleep.
+    """
+    remaining = get_remaining_time()
+    if remaining is not None and remaining < seconds:
+        raise DeadlineExceeded(
+            f"The deadline of the operation passes in {max(remaining, 0):.2f} "
+            f"seconds, before the next attempt in {seconds:.2f} seconds."
+        )
+    event = cancel_event.get()
+    if event is None:
+        time.sleep(seconds)
+    elif event.wait(seconds):
+        raise RequestCancelledError("The request was cancelled.")
+
+
+class CancellableRetry(Retry):
+    """Retry configuration that stops retrying once the call is cancelled,
+    or its deadline has passed."""
+
+    def increment(self, *args: Any, **kwargs: Any) -> Retry:
+        raise_if_stopped()
+        return super().increment(*args, **kwargs)
+
+    def sleep(self, response: Any = None) -> None:
+        """Sleep before the next attempt, but no longer than the deadline
+        allows, and stop sleeping when the call is cancelled."""
+        seconds = None
+        if self.respect_retry_after_header and response:
+            seconds = self.get_retry_after(response)
+        if seconds is None:
+            seconds = self.get_backoff_time()
+        if seconds > 0:
+            sleep_unless_cancelled(seconds)
+
+
+def _close_response(future: "Future[requests.Response]") -> None:
+    """Close the response of a request that lost the race."""
+    if future.exception() is None:
+        future.result().close()
+
+
+class LazyResource(Generic[ResourceT]):
+    """A resource handler of the Client, created on first use.
+
+    Only the handlers that are used are imported and created, which keeps
+    the start of short-lived processes fast.
+    """
+
+    name: str
+
+    def __init__(self, class_name: str) -> None:
+        self.class_name = class_name
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(
+        self, client: None, owner: Type[Any]
+    ) -> "LazyResource[ResourceT]":
+        ...
+
+    @overload
+    def __get__(self, client: "Client", owner: Type[Any]) -> ResourceT:
+        ...
+
+    def __get__(self, client: Optional["Client"], owner: Type[Any]) -> Any:
+        if client is None:
+            return self
+        from . import resources
+
+        resource = getattr(resources, self.class_name)(client)
+        # Stored on the client, later lookups do not call the descriptor.
+        return client.__dict__.setdefault(self.name, resource)
+
+
+class _Uname:
+    """The platform of the client, determined on first use because
+    platform.uname() is slow on some systems."""
+
+    value: Optional[str] = None
+
+    def __get__(self, client: Optional["Client"], owner: Type[Any]) -> str:
+        if self.value is None:
+            import platform
+
+            self.value = " ".join(platform.uname())
+        return self.value
+
 
 class Client:
     CLIENT_VERSION: str = VERSION
     API_ENDPOINT: str = "https://api.mollie.com"
     API_VERSION: str = "v2"
-    UNAME: str = " ".join(platform.uname())
+    UNAME: str = _Uname()  # type: ignore[assignment]
 
     OAUTH_AUTHORIZATION_URL: str = "https://www.mollie.com/oauth2/authorize"
     OAUTH_AUTO_REFRESH_URL: str = API_ENDPOINT + "/oauth2/tokens"
     OAUTH_TOKEN_URL: str = API_ENDPOINT + "/oauth2/tokens"
 
+    # Seconds between the checks for cancellation while waiting for hedged
+    # requests.
+    HEDGE_POLL_INTERVAL: float = 0.05
+
     _client: requests.Session
-    _oauth_client: OAuth2Session
+    _oauth_client: "OAuth2Session"
     api_endpoint: str
     api_version: str
     timeout: Union[int, Tuple[int, int]]
     retry: int
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    _session_lock: threading.Lock
     api_key: str = ""
     access_token: str = ""
     user_agent_components: Dict[str, str]
@@ -55,6 +250,46 @@ class Client:
     client_secret: str = ""
     set_token: Callable[[dict], None]
     testmode: bool = False
+    json_codec: JSONCodec
+    response_cache: Optional["ResponseCache"] = None
+    methods_catalog: Optional["MethodsCatalog"] = None
+    object_cache: Optional["ObjectCache"] = None
+    single_flight: Optional["SingleFlight"] = None
+    rate_limiter: Optional["RateLimiter"] = None
+    retry_policy: Optional["RetryPolicy"] = None
+    hedge_policy: Optional["HedgePolicy"] = None
+    circuit_breaker: Optional["CircuitBreaker"] = None
+    adaptive_timeouts: Optional[AdaptiveTimeouts] = None
+    latency: LatencyRecorder
+    transport: Optional[Transport] = None
+    _default_transport: Optional[RequestsTransport] = None
+    _hedge_executor: Optional[ThreadPoolExecutor] = None
+    _hedge_workers: threading.BoundedSemaphore
+    # URL prefix and headers shared by all requests, see
+    # _get_request_template().
+    _request_template: Optional[Tuple[str, Dict[str, str]]] = None
+
+    # endpoint resources
+    payments: LazyResource["Payments"] = LazyResource("Payments")
+    payment_links: LazyResource["PaymentLinks"] = LazyResource("PaymentLinks")
+    profiles: LazyResource["Profiles"] = LazyResource("Profiles")
+    methods: LazyResource["Methods"] = LazyResource("Methods")
+    refunds: LazyResource["Refunds"] = LazyResource("Refunds")
+    chargebacks: LazyResource["Chargebacks"] = LazyResource("Chargebacks")
+    clients: LazyResource["Clients"] = LazyResource("Clients")
+    customers: LazyResource["Customers"] = LazyResource("Customers")
+    orders: LazyResource["Orders"] = LazyResource("Orders")
+    organizations: LazyResource["Organizations"] = LazyResource(
+        "Organizations"
+    )
+    invoices: LazyResource["Invoices"] = LazyResource("Invoices")
+    permissions: LazyResource["Permissions"] = LazyResource("Permissions")
+    onboarding: LazyResource["Onboarding"] = LazyResource("Onboarding")
+    settlements: LazyResource["Settlements"] = LazyResource("Settlements")
+    subscriptions: LazyResource["Subscriptions"] = LazyResource(
+        "Subscriptions"
+    )
+    balances: LazyResource["Balances"] = LazyResource("Balances")
 
     @staticmethod
     def validate_api_endpoint(api_endpoint: str) -> str:
@@ -83,18 +318,38 @@ class Client:
         api_endpoint: str = "",
         timeout: Union[int, Tuple[int, int]] = (2, 10),
         retry: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        thread_safe: bool = False,
     ) -> None:
         """Initialize a new Mollie API client.
 
+        A client can be shared between threads, for example by all request
+        handlers of a threaded WSGI server. Configure the client (API key,
+        access token, testmode, user agent) before sharing it: only
+        performing API calls is thread-safe. Size the connection pool to
+        the number of threads that use the client, the statistics in
+        `pool_stats` show whether requests had to wait for a connection.
+
         :param api_endpoint: The API endpoint to communicate to, this
             default to the production environment (string)
         :param timeout: The timeouts used for the HTTP requests to the
             API, the default specifies both connect and read timeout
             (integer or tuple)
         :param retry: The number of retries that the client should
-            perform in case of failed requests. Note that only connect
-            errors trigger a retry, errors responses from the API don't
-            (integer).
+            perform in case of connect errors (integer). Throttling and
+            gateway errors from the API are only retried once a retry
+            policy is set, see set_retry_policy().
+        :param pool_connections: The number of connection pools to cache,
+            one pool is used per host (integer).
+        :param pool_maxsize: The maximum number of connections to keep open
+            in a pool (integer).
+        :param pool_block: Whether a request should wait for a free
+            connection when all connections in the pool are in use, instead
+            of opening a connection that is discarded afterwards (boolean).
+        :param thread_safe: Create the HTTP session while initializing the
+            client, instead of on the first API call (boolean).
         """
         self.api_endpoint = self.validate_api_endpoint(
             api_endpoint or self.API_ENDPOINT
@@ -102,41 +357,35 @@ class Client:
         self.api_version = self.API_VERSION
         self.timeout = timeout
         self.retry = retry
-
-        # add endpoint resources
-        self.payments = Payments(self)
-        self.payment_links = PaymentLinks(self)
-        self.profiles = Profiles(self)
-        self.methods = Methods(self)
-        self.refunds = Refunds(self)
-        self.chargebacks = Chargebacks(self)
-        self.clients = Clients(self)
-        self.customers = Customers(self)
-        self.orders = Orders(self)
-        self.organizations = Organizations(self)
-        self.invoices = Invoices(self)
-        self.permissions = Permissions(self)
-        self.onboarding = Onboarding(self)
-        self.settlements = Settlements(self)
-        self.subscriptions = Subscriptions(self)
-        self.balances = Balances(self)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._session_lock = threading.Lock()
+        self.json_codec = StdlibJSONCodec()
+        self.latency = LatencyRecorder()
 
         # compose base user agent string
         self.user_agent_components = OrderedDict()
         self.set_user_agent_component("Mollie", self.CLIENT_VERSION)
-        self.set_user_agent_component("Python", platform.python_version())
+        self.set_user_agent_component("Python", sys.version.split()[0])
         self.set_user_agent_component(
             "OpenSSL", ssl.OPENSSL_VERSION.split(" ")[1], sanitize=False
         )  # keep legacy formatting of this component
 
+        if thread_safe:
+            self._get_session()
+
     def set_api_endpoint(self, api_endpoint: str) -> None:
         self.api_endpoint = self.validate_api_endpoint(api_endpoint)
+        self._request_template = None
 
     def set_api_key(self, api_key: str) -> None:
         self.api_key = self.validate_api_key(api_key)
+        self._request_template = None
 
     def set_access_token(self, access_token: str) -> None:
         self.api_key = self.validate_access_token(access_token)
+        self._request_template = None
 
     def set_timeout(self, timeout: Union[int, Tuple[int, int]]) -> None:
         self.timeout = timeout
@@ -144,6 +393,116 @@ class Client:
     def set_testmode(self, testmode: bool) -> None:
         self.testmode = testmode
 
+    def set_json_codec(self, codec: Union[str, JSONCodec]) -> None:
+        """Set the codec that encodes payloads and decodes API responses.
+
+        :param codec: A JSONCodec instance, or the name of a codec: 'json'
+            (the default), 'orjson', 'ujson' or 'auto' for the fastest
+            installed codec.
+        """
+        if isinstance(codec, str):
+            codec = get_json_codec(codec)
+        self.json_codec = codec
+
+    def set_response_cache(self, cache: Optional["ResponseCache"]) -> None:
+        """Cache responses of near-static resources, see ResponseCache.
+
+        :param cache: The cache to use, or None to disable caching.
+        """
+        self.response_cache = cache
+
+    def set_object_cache(self, cache: Optional["ObjectCache"]) -> None:
+        """Cache payments and orders by their status, see ObjectCache.
+
+        :param cache: The cache to use, or None to disable caching.
+        """
+        self.object_cache = cache
+
+    def set_methods_catalog(self, catalog: Optional["MethodsCatalog"]) -> None:
+        """Register the catalog that is invalidated on method changes.
+
+        :param catalog: The catalog to invalidate when methods or issuers
+            are enabled or disabled through ProfileMethods, or None.
+        """
+        self.methods_catalog = catalog
+
+    def set_request_coalescing(self, enabled: bool) -> None:
+        """Share one HTTP call between identical concurrent GET requests.
+
+        Threads that request the same path with the same parameters and
+        credentials while such a request is in flight receive its response,
+        see SingleFlight. The number of calls saved is in
+        client.single_flight.stats.
+
+        A call that must not receive the response of a request that was
+        already in flight, such as the retrieval of a payment in its
+        webhook, can opt out with the `coalesce` parameter:
+        client.payments.get(payment_id, coalesce=False).
+        """
+        if not enabled:
+            self.single_flight = None
+            return
+        from .singleflight import SingleFlight
+
+        self.single_flight = SingleFlight()
+
+    def set_rate_limiter(self, limiter: Optional["RateLimiter"]) -> None:
+        """Limit the rate of API calls, see RateLimiter.
+
+        :param limiter: The limiter to use, or None to disable limiting.
+        """
+        self.rate_limiter = limiter
+
+    def set_retry_policy(self, policy: Optional["RetryPolicy"]) -> None:
+        """Set the policy for retrying failed API calls, see RetryPolicy.
+
+        :param policy: The policy to use, or None to disable retries.
+        """
+        self.retry_policy = policy
+
+    def set_hedge_policy(self, policy: Optional["HedgePolicy"]) -> None:
+        """Send slow GET requests again, see HedgePolicy.
+
+        :param policy: The policy to use, or None to disable hedging.
+        """
+        self.hedge_policy = policy
+
+    def set_circuit_breaker(self, breaker: Optional["CircuitBreaker"]) -> None:
+        """Fail fast on parts of the API that keep failing, see
+        CircuitBreaker.
+
+        :param breaker: The circuit breaker to use, or None to disable it.
+        """
+        self.circuit_breaker = breaker
+
+    def set_adaptive_timeouts(
+        self, timeouts: Optional[AdaptiveTimeouts]
+    ) -> None:
+        """Derive the read timeout per endpoint from the observed latency,
+        see AdaptiveTimeouts.
+
+        :param timeouts: The policy to use, or None to always use the
+            timeout of the client.
+        """
+        self.adaptive_timeouts = timeouts
+
+    def set_transport(self, transport: Optional[Transport]) -> None:
+        """Send the API key requests with another transport, such as
+        Urllib3Transport.for_client(client) or InMemoryTransport. OAuth
+        requests always use the OAuth session.
+
+        :param transport: The transport to use, or None to use the requests
+            session of the client.
+        """
+        self.transport = transport
+
+    @property
+    def learned_timeouts(self) -> Dict[str, float]:
+        """Return the read timeouts derived per endpoint template."""
+        if self.adaptive_timeouts is None:
+            return {}
+        return self.adaptive_timeouts.get_read_timeouts(self.latency)
+
     def set_user_agent_component(
         self, key: str, value: str, sanitize: bool = True
     ) -> None:
@@ -162,6 +521,7 @@ class Client:
             if re.search(r"\s+", value):
                 value = "_".join(re.findall(r"\S+", value))
         self.user_agent_components[key] = value
+        self._request_template = None
 
     @property
     def user_agent(self) -> str:
@@ -169,22 +529,66 @@ class Client:
         components = ["/".join(x) for x in self.user_agent_components.items()]
         return " ".join(components)
 
+    def _get_request_template(self) -> Tuple[str, Dict[str, str]]:
+        """Return the URL prefix and the headers for every API request.
+
+        The template is built once and rebuilt after the endpoint, the
+        credentials or the user agent have been changed using the setters.
+        """
+        template = self._request_template
+        if template is None:
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": self.user_agent,
+                "X-Mollie-Client-Info": self.UNAME,
+            }
+            if not hasattr(self, "_oauth_client"):
+                # The OAuth session adds its own authorization header.
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            template = (f"{self.api_endpoint}/{self.api_version}", headers)
+            self._request_template = template
+        return template
+
+    def _get_request_headers(
+        self,
+        idempotency_key: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """Return the headers of a request, as a new dict: the transports
+        and the OAuth session may change it."""
+        _, template = self._get_request_template()
+        headers = dict(template)
+        if extra_headers:
+            headers.update(extra_headers)
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        return headers
+
+    def _get_credential_key(self) -> str:
+        """Return a key that identifies the credentials used for requests."""
+        oauth_client = getattr(self, "_oauth_client", None)
+        if oauth_client is not None:
+            return f"oauth:{oauth_client.access_token or id(oauth_client)}"
+        return self.api_key
+
     def _format_request_data(
         self,
         path: str,
         data: Optional[Dict[str, Any]],
         params: Optional[Dict[str, Any]],
-    ) -> Tuple[str, str, Optional[Dict[str, Any]]]:
-        if path.startswith(f"{self.api_endpoint}/{self.api_version}"):
+    ) -> Tuple[str, Union[str, bytes], Optional[Dict[str, Any]]]:
+        url_prefix, _ = self._get_request_template()
+        if path.startswith(url_prefix):
             url = path
         else:
-            url = f"{self.api_endpoint}/{self.api_version}/{path}"
+            url = f"{url_prefix}/{path}"
 
-        payload = ""
+        payload: Union[str, bytes] = ""
         if data is not None:
             try:
-                payload = json.dumps(data)
-            except TypeError as err:
+                payload = self.json_codec.dumps(data)
+            except (TypeError, ValueError) as err:
                 raise RequestSetupError(
                     f"Error encoding data into JSON: {err}."
                 )
@@ -208,6 +612,73 @@ class Client:
 
         return url, payload, params
 
+    def _get_timeout(self, path: str) -> Union[float, Tuple[float, float]]:
+        """Return the timeout of a request, with the read timeout learned for
+        its endpoint and shortened to the deadline of the current
+        operation."""
+        timeout = self.timeout
+        if self.adaptive_timeouts is not None:
+            read_timeout = self.adaptive_timeouts.get_read_timeout(
+                self.latency, endpoint_template(path)
+            )
+            if read_timeout is not None:
+                connect = timeout[0] if isinstance(timeout, tuple) else timeout
+                timeout = (connect, read_timeout)
+
+        remaining = get_remaining_time()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceeded("The deadline of the operation has passed.")
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return min(connect, remaining), min(read, remaining)
+        return min(timeout, remaining)
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """Limit the time spent on all API calls within the block.
+
+            with client.deadline(1.5):
+                payment = client.payments.get(payment_id)
+                order = payment.get_order()
+
+        Every attempt, wait for a retry or the rate limiter, next page and
+        related object takes from the same budget. Requests are sent with
+        their timeouts shortened to the time that is left, and
+        DeadlineExceeded is raised once it has run out. A nested deadline
+        can only shorten the deadline of the block around it. Threads
+        started by the client for the block, such as those of get_many()
+        and iterate_all(), share its deadline.
+
+        A single call can also be given a deadline, with the `deadline`
+        parameter: client.payments.get(payment_id, deadline=0.5).
+
+        :param seconds: The time available for the block (float).
+        """
+        deadline = time.monotonic() + seconds
+        current = deadline_at.get()
+        if current is not None:
+            deadline = min(deadline, current)
+        token = deadline_at.set(deadline)
+        try:
+            yield
+        finally:
+            deadline_at.reset(token)
+
+    @contextmanager
+    def coalescing(self, enabled: bool) -> Iterator[None]:
+        """Enable or disable request coalescing for the API calls within
+        the block, see set_request_coalescing().
+
+        :param enabled: Whether the calls may share an HTTP call (bool).
+        """
+        token = coalesce_requests.set(enabled)
+        try:
+            yield
+        finally:
+            coalesce_requests.reset(token)
+
     def _perform_http_call_apikey(
         self,
         http_method: str,
@@ -215,40 +686,29 @@ class Client:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         if not self.api_key:
             raise RequestSetupError(
                 "You have not set an API key. Please use set_api_key() to set the API key."
             )
 
-        if not hasattr(self, "_client"):
-            self._client = requests.Session()
-            self._client.verify = True
-            self._setup_retry()
-
-        url, payload, params = self._format_request_data(path, data, params)
+        transport = self._get_transport()
+        url, payload, _ = self._format_request_data(path, data, params)
+        headers = self._get_request_headers(idempotency_key, headers)
         try:
-            headers = {
-                "Accept": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": self.user_agent,
-                "X-Mollie-Client-Info": self.UNAME,
-            }
-
-            if idempotency_key:
-                headers.update({"Idempotency-Key": idempotency_key})
-
-            response = self._client.request(
-                method=http_method,
-                url=url,
+            response = transport.request(
+                http_method,
+                url,
                 headers=headers,
-                params=params,
                 data=payload,
-                timeout=self.timeout,
+                timeout=self._get_timeout(path),
+                stream=stream,
             )
-        except requests.exceptions.RequestException as err:
-            raise RequestError(f"Unable to communicate with Mollie: {err}")
+        except RequestError:
+            raise_if_stopped()
+            raise
 
         return response
 
@@ -259,28 +719,23 @@ class Client:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         url, payload, params = self._format_request_data(path, data, params)
+        headers = self._get_request_headers(idempotency_key, headers)
         try:
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": self.user_agent,
-                "X-Mollie-Client-Info": self.UNAME,
-            }
-
-            if idempotency_key:
-                headers.update({"Idempotency-Key": idempotency_key})
-
             response = self._oauth_client.request(
                 method=http_method,
                 url=url,
                 headers=headers,
                 params=params,
                 data=payload,
-                timeout=self.timeout,
+                timeout=self._get_timeout(path),
+                stream=stream,
             )
         except requests.exceptions.RequestException as err:
+            raise_if_stopped()
             raise RequestError(f"Unable to communicate with Mollie: {err}")
         return response
 
@@ -291,23 +746,361 @@ class Client:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        if hasattr(self, "_oauth_client"):
-            return self._perform_http_call_oauth(
+        raise_if_stopped()
+        if (
+            self.single_flight is None
+            or not coalesce_requests.get()
+            or http_method != "GET"
+            or stream
+            or headers
+        ):
+            return self._perform_http_call_attempts(
+                http_method,
+                path,
+                data=data,
+                params=params,
+                idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
+            )
+
+        key = (
+            self._get_credential_key(),
+            str(self.testmode),
+            path,
+            json.dumps(params or {}, sort_keys=True, default=str),
+        )
+        performed = False
+
+        def perform() -> requests.Response:
+            nonlocal performed
+            performed = True
+            return self._perform_http_call_attempts(
+                http_method, path, params=params
+            )
+
+        while True:
+            try:
+                return self.single_flight.do(
+                    key, perform, check=raise_if_stopped
+                )
+            except (RequestCancelledError, DeadlineExceeded):
+                if performed:
+                    raise
+                raise_if_stopped()
+                # The thread that performed the call was cancelled, or ran
+                # out of its deadline, not this one.
+
+    def _perform_http_call_attempts(
+        self,
+        http_method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Perform an HTTP call, and retry it according to the retry
+        policy."""
+        policy = self.retry_policy
+        if policy is None or not policy.is_retryable(
+            http_method, idempotency_key
+        ):
+            return self._perform_guarded_call(
+                http_method,
+                path,
+                data=data,
+                params=params,
+                idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
+            )
+
+        policy.budget.deposit()
+        attempt = 1
+        delay = 0.0
+        while True:
+            response = self._perform_guarded_call(
+                http_method,
+                path,
+                data=data,
+                params=params,
+                idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
+            )
+            next_delay = policy.get_delay(
+                attempt, response.status_code, response.headers, delay
+            )
+            if next_delay is None:
+                return response
+            response.close()
+            sleep_unless_cancelled(next_delay)
+            attempt += 1
+            delay = next_delay
+
+    def _perform_guarded_call(
+        self,
+        http_method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Perform an HTTP call, unless the circuit breaker is open for
+        this part of the API."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._dispatch_http_call(
                 http_method,
                 path,
                 data=data,
                 params=params,
                 idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
             )
+
+        from .circuit import endpoint_family
+
+        family = endpoint_family(path)
+        breaker.before_call(family)
+        try:
+            response = self._dispatch_http_call(
+                http_method,
+                path,
+                data=data,
+                params=params,
+                idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
+            )
+        except (DeadlineExceeded, RequestCancelledError, RequestSetupError):
+            # The request was not given a fair chance.
+            breaker.release(family)
+            raise
+        except RequestError:
+            breaker.record_failure(family)
+            raise
+        except BaseException:
+            breaker.release(family)
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure(family)
         else:
-            return self._perform_http_call_apikey(
+            breaker.record_success(family)
+        return response
+
+    def _dispatch_http_call(
+        self,
+        http_method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        endpoint = endpoint_template(path)
+        if (
+            self.hedge_policy is not None
+            and http_method == "GET"
+            and not stream
+        ):
+            delay = self.hedge_policy.get_delay(self.latency, endpoint)
+            if delay is not None:
+                return self._perform_hedged_call(
+                    self.hedge_policy, delay, endpoint, path, params, headers
+                )
+        return self._send_http_call(
+            endpoint,
+            http_method,
+            path,
+            data=data,
+            params=params,
+            idempotency_key=idempotency_key,
+            stream=stream,
+            headers=headers,
+        )
+
+    def _perform_hedged_call(
+        self,
+        policy: "HedgePolicy",
+        delay: float,
+        endpoint: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        """Perform a GET request, and send it again when it is slower than
+        the delay. The first response is returned.
+
+        The requests run on the hedge workers, so that a faster extra
+        request can be returned while the first one still waits. When no
+        worker is free, the request is performed on the calling thread
+        without hedges, instead of waiting in the queue of the workers.
+        """
+        executor, workers = self._get_hedge_executor()
+
+        def submit(
+            sent_at: List[float],
+        ) -> "Optional[Future[requests.Response]]":
+            if not workers.acquire(blocking=False):
+                return None
+
+            def run() -> requests.Response:
+                try:
+                    return self._send_http_call(
+                        endpoint,
+                        "GET",
+                        path,
+                        params=params,
+                        headers=headers,
+                        on_send=lambda: sent_at.append(time.monotonic()),
+                    )
+                finally:
+                    workers.release()
+
+            return executor.submit(contextvars.copy_context().run, run)
+
+        # The time at which the last request was sent, the hedge timer
+        # starts then and not while the request waits for the rate limiter.
+        sent_at: List[float] = []
+        first = submit(sent_at)
+        if first is None:
+            return self._send_http_call(
+                endpoint, "GET", path, params=params, headers=headers
+            )
+        pending = {first}
+        hedges = 0
+        errors: List[BaseException] = []
+        try:
+            while pending:
+                raise_if_stopped()
+                timeout = self.HEDGE_POLL_INTERVAL
+                if hedges < policy.max_hedges and sent_at:
+                    hedge_at = sent_at[0] + delay
+                    timeout = min(timeout, hedge_at - time.monotonic())
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, timeout),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        errors.append(error)
+                        continue
+                    if future is not first:
+                        policy.record_win()
+                    for other in pending:
+                        other.add_done_callback(_close_response)
+                    return future.result()
+
+                if (
+                    pending
+                    and hedges < policy.max_hedges
+                    and sent_at
+                    and time.monotonic() >= sent_at[0] + delay
+                ):
+                    if not policy.allow_hedge():
+                        hedges = policy.max_hedges
+                        continue
+                    sent_at = []
+                    hedge = submit(sent_at)
+                    if hedge is None:
+                        # All workers are busy, an extra request would
+                        # only wait behind the others.
+                        hedges = policy.max_hedges
+                        continue
+                    hedges += 1
+                    pending.add(hedge)
+        except BaseException:
+            # Cancelled or past the deadline, the requests that are still
+            # running are closed when they complete.
+            for future in pending:
+                future.add_done_callback(_close_response)
+            raise
+        raise errors[0]
+
+    def _get_hedge_executor(
+        self,
+    ) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        """Return the hedge workers, and a semaphore with a slot for each
+        idle worker."""
+        if self._hedge_executor is None:
+            with self._session_lock:
+                if self._hedge_executor is None:
+                    max_workers = 2 * self.pool_maxsize
+                    self._hedge_workers = threading.BoundedSemaphore(
+                        max_workers
+                    )
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix="mollie-hedge",
+                    )
+        return self._hedge_executor, self._hedge_workers
+
+    def _send_http_call(
+        self,
+        endpoint: str,
+        http_method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: str = "",
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        on_send: Optional[Callable[[], None]] = None,
+    ) -> requests.Response:
+        """Send one HTTP request, and record its latency.
+
+        :param on_send: Called when the request is sent, after waiting for
+            the rate limiter.
+        """
+        if self.rate_limiter is not None:
+            credential = self._get_credential_key()
+            delay = self.rate_limiter.reserve(credential, http_method)
+            if delay > 0:
+                try:
+                    sleep_unless_cancelled(delay)
+                except (DeadlineExceeded, RequestCancelledError):
+                    # The call is not performed, so it must not use up the
+                    # budget of later calls.
+                    self.rate_limiter.release(credential, http_method)
+                    raise
+        if hasattr(self, "_oauth_client"):
+            perform = self._perform_http_call_oauth
+        else:
+            perform = self._perform_http_call_apikey
+        if on_send is not None:
+            on_send()
+        started = time.monotonic()
+        try:
+            response = perform(
                 http_method,
                 path,
                 data=data,
                 params=params,
                 idempotency_key=idempotency_key,
+                stream=stream,
+                headers=headers,
             )
+        except (DeadlineExceeded, RequestSetupError):
+            raise
+        except RequestError:
+            # Record failed requests too, so that timeouts raise the learned
+            # timeout instead of hiding the slowest responses.
+            self.latency.record(endpoint, time.monotonic() - started)
+            raise
+        self.latency.record(endpoint, time.monotonic() - started)
+        return response
 
     def setup_oauth(
         self,
@@ -327,6 +1120,10 @@ class Client:
         :param set_token: Callable that stores a token (dict)
         :return: authorization url (url)
         """
+        # Imported here, requests_oauthlib is slow to import and only
+        # needed for OAuth.
+        from requests_oauthlib import OAuth2Session
+
         self.set_user_agent_component(
             "OAuth", "2.0", sanitize=False
         )  # keep spelling equal to the PHP client
@@ -345,7 +1142,8 @@ class Client:
             token_updater=set_token,
         )
         self._oauth_client.verify = True
-        self._setup_retry()
+        self._setup_retry(self._oauth_client)
+        self._request_template = None
 
         authorization_url = None
         if not self._oauth_client.authorized:
@@ -375,16 +1173,66 @@ class Client:
     # def revoke_oauth_token(self, token, type_hint):
     #     ...
 
-    def _setup_retry(self) -> None:
-        """Configure a retry behaviour on the HTTP client."""
-        if self.retry:
-            retry = Retry(connect=self.retry, read=0, backoff_factor=1)
-            adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session for API key requests.
+
+        The session is created once, also when multiple threads perform
+        their first API call at the same time.
+        """
+        try:
+            return self._client
+        except AttributeError:
+            pass
+        with self._session_lock:
+            if not hasattr(self, "_client"):
+                session = requests.Session()
+                session.verify = True
+                self._setup_retry(session)
+                self._client = session
+        return self._client
+
+    def _get_transport(self) -> Transport:
+        """Return the transport for API key requests."""
+        if self.transport is not None:
+            return self.transport
+        session = self._get_session()
+        transport = self._default_transport
+        if transport is None or transport.session is not session:
+            transport = self._default_transport = RequestsTransport(session)
+        return transport
 
-            if hasattr(self, "_client"):
-                self._client.mount("https://", adapter)
-            elif hasattr(self, "_oauth_client"):
-                self._oauth_client.mount("https://", adapter)
+    def get_retry(self) -> Union[int, Retry]:
+        """Return the retry configuration for connect errors, see the
+        `retry` parameter of the client."""
+        if not self.retry:
+            return 0
+        return CancellableRetry(connect=self.retry, read=0, backoff_factor=1)
+
+    def _setup_retry(self, session: requests.Session) -> None:
+        """Configure the connection pool and retry behaviour on the HTTP
+        client."""
+        adapter = PoolStatsAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.get_retry(),
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Return statistics of the connection pool, see PoolStatsAdapter."""
+        if self.transport is not None and not hasattr(self, "_oauth_client"):
+            return self.transport.pool_stats
+        session: Optional[requests.Session] = getattr(
+            self, "_oauth_client", None
+        ) or getattr(self, "_client", None)
+        if session is not None:
+            adapter = session.get_adapter(f"{self.api_endpoint}/")
+            if isinstance(adapter, PoolStatsAdapter):
+                return adapter.get_stats()
+        return PoolStatsAdapter().get_stats()
 
 
 def generate_querystring(params: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -393,19 +1241,27 @@ def generate_querystring(params: Optional[Dict[str, Any]]) -> Optional[str]:
     The Requests library doesn't know how to generate querystrings that
     encode dictionaries using square brackets:
     https://api.mollie.com/v2/methods?amount[value]=100.00&amount[currency]=USD
+
+    Dictionaries and lists are encoded recursively, list items are keyed by
+    their index: `lines[0][id]=odl_1`.
     """
     if not params:
         return None
 
-    parts = []
+    parts: List[str] = []
     for param, value in params.items():
-        # TODO clean this up with a simple recursive approach
-        if not isinstance(value, dict):
-            parts.append(urlencode({param: value}))
-        else:
-            # encode dictionary with square brackets
-            for key, sub_value in value.items():
-                composed = f"{param}[{key}]"
-                parts.append(urlencode({composed: sub_value}))
-
+        _append_querystring_parts(parts, str(param), value)
     return "&".join(parts)
+
+
+def _append_querystring_parts(parts: List[str], key: str, value: Any) -> None:
+    if isinstance(value, dict):
+        for sub_key, sub_value in value.items():
+            _append_querystring_parts(parts, f"{key}[{sub_key}]", sub_value)
+    elif isinstance(value, (list, tuple)):
+        for index, sub_value in enumerate(value):
+            _append_querystring_parts(parts, f"{key}[{index}]", sub_value)
+    else:
+        if not isinstance(value, (str, bytes)):
+            value = str(value)
+        parts.append(f"{quote_plus(key)}={quote_plus(value)}")
@@ -0,0 +1,113 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Type, Union
+
+from .error import RequestSetupError
+
+__all__ = [
+    "JSONCodec",
+    "OrjsonCodec",
+    "StdlibJSONCodec",
+    "UjsonCodec",
+    "get_json_codec",
+]
+
+
+class JSONCodec(ABC):
+    """Encodes request payloads and decodes response bodies.
+
+    Subclass this to plug another JSON library into the Client, see
+    Client.set_json_codec(). Decoding always starts from the raw response
+    bytes, so a codec never needs the body as text.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        ...
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec using the json module from the standard library."""
+
+    name = "json"
+
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        return json.dumps(data)
+
+    def loads(self, data: bytes) -> Any:
+        # The API always responds in UTF-8, which saves json.loads() from
+        # detecting the encoding.
+        return json.loads(data.decode("utf-8"))
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using orjson, when it is installed."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        return self._orjson.dumps(data)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec using ujson, when it is installed."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        return self._ujson.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    codec.name: codec for codec in (StdlibJSONCodec, OrjsonCodec, UjsonCodec)
+}
+
+
+def get_json_codec(name: str) -> JSONCodec:
+    """Return a codec by its name.
+
+    Use the name 'auto' to get the fastest codec that is installed.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "ujson"):
+            try:
+                return CODECS[candidate]()
+            except ImportError:
+                continue
+        return StdlibJSONCodec()
+
+    try:
+        codec_class = CODECS[name]
+    except KeyError:
+        raise RequestSetupError(
+            f"Unknown JSON codec '{name}', use one of: {', '.join(CODECS)}."
+        )
+    try:
+        return codec_class()
+    except ImportError:
+        raise RequestSetupError(
+            f"The JSON codec '{name}' is not available, install the "
+            f"'{name}' package to use it."
+        )
@@ -28,6 +28,35 @@ class RequestSetupError(RequestError):
     """Errors while preparing an API request."""
 
 
+class RequestCancelledError(RequestError):
+    """The request was cancelled before it could be completed.
+
+    Raised when the coroutine awaiting an AsyncClient call is cancelled
+    while the request, or one of its retries, is still pending.
+    """
+
+
+class DeadlineExceeded(RequestError):
+    """The deadline of the operation passed before the request completed.
+
+    See Client.deadline().
+    """
+
+
+class CircuitOpenError(RequestError):
+    """The request was not sent, because recent requests to the same part
+    of the API failed.
+
+    See CircuitBreaker, the request can be tried again after
+    `retry_after` seconds.
+    """
+
+    def __init__(self, message: str, family: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
+
+
 class IdentifierError(RequestSetupError):
     """Errors related to invalid resource identifiers that will be requested
     from the API."""
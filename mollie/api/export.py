@@ -0,0 +1,503 @@
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlsplit
+
+from .money import Money
+from .resources.base import _parse_timestamp
+
+if TYPE_CHECKING:
+    from .resources.base import ResourceListMixin
+
+__all__ = [
+    "CSVWriter",
+    "Column",
+    "DEFAULT_COLUMNS",
+    "ExportWriter",
+    "Exporter",
+    "NDJSONWriter",
+    "ParquetWriter",
+]
+
+Row = Tuple[Any, ...]
+
+
+class Column:
+    """A column of an export, with the path of its field in the objects and
+    the type of its values.
+
+    The path separates nested fields with dots, such as 'amount.currency',
+    'metadata.order_id' or '_links.checkout.href'. The types:
+    - string, integer, float, boolean: the value converted to the type.
+    - money: the minor units of an amount, see Money.
+    - timestamp: an ISO 8601 timestamp, as a datetime in UTC.
+    - json: any value, as JSON text.
+    Missing fields are empty (CSV) or null.
+    """
+
+    TYPES: Tuple[str, ...] = (
+        "string",
+        "integer",
+        "float",
+        "boolean",
+        "money",
+        "timestamp",
+        "json",
+    )
+
+    def __init__(
+        self, name: str, path: Optional[str] = None, type: str = "string"
+    ) -> None:
+        """
+        :param name: The name of the column (str).
+        :param path: The path of the field, the name when omitted (str).
+        :param type: The type of the values, one of Column.TYPES (str).
+        """
+        if type not in self.TYPES:
+            raise ValueError(
+                f"Unknown column type '{type}', use one of: "
+                f"{', '.join(self.TYPES)}."
+            )
+        self.name = name
+        self.path = path or name
+        self.type = type
+        self._keys = self.path.split(".")
+        self._convert = _CONVERTERS[type]
+
+    def __repr__(self) -> str:
+        return f"Column({self.name!r}, {self.path!r}, {self.type!r})"
+
+    def extract(self, obj: Any) -> Any:
+        """Return the value of the column for an object."""
+        value = obj
+        for key in self._keys:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return None
+            if value is None:
+                return None
+        return self._convert(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "integer": int,
+    "float": float,
+    "boolean": bool,
+    "money": lambda value: Money.from_amount(value).units,
+    "timestamp": _parse_timestamp,
+    "json": lambda value: json.dumps(value, separators=(",", ":")),
+}
+
+DEFAULT_COLUMNS: Tuple[Column, ...] = (
+    Column("id"),
+    Column("created_at", "createdAt", "timestamp"),
+    Column("status"),
+    Column("amount_currency", "amount.currency"),
+    Column("amount_units", "amount", "money"),
+    Column("description"),
+)
+
+
+class ExportWriter(ABC):
+    """Writes the rows of an export in batches.
+
+    A writer can resume a file that was partly written: the state that
+    position() returns after a batch is passed to the writer that continues
+    the export, and everything written after that position is discarded.
+    """
+
+    extension: str = ""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[Column],
+        position: Optional[Any] = None,
+    ) -> None:
+        self.path = path
+        self.columns = columns
+
+    @abstractmethod
+    def write_batch(self, rows: List[Row]) -> None:
+        ...
+
+    @abstractmethod
+    def position(self) -> Any:
+        """Flush the written rows to disk, and return the position to
+        resume from (JSON serializable)."""
+
+    def close(self) -> None:
+        """Close the output."""
+
+
+class _FileWriter(ExportWriter):
+    """Writer of a single text file, resumed by truncating it."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[Column],
+        position: Optional[int] = None,
+    ) -> None:
+        super().__init__(path, columns, position)
+        if position is None:
+            self.file = open(path, "w", encoding="utf-8", newline="")
+            self.write_header()
+        else:
+            self.file = open(path, "r+", encoding="utf-8", newline="")
+            self.file.truncate(position)
+            self.file.seek(position)
+
+    def write_header(self) -> None:
+        pass
+
+    def position(self) -> int:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class CSVWriter(_FileWriter):
+    """Writes rows to a CSV file with a header."""
+
+    extension = ".csv"
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[Column],
+        position: Optional[int] = None,
+    ) -> None:
+        super().__init__(path, columns, position)
+        self.writer = csv.writer(self.file)
+
+    def write_header(self) -> None:
+        csv.writer(self.file).writerow(
+            [column.name for column in self.columns]
+        )
+
+    def write_batch(self, rows: List[Row]) -> None:
+        self.writer.writerows(
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            ]
+            for row in rows
+        )
+
+
+class NDJSONWriter(_FileWriter):
+    """Writes every row as a JSON object on its own line."""
+
+    extension = ".ndjson"
+
+    def write_batch(self, rows: List[Row]) -> None:
+        names = [column.name for column in self.columns]
+        self.file.writelines(
+            json.dumps(dict(zip(names, row)), default=_json_default) + "\n"
+            for row in rows
+        )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value)} as JSON.")
+
+
+class ParquetWriter(ExportWriter):
+    """Writes every batch to a Parquet file in the directory `path`, named
+    part-00000.parquet and so on. Requires pyarrow."""
+
+    extension = ".parquet"
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[Column],
+        position: Optional[int] = None,
+    ) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Install pyarrow to export to Parquet.")
+
+        super().__init__(path, columns, position)
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        types = {
+            "string": pyarrow.string(),
+            "integer": pyarrow.int64(),
+            "float": pyarrow.float64(),
+            "boolean": pyarrow.bool_(),
+            "money": pyarrow.int64(),
+            "timestamp": pyarrow.timestamp("us", tz="UTC"),
+            "json": pyarrow.string(),
+        }
+        self.schema = pyarrow.schema(
+            [(column.name, types[column.type]) for column in columns]
+        )
+        self.parts = position or 0
+        os.makedirs(path, exist_ok=True)
+        # Remove the parts written after the position.
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(self.extension):
+                if int(name[5 : -len(self.extension)]) >= self.parts:
+                    os.remove(os.path.join(path, name))
+
+    def write_batch(self, rows: List[Row]) -> None:
+        arrays = [
+            self._pyarrow.array(values, type=field.type)
+            for values, field in zip(zip(*rows), self.schema)
+        ]
+        table = self._pyarrow.Table.from_arrays(arrays, schema=self.schema)
+        part = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        self._parquet.write_table(table, part)
+        self.parts += 1
+
+    def position(self) -> int:
+        return self.parts
+
+
+WRITERS: Dict[str, Callable[..., ExportWriter]] = {
+    "csv": CSVWriter,
+    "ndjson": NDJSONWriter,
+    "parquet": ParquetWriter,
+}
+
+
+class Exporter:
+    """Exports a list of objects, such as all payments of a month, to CSV,
+    NDJSON or Parquet.
+
+    The list is streamed page by page, and the rows are written in batches,
+    so the memory used does not grow with the number of objects. After
+    every batch the position in the list (the `from` cursor of the next
+    page) and in the output are saved to a checkpoint file. When the
+    export is interrupted, running it again with the same checkpoint
+    continues after the last batch:
+
+        exporter = Exporter(client.payments, columns=[
+            Column("id"),
+            Column("created_at", "createdAt", "timestamp"),
+            Column("amount_currency", "amount.currency"),
+            Column("amount_units", "amount", "money"),
+            Column("order_id", "metadata.order_id"),
+        ])
+        exporter.export(
+            "payments-2023-10.csv",
+            checkpoint="payments-2023-10.checkpoint",
+            created_after="2023-10-01T00:00:00+00:00",
+            created_before="2023-11-01T00:00:00+00:00",
+        )
+
+    Lists are ordered newest first, so objects created before
+    `created_after` end the export. The checkpoint can only be used to
+    resume the same export: with the same path, format, columns, period and
+    parameters, a ValueError is raised otherwise.
+    """
+
+    def __init__(
+        self,
+        resource: "ResourceListMixin",
+        columns: Iterable[Union[Column, str]] = DEFAULT_COLUMNS,
+        batch_size: int = 10_000,
+        page_size: int = 250,
+    ) -> None:
+        """
+        :param resource: The resource to list, such as client.payments or
+            client.refunds.
+        :param columns: The columns, a string is a column of that field.
+        :param batch_size: The minimum number of rows per batch (int).
+        :param page_size: The number of objects per page (int).
+        """
+        self.resource = resource
+        self.columns = [
+            column if isinstance(column, Column) else Column(column)
+            for column in columns
+        ]
+        self.batch_size = batch_size
+        self.page_size = page_size
+
+    def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        checkpoint: Optional[str] = None,
+        created_after: Union[datetime, str, None] = None,
+        created_before: Union[datetime, str, None] = None,
+        **params: Any,
+    ) -> int:
+        """Export the list to a file, and return the number of rows.
+
+        :param format: 'csv', 'ndjson' or 'parquet', by default from the
+            extension of the path.
+        :param checkpoint: The path of the checkpoint file, to resume an
+            interrupted export. It is kept after the export finished.
+        :param created_after: Export the objects created after this datetime
+            or ISO 8601 timestamp.
+        :param created_before: Skip the objects created at or after this.
+        :param params: Parameters of the list, such as `profileId`.
+        """
+        if format is None:
+            format = os.path.splitext(path)[1].lstrip(".").lower()
+        try:
+            writer_class = WRITERS[format]
+        except KeyError:
+            raise ValueError(
+                f"Unknown export format '{format}', use one of: "
+                f"{', '.join(WRITERS)}."
+            )
+
+        after = _parse_timestamp(created_after) if created_after else None
+        before = _parse_timestamp(created_before) if created_before else None
+        job = self._describe(path, format, after, before, params)
+        state = self._load_checkpoint(checkpoint)
+        if state and state.get("job") != job:
+            raise ValueError(
+                f"The checkpoint '{checkpoint}' belongs to another export, "
+                "use a new checkpoint for an export with another path, "
+                "format, columns, period or parameters."
+            )
+        if state.get("done"):
+            return state["rows"]
+
+        writer = writer_class(path, self.columns, state.get("position"))
+        rows_written = state.get("rows", 0)
+        cursor = state.get("cursor")
+        batch: List[Row] = []
+        done = False
+        try:
+            params["limit"] = self.page_size
+            if cursor:
+                params["from"] = cursor
+            page = self.resource.stream(**params)
+            while page is not None:
+                for obj in page:
+                    created_at = obj.get("createdAt")
+                    if created_at and (after or before):
+                        timestamp = _parse_timestamp(created_at)
+                        if after is not None and timestamp <= after:
+                            done = True
+                            break
+                        if before is not None and timestamp >= before:
+                            continue
+                    batch.append(
+                        tuple(column.extract(obj) for column in self.columns)
+                    )
+                if done:
+                    page.close()
+                    break
+                cursor = self._get_next_cursor(page)
+                if cursor is None:
+                    break
+                if len(batch) >= self.batch_size:
+                    rows_written += self._write(
+                        writer, batch, checkpoint, job, rows_written, cursor
+                    )
+                    batch = []
+                page = page.get_next()
+
+            rows_written += self._write(
+                writer, batch, checkpoint, job, rows_written, None, done=True
+            )
+        finally:
+            writer.close()
+        return rows_written
+
+    def _write(
+        self,
+        writer: ExportWriter,
+        batch: List[Row],
+        checkpoint: Optional[str],
+        job: Dict[str, Any],
+        rows_written: int,
+        cursor: Optional[str],
+        done: bool = False,
+    ) -> int:
+        """Write a batch and save the checkpoint after it."""
+        if batch:
+            writer.write_batch(batch)
+        position = writer.position()
+        if checkpoint is not None:
+            self._save_checkpoint(
+                checkpoint,
+                {
+                    "job": job,
+                    "cursor": cursor,
+                    "rows": rows_written + len(batch),
+                    "position": position,
+                    "done": done,
+                },
+            )
+        return len(batch)
+
+    def _describe(
+        self,
+        path: str,
+        format: str,
+        after: Optional[datetime],
+        before: Optional[datetime],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Return the parameters of an export, as saved in its checkpoint."""
+        job = {
+            "resource": self.resource.get_resource_path(),
+            "path": os.path.abspath(path),
+            "format": format,
+            "columns": [
+                [column.name, column.path, column.type]
+                for column in self.columns
+            ],
+            "created_after": after.isoformat() if after else None,
+            "created_before": before.isoformat() if before else None,
+            "params": params,
+        }
+        # As loaded from the checkpoint, with tuples as lists.
+        return json.loads(json.dumps(job, sort_keys=True, default=str))
+
+    @staticmethod
+    def _get_next_cursor(page: Any) -> Optional[str]:
+        """Return the `from` parameter of the link to the next page."""
+        url = page._get_link("next")
+        if url is None:
+            return None
+        values = parse_qs(urlsplit(url).query).get("from")
+        return values[0] if values else None
+
+    @staticmethod
+    def _load_checkpoint(checkpoint: Optional[str]) -> Dict[str, Any]:
+        if checkpoint is None or not os.path.exists(checkpoint):
+            return {}
+        with open(checkpoint, encoding="utf-8") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _save_checkpoint(checkpoint: str, state: Dict[str, Any]) -> None:
+        """Replace the checkpoint file, so it is never partly written."""
+        temporary = f"{checkpoint}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, checkpoint)
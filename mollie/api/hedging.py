@@ -0,0 +1,102 @@
+import threading
+from typing import Dict, Optional
+
+from .latency import LatencyRecorder
+from .retry import RetryBudget
+
+__all__ = [
+    "HedgePolicy",
+]
+
+
+class HedgePolicy:
+    """Decides when a slow GET request is sent again.
+
+    When a GET request has not been answered after the `percentile` of the
+    recent latencies of its endpoint, an identical request is sent on
+    another connection, and the first response is used. Up to `max_hedges`
+    extra requests are sent per call. Hedges are limited to the fraction
+    `max_ratio` of the requests, so that they do not add load when the API
+    is slow for everyone:
+
+        client.set_hedge_policy(HedgePolicy(percentile=95))
+
+    No hedges are sent for an endpoint until `min_samples` latencies have
+    been recorded.
+
+    The statistics:
+    - requests: the number of requests that could have been hedged.
+    - hedges_fired: the number of extra requests sent.
+    - hedges_won: the number of calls answered first by an extra request.
+    - hedges_capped: the number of extra requests skipped for the ratio.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        max_hedges: int = 1,
+        max_ratio: float = 0.05,
+        min_delay: float = 0.02,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        :param percentile: The percentile of the latency after which an
+            extra request is sent (float).
+        :param max_hedges: The maximum number of extra requests per call
+            (int).
+        :param max_ratio: The maximum fraction of requests that is hedged
+            (float).
+        :param min_delay: The minimum delay before an extra request (float).
+        :param min_samples: The number of latencies needed for an endpoint
+            before it is hedged (int).
+        """
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.budget = RetryBudget(
+            ratio=max_ratio, min_per_second=0, capacity=max(1, max_hedges)
+        )
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "hedges_fired": 0,
+            "hedges_won": 0,
+            "hedges_capped": 0,
+        }
+
+    def get_delay(
+        self, latency: LatencyRecorder, endpoint: str
+    ) -> Optional[float]:
+        """Return the seconds to wait for a response before hedging a
+        request to an endpoint, or None when it should not be hedged."""
+        self.budget.deposit()
+        self._count("requests")
+        delay = latency.percentile(
+            endpoint, self.percentile, min_samples=self.min_samples
+        )
+        if delay is None:
+            return None
+        return max(delay, self.min_delay)
+
+    def allow_hedge(self) -> bool:
+        """Take an extra request from the budget."""
+        if self.budget.withdraw():
+            self._count("hedges_fired")
+            return True
+        self._count("hedges_capped")
+        return False
+
+    def record_win(self) -> None:
+        """Record that an extra request was answered first."""
+        self._count("hedges_won")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the counters of hedged requests."""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,213 @@
+import math
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+__all__ = [
+    "AdaptiveTimeouts",
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "endpoint_template",
+]
+
+# Mollie IDs are a short lowercase prefix, an underscore and a token, such
+# as tr_WDqYK6vllg or ord_kEn1PlbGa.
+_ID_SEGMENT = re.compile(r"^[a-z]{2,5}_\w+$")
+
+
+def endpoint_template(path: str) -> str:
+    """Return the endpoint of a path or URL, with the IDs replaced.
+
+    For example, both 'payments/tr_WDqYK6vllg' and
+    'https://api.mollie.com/v2/payments/tr_7UhSN1zuXS' become
+    'payments/{id}'.
+    """
+    if "://" in path:
+        path = urlsplit(path).path
+        # Drop the API version.
+        path = path.lstrip("/").partition("/")[2]
+    else:
+        path = path.partition("?")[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.strip("/").split("/")
+    )
+
+
+class LatencyHistogram:
+    """Histogram of latencies, with buckets that are 10% apart.
+
+    The percentiles are estimated within the precision of a bucket.
+    """
+
+    MIN_LATENCY: float = 0.001
+    MAX_LATENCY: float = 300
+    GROWTH: float = 1.1
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (self.bucket(self.MAX_LATENCY) + 1)
+        self.total = 0
+
+    @classmethod
+    def bucket(cls, seconds: float) -> int:
+        """Return the index of the bucket that counts a latency."""
+        if seconds <= cls.MIN_LATENCY:
+            return 0
+        return math.ceil(
+            math.log(seconds / cls.MIN_LATENCY) / math.log(cls.GROWTH)
+        )
+
+    def record(self, seconds: float) -> None:
+        self.counts[min(self.bucket(seconds), len(self.counts) - 1)] += 1
+        self.total += 1
+
+    def upper_bound(self, index: int) -> float:
+        """Return the highest latency counted in a bucket."""
+        return self.MIN_LATENCY * self.GROWTH**index
+
+
+class LatencyRecorder:
+    """Rolling latency histograms per endpoint.
+
+    The latencies of the current and the previous `window` seconds are
+    used, so the percentiles follow changes in the latency of the API
+    within two windows.
+    """
+
+    def __init__(
+        self,
+        window: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = window
+        self.clock = clock
+        self._current: Dict[str, LatencyHistogram] = {}
+        self._previous: Dict[str, LatencyHistogram] = {}
+        self._rotated_at = clock()
+        self._lock = threading.Lock()
+
+    def _rotate(self) -> None:
+        now = self.clock()
+        if now - self._rotated_at < self.window:
+            return
+        if now - self._rotated_at < 2 * self.window:
+            self._previous = self._current
+        else:
+            self._previous = {}
+        self._current = {}
+        self._rotated_at = now
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a request to an endpoint."""
+        with self._lock:
+            self._rotate()
+            histogram = self._current.get(endpoint)
+            if histogram is None:
+                histogram = self._current[endpoint] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def count(self, endpoint: str) -> int:
+        """Return the number of latencies recorded for an endpoint."""
+        with self._lock:
+            self._rotate()
+            return sum(
+                window[endpoint].total
+                for window in (self._current, self._previous)
+                if endpoint in window
+            )
+
+    def percentile(
+        self, endpoint: str, percentile: float, min_samples: int = 1
+    ) -> Optional[float]:
+        """Return a percentile (0-100) of the latency of an endpoint, or
+        None when fewer than `min_samples` latencies were recorded."""
+        with self._lock:
+            self._rotate()
+            histograms = [
+                window[endpoint]
+                for window in (self._current, self._previous)
+                if endpoint in window
+            ]
+            total = sum(histogram.total for histogram in histograms)
+            if not histograms or total < max(min_samples, 1):
+                return None
+
+            rank = math.ceil(total * percentile / 100)
+            seen = 0
+            for index in range(len(histograms[0].counts)):
+                seen += sum(
+                    histogram.counts[index] for histogram in histograms
+                )
+                if seen >= rank:
+                    return histograms[0].upper_bound(index)
+            return histograms[0].upper_bound(len(histograms[0].counts) - 1)
+
+    def endpoints(self) -> List[str]:
+        """Return the endpoints with recorded latencies."""
+        with self._lock:
+            self._rotate()
+            return sorted(set(self._current) | set(self._previous))
+
+
+class AdaptiveTimeouts:
+    """Derives the read timeout per endpoint from its recent latencies.
+
+    The read timeout of an endpoint is its `percentile` latency times
+    `multiplier`, kept between `floor` and `ceiling`, so fast endpoints
+    fail fast and slow endpoints are not timed out by a static timeout:
+
+        client.set_adaptive_timeouts(AdaptiveTimeouts(percentile=99))
+
+    The learned read timeouts are in client.learned_timeouts, by endpoint
+    template such as 'settlements/{id}/payments'.
+
+    Until `min_samples` latencies have been recorded for an endpoint, the
+    read timeout of the client is used. The connect timeout of the client
+    is always used.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 99,
+        multiplier: float = 3,
+        floor: float = 0.5,
+        ceiling: float = 30,
+        min_samples: int = 50,
+    ) -> None:
+        """
+        :param percentile: The percentile of the latency (float).
+        :param multiplier: The factor between the percentile and the
+            timeout (float).
+        :param floor: The shortest read timeout in seconds (float).
+        :param ceiling: The longest read timeout in seconds (float).
+        :param min_samples: The number of latencies needed for an endpoint
+            before its timeout is derived from them (int).
+        """
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+
+    def get_read_timeout(
+        self, latency: LatencyRecorder, endpoint: str
+    ) -> Optional[float]:
+        """Return the read timeout for an endpoint, or None when too few
+        latencies were recorded."""
+        value = latency.percentile(
+            endpoint, self.percentile, min_samples=self.min_samples
+        )
+        if value is None:
+            return None
+        return min(self.ceiling, max(self.floor, value * self.multiplier))
+
+    def get_read_timeouts(self, latency: LatencyRecorder) -> Dict[str, float]:
+        """Return the learned read timeouts by endpoint."""
+        timeouts = {}
+        for endpoint in latency.endpoints():
+            timeout = self.get_read_timeout(latency, endpoint)
+            if timeout is not None:
+                timeouts[endpoint] = timeout
+        return timeouts
@@ -0,0 +1,206 @@
+import threading
+import time
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .objects.method import Method
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = [
+    "MethodsCatalog",
+]
+
+CatalogKey = Tuple[Optional[str], str, str]
+
+
+class CatalogEntry:
+    __slots__ = ("methods", "refresh_at", "expires_at")
+
+    def __init__(
+        self, methods: List[Method], refresh_at: float, expires_at: float
+    ) -> None:
+        self.methods = methods
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class MethodsCatalog:
+    """Catalog of the payment methods to offer at checkout.
+
+    Retrieving the methods from the API on every checkout page adds a full
+    round trip to the page. The catalog keeps the methods per profile,
+    locale and sequence type:
+
+        catalog = MethodsCatalog(client)
+        client.set_methods_catalog(catalog)
+        methods = catalog.list(
+            amount={"value": "12.50", "currency": "EUR"}, locale="nl_NL"
+        )
+
+    The methods are retrieved from the API without an amount, and then
+    filtered on the minimum and maximum amount of each method. Limits in
+    another currency than the amount are not compared.
+
+    Concurrent misses of the same entry share one request to the API.
+
+    Entries are refreshed in a background thread once they are older than
+    `ttl - refresh_ahead` seconds, so pages are rendered from the catalog
+    while the refresh is running. Enabling or disabling methods or issuers
+    through ProfileMethods drops the entries of the profile, once the
+    catalog is registered with Client.set_methods_catalog(). When the client
+    also has a ResponseCache, disable it for "Methods" so that refreshes
+    reach the API.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        ttl: float = 300,
+        refresh_ahead: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param ttl: Seconds until an entry can no longer be used (float).
+        :param refresh_ahead: Seconds before the expiry of an entry at
+            which it is refreshed in the background (float).
+        """
+        self.client = client
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.clock = clock
+        self._entries: Dict[CatalogKey, CatalogEntry] = {}
+        self._refreshing: Set[CatalogKey] = set()
+        self._loads = SingleFlight()
+        # Bumped by invalidate(), so that loads that started before are
+        # not stored.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def list(
+        self,
+        amount: Dict[str, str],
+        locale: str = "",
+        sequence_type: str = "",
+        profile_id: Optional[str] = None,
+    ) -> List[Method]:
+        """Return the methods that can be used to pay the amount.
+
+        :param amount: The amount to pay, such as {"value": "12.50",
+            "currency": "EUR"}.
+        :param locale: The locale for the method descriptions.
+        :param sequence_type: The sequenceType of the payment.
+        :param profile_id: The profile, required when using OAuth.
+        """
+        value = Decimal(amount["value"])
+        currency = amount["currency"]
+        key = (profile_id, locale, sequence_type)
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            refresh = (
+                entry is not None
+                and now < entry.expires_at
+                and now >= entry.refresh_at
+                and key not in self._refreshing
+            )
+            if refresh:
+                self._refreshing.add(key)
+        if entry is None or now >= entry.expires_at:
+            entry = self._loads.do(key, lambda: self._load_expired(key))
+        elif refresh:
+            threading.Thread(
+                target=self._refresh, args=(key,), daemon=True
+            ).start()
+
+        return [
+            method
+            for method in entry.methods
+            if self._supports_amount(method, value, currency)
+        ]
+
+    def invalidate(self, profile_id: Optional[str] = None) -> None:
+        """Drop the entries of a profile, or all entries.
+
+        Entries without a profile (using the profile of the API key) are
+        always dropped, since they could belong to the profile.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                if profile_id is None or key[0] in (None, profile_id):
+                    del self._entries[key]
+
+    def _load_expired(self, key: CatalogKey) -> CatalogEntry:
+        """Load an entry, unless another thread just did."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self.clock() < entry.expires_at:
+            return entry
+        return self._load(key)
+
+    def _load(self, key: CatalogKey) -> CatalogEntry:
+        profile_id, locale, sequence_type = key
+        params: Dict[str, Any] = {}
+        if locale:
+            params["locale"] = locale
+        if sequence_type:
+            params["sequenceType"] = sequence_type
+        if profile_id:
+            params["profileId"] = profile_id
+
+        with self._lock:
+            generation = self._generation
+        methods = list(self.client.methods.list(**params))
+        now = self.clock()
+        entry = CatalogEntry(
+            methods, now + self.ttl - self.refresh_ahead, now + self.ttl
+        )
+        with self._lock:
+            # An entry loaded before invalidate() can be outdated, it is
+            # returned to this caller but not kept.
+            if generation == self._generation:
+                self._entries[key] = entry
+        return entry
+
+    def _refresh(self, key: CatalogKey) -> None:
+        try:
+            self._load(key)
+        except Exception:
+            # The current entry is used until it expires.
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    @staticmethod
+    def _supports_amount(
+        method: Method, value: Decimal, currency: str
+    ) -> bool:
+        minimum = method.minimum_amount
+        maximum = method.maximum_amount
+        if (
+            minimum
+            and minimum["currency"] == currency
+            and value < Decimal(minimum["value"])
+        ):
+            return False
+        if (
+            maximum
+            and maximum["currency"] == currency
+            and value > Decimal(maximum["value"])
+        ):
+            return False
+        return True
@@ -0,0 +1,348 @@
+import bisect
+import re
+from array import array
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = [
+    "AmountArray",
+    "CURRENCY_EXPONENTS",
+    "Money",
+    "collect_amounts",
+    "get_exponent",
+]
+
+# The number of decimals of the currencies that do not have 2.
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "BHD": 3,
+    "CLP": 0,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "OMR": 3,
+    "TND": 3,
+}
+DEFAULT_EXPONENT: int = 2
+
+_VALUE = re.compile(r"^\s*([+-]?)(?=\.?\d)(\d*)(?:\.(\d*))?\s*$")
+
+Key = Union[str, Callable[[Any], Any], None]
+
+# The number of distinct values per currency that collect_amounts() keeps.
+MAX_PARSED_VALUES: int = 10000
+
+
+def get_exponent(currency: str) -> int:
+    """Return the number of decimals of a currency."""
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+class Money:
+    """An amount of money, as an integer number of minor units (such as
+    cents) of a currency.
+
+    Amounts of the API are parsed exactly, without floats:
+
+        money = Money.from_amount(payment.amount)
+        money + Money.from_amount(payment.amount_refunded)
+        money.to_amount()  # {"currency": "EUR", "value": "120.00"}
+
+    Amounts can only be added to and compared with amounts of the same
+    currency, a ValueError is raised otherwise.
+    """
+
+    __slots__ = ("units", "currency")
+
+    units: int
+    currency: str
+
+    def __init__(self, units: int, currency: str) -> None:
+        """
+        :param units: The amount in minor units of the currency (int).
+        :param currency: The ISO 4217 code of the currency (str).
+        """
+        object.__setattr__(self, "units", int(units))
+        object.__setattr__(self, "currency", currency)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Money is immutable.")
+
+    @classmethod
+    def from_value(cls, value: str, currency: str) -> "Money":
+        """Parse a value such as '120.00' in a currency."""
+        exponent = get_exponent(currency)
+        match = _VALUE.match(value)
+        if match is None:
+            raise ValueError(f"Invalid amount value: '{value}'.")
+        sign, whole, fraction = match.groups()
+        fraction = fraction or ""
+        if len(fraction) > exponent:
+            if fraction[exponent:].strip("0"):
+                raise ValueError(
+                    f"The amount '{value}' has more than {exponent} "
+                    f"decimals, the maximum for {currency}."
+                )
+            fraction = fraction[:exponent]
+        units = int(whole or "0") * 10**exponent + int(
+            fraction.ljust(exponent, "0") or "0"
+        )
+        return cls(-units if sign == "-" else units, currency)
+
+    @classmethod
+    def from_amount(cls, amount: Mapping) -> "Money":
+        """Parse an amount of the API, a mapping with a currency and a
+        value."""
+        return cls.from_value(amount["value"], amount["currency"])
+
+    @property
+    def exponent(self) -> int:
+        return get_exponent(self.currency)
+
+    def to_value(self) -> str:
+        """Return the value as formatted for the API, such as '120.00'."""
+        exponent = self.exponent
+        units = abs(self.units)
+        sign = "-" if self.units < 0 else ""
+        if not exponent:
+            return f"{sign}{units}"
+        whole, fraction = divmod(units, 10**exponent)
+        return f"{sign}{whole}.{fraction:0{exponent}d}"
+
+    def to_amount(self) -> Dict[str, str]:
+        """Return the amount as used by the API."""
+        return {"currency": self.currency, "value": self.to_value()}
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.units).scaleb(-self.exponent)
+
+    def _check_currency(self, other: "Money") -> None:
+        if self.currency != other.currency:
+            raise ValueError(
+                f"Cannot combine amounts in {self.currency} and "
+                f"{other.currency}."
+            )
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return Money(self.units + other.units, self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return Money(self.units - other.units, self.currency)
+
+    def __mul__(self, factor: int) -> "Money":
+        if not isinstance(factor, int):
+            return NotImplemented
+        return Money(self.units * factor, self.currency)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self.units, self.currency)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.units == other.units and self.currency == other.currency
+
+    def __hash__(self) -> int:
+        return hash((self.units, self.currency))
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.units < other.units
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.units <= other.units
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.units > other.units
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self.units >= other.units
+
+    def __str__(self) -> str:
+        return f"{self.to_value()} {self.currency}"
+
+    def __repr__(self) -> str:
+        return f"Money({self.units}, {self.currency!r})"
+
+    def __reduce__(self) -> Any:
+        return Money, (self.units, self.currency)
+
+
+class AmountArray:
+    """The amounts of many objects in one currency, as an array of minor
+    units: a NumPy int64 array when NumPy is installed, an array('q')
+    otherwise. See collect_amounts().
+
+    The optional keys (such as the status of each payment) are in a list
+    with the same order as the amounts.
+    """
+
+    def __init__(
+        self, currency: str, units: Any, keys: Optional[List[Any]] = None
+    ) -> None:
+        self.currency = currency
+        self.units = units
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def sum(self) -> Money:
+        if numpy is not None and isinstance(self.units, numpy.ndarray):
+            return Money(int(self.units.sum()), self.currency)
+        return Money(sum(self.units), self.currency)
+
+    def group_by(self) -> Dict[Any, Money]:
+        """Return the sum of the amounts by key."""
+        if self.keys is None:
+            raise ValueError("The amounts were collected without keys.")
+        if numpy is not None and isinstance(self.units, numpy.ndarray):
+            codes: Dict[Any, int] = {}
+            indices = [codes.setdefault(key, len(codes)) for key in self.keys]
+            totals = numpy.zeros(len(codes), dtype=numpy.int64)
+            numpy.add.at(
+                totals, numpy.array(indices, dtype=numpy.intp), self.units
+            )
+            sums = dict(zip(codes, totals.tolist()))
+        else:
+            sums = {}
+            get = sums.get
+            for key, units in zip(self.keys, self.units):
+                sums[key] = get(key, 0) + units
+        return {
+            key: Money(units, self.currency) for key, units in sums.items()
+        }
+
+    def histogram(self, edges: Iterable[Union[Money, str]]) -> List[int]:
+        """Count the amounts between edges, such as ['0.00', '10.00',
+        '100.00']. The first count is of the amounts below the first edge,
+        the last of the amounts from the last edge."""
+        bounds = [
+            edge.units
+            if isinstance(edge, Money)
+            else Money.from_value(edge, self.currency).units
+            for edge in edges
+        ]
+        if numpy is not None and isinstance(self.units, numpy.ndarray):
+            indices = numpy.searchsorted(bounds, self.units, side="right")
+            return numpy.bincount(indices, minlength=len(bounds) + 1).tolist()
+        counts = [0] * (len(bounds) + 1)
+        for units in self.units:
+            counts[bisect.bisect_right(bounds, units)] += 1
+        return counts
+
+
+def collect_amounts(
+    objects: Iterable[Mapping],
+    field: str = "amount",
+    key: Key = None,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, AmountArray]:
+    """Collect an amount of many objects into arrays by currency.
+
+    Objects without the amount are skipped. Collecting is about as fast as
+    summing the values as Decimal, the arrays make the sums, groups and
+    histograms afterwards fast. Use it on a list, or on all pages of a list:
+
+        amounts = collect_amounts(client.payments.list_all(), key="status")
+        amounts["EUR"].sum()
+        amounts["EUR"].group_by()  # {"paid": Money(...), ...}
+
+    :param field: The name of the amount in the API, such as
+        'amountRefunded' or 'settlementAmount'.
+    :param key: The name of a field, or a function of the object, to group
+        the amounts by.
+    :param use_numpy: Whether to return NumPy arrays, by default when NumPy
+        is installed.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("Install numpy to collect amounts in NumPy arrays.")
+
+    # A field name as key is looked up inline, calling a function for every
+    # object would take longer than parsing its amount.
+    key_field = key if isinstance(key, str) else None
+    get_key = key if callable(key) else None
+    with_keys = key is not None
+
+    units: Dict[str, array] = {}
+    keys: Dict[str, List[Any]] = {}
+    # The minor units of the values parsed so far, by currency. Amounts such
+    # as prices recur, a lookup is faster than parsing.
+    parsed: Dict[str, Dict[str, int]] = {}
+    # The arrays and keys of the last currency, most objects have the same.
+    currency = None
+    append_units = append_key = get_parsed = currency_parsed = None
+    for obj in objects:
+        amount = obj.get(field)
+        if not amount:
+            continue
+        if amount["currency"] != currency:
+            currency = amount["currency"]
+            if currency not in units:
+                units[currency] = array("q")
+                keys[currency] = []
+                parsed[currency] = {}
+            append_units = units[currency].append
+            append_key = keys[currency].append
+            currency_parsed = parsed[currency]
+            get_parsed = currency_parsed.get
+
+        value = amount["value"]
+        value_units = get_parsed(value)
+        if value_units is None:
+            whole, _, fraction = value.partition(".")
+            digits = whole + fraction
+            if len(fraction) == get_exponent(currency) and digits.isdecimal():
+                # As the API formats the values.
+                value_units = int(digits)
+            else:
+                value_units = Money.from_value(value, currency).units
+            if len(currency_parsed) < MAX_PARSED_VALUES:
+                currency_parsed[value] = value_units
+        append_units(value_units)
+        if key_field is not None:
+            append_key(obj.get(key_field))
+        elif get_key is not None:
+            append_key(get_key(obj))
+
+    return {
+        currency: AmountArray(
+            currency,
+            numpy.frombuffer(values, dtype=numpy.int64).copy()
+            if use_numpy
+            else values,
+            keys[currency] if with_keys else None,
+        )
+        for currency, values in units.items()
+    }
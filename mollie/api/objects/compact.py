@@ -0,0 +1,455 @@
+import re
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .base import ObjectBase
+from .capture import Capture
+from .chargeback import Chargeback
+from .order import Order
+from .order_line import OrderLine
+from .payment import Payment
+from .refund import Refund
+from .settlement import Settlement
+
+__all__ = [
+    "CompactAmount",
+    "CompactCapture",
+    "CompactChargeback",
+    "CompactModel",
+    "CompactOrder",
+    "CompactOrderLine",
+    "CompactPayment",
+    "CompactRefund",
+    "CompactSettlement",
+    "compact_model",
+    "get_compact_model",
+    "iter_compact",
+]
+
+# A field is its name in the API, or the name in the API and the attribute
+# name when that is not the snake_case of the API name.
+FieldSpec = Union[str, Tuple[str, str]]
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _snake_case(name: str) -> str:
+    return _CAMEL_BOUNDARY.sub("_", name.lstrip("_")).lower()
+
+
+class CompactModel(Mapping):
+    """Base of the compact models made by compact_model().
+
+    A compact model stores the fields of an object in `__slots__` instead
+    of a dict, which takes a fraction of the memory of the dict-based
+    objects, and reads a field as fast as a plain attribute. Nested objects
+    (such as the amounts) are decoded when they are first read.
+
+    The model is a read-only Mapping of the API field names, so code that
+    reads objects as dicts keeps working:
+
+        payment = CompactPayment(data)
+        payment.amount_refunded["value"] == payment["amountRefunded"]["value"]
+
+    Use to_object() for the dict-based object, with all its methods.
+    """
+
+    __slots__ = ("client", "_present", "_extra")
+
+    # Set by compact_model().
+    OBJECT_TYPE: Optional[Type[ObjectBase]] = None
+    # The API names of the fields, in order.
+    FIELDS: Tuple[str, ...] = ()
+    # The slot of each field by API name, with its bit in `_present`.
+    _SLOTS: Dict[str, Tuple[str, int]] = {}
+    _SLOT_NAMES: Tuple[str, ...] = ()
+
+    client: Any
+    _present: int
+    _extra: Optional[Dict[str, Any]]
+
+    def __init__(self, data: Mapping, client: Any = None) -> None:
+        """Create a compact object from API result data, or another
+        object."""
+        self.client = client
+        extra = None
+        present = 0
+        for slot in self._SLOT_NAMES:
+            object.__setattr__(self, slot, None)
+        slots = self._SLOTS
+        for key, value in data.items():
+            try:
+                slot, bit = slots[key]
+            except KeyError:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            object.__setattr__(self, slot, value)
+            present |= bit
+        self._present = present
+        self._extra = extra
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            slot, bit = self._SLOTS[key]
+        except KeyError:
+            if self._extra is None:
+                raise
+            return self._extra[key]
+        if not self._present & bit:
+            raise KeyError(key)
+        return getattr(self, slot)
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._present
+        for key in self.FIELDS:
+            if present & self._SLOTS[key][1]:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        extra = len(self._extra) if self._extra is not None else 0
+        return bin(self._present).count("1") + extra
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.to_dict(),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the data of the object as plain dicts and lists."""
+        return {key: _to_plain(value) for key, value in self.items()}
+
+    def to_object(self) -> ObjectBase:
+        """Return the dict-based object of the model, such as a Payment."""
+        if self.OBJECT_TYPE is None:
+            raise TypeError(f"{type(self).__name__} has no object type.")
+        return self.OBJECT_TYPE(self.to_dict(), self.client)
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, CompactModel):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _nested_property(slot: str, model: Type[CompactModel]) -> property:
+    """Return a property that decodes a nested object, or a list of nested
+    objects, on first access."""
+
+    def getter(self: CompactModel) -> Any:
+        value = getattr(self, slot)
+        if isinstance(value, dict):
+            value = model(value, self.client)
+            object.__setattr__(self, slot, value)
+        elif isinstance(value, list):
+            value = tuple(model(item, self.client) for item in value)
+            object.__setattr__(self, slot, value)
+        return value
+
+    return property(getter)
+
+
+def compact_model(
+    name: str,
+    fields: Sequence[FieldSpec],
+    object_type: Optional[Type[ObjectBase]] = None,
+    nested: Optional[Dict[str, Type[CompactModel]]] = None,
+) -> Type[CompactModel]:
+    """Make a compact model class from a field spec.
+
+    :param fields: The fields, by their name in the API. A field is read
+        with the snake_case of its name, unless it is given as a tuple of
+        the name in the API and the attribute name.
+    :param object_type: The dict-based object of the model, see to_object().
+    :param nested: The compact model of nested fields, by their name in the
+        API.
+    """
+    nested = nested or {}
+    api_names: List[str] = []
+    slots: Dict[str, Tuple[str, int]] = {}
+    namespace: Dict[str, Any] = {}
+    for index, field in enumerate(fields):
+        api_name, attribute = (
+            field if isinstance(field, tuple) else (field, _snake_case(field))
+        )
+        slot = attribute
+        if api_name in nested:
+            # The slot holds the raw data until the property decodes it.
+            slot = f"_{attribute}"
+            namespace[attribute] = _nested_property(slot, nested[api_name])
+        api_names.append(api_name)
+        slots[api_name] = (slot, 1 << index)
+
+    slot_names = tuple(slot for slot, _ in slots.values())
+    namespace.update(
+        {
+            "__module__": __name__,
+            "__slots__": slot_names,
+            "OBJECT_TYPE": object_type,
+            "FIELDS": tuple(api_names),
+            "_SLOTS": slots,
+            "_SLOT_NAMES": slot_names,
+        }
+    )
+    model = type(name, (CompactModel,), namespace)
+    if object_type is not None:
+        _MODELS[object_type] = model
+    return model
+
+
+_MODELS: Dict[Type[ObjectBase], Type[CompactModel]] = {}
+
+
+def get_compact_model(object_type: Type[ObjectBase]) -> Type[CompactModel]:
+    """Return the compact model of a dict-based object type."""
+    try:
+        return _MODELS[object_type]
+    except KeyError:
+        raise TypeError(f"There is no compact model for {object_type}.")
+
+
+def iter_compact(
+    objects: Iterable[Any], model: Optional[Type[CompactModel]] = None
+) -> Iterator[CompactModel]:
+    """Convert objects to their compact model, one at a time.
+
+    This keeps only the compact objects in memory when it is used on a
+    streamed list:
+
+        payments = list(iter_compact(client.payments.list_all(limit=250)))
+
+    :param model: The compact model, found by the type of each object when
+        omitted.
+    """
+    for obj in objects:
+        object_model = model or get_compact_model(type(obj))
+        yield object_model(obj, getattr(obj, "client", None))
+
+
+CompactAmount = compact_model("CompactAmount", ("value", "currency"))
+
+_AMOUNTS: Dict[str, Type[CompactModel]] = {
+    name: CompactAmount
+    for name in (
+        "amount",
+        "amountRefunded",
+        "amountRemaining",
+        "amountCaptured",
+        "amountChargedBack",
+        "amountShipped",
+        "amountCanceled",
+        "settlementAmount",
+        "unitPrice",
+        "discountAmount",
+        "totalAmount",
+        "vatAmount",
+    )
+}
+
+CompactPayment = compact_model(
+    "CompactPayment",
+    (
+        "resource",
+        "id",
+        "mode",
+        "createdAt",
+        "status",
+        "isCancelable",
+        "authorizedAt",
+        "paidAt",
+        "canceledAt",
+        "expiresAt",
+        "expiredAt",
+        "failedAt",
+        "amount",
+        "amountRefunded",
+        "amountRemaining",
+        "amountCaptured",
+        ("amountChargedBack", "amount_chargedback"),
+        "description",
+        "redirectUrl",
+        "webhookUrl",
+        "method",
+        "metadata",
+        "locale",
+        "countryCode",
+        "profileId",
+        "settlementAmount",
+        "settlementId",
+        "customerId",
+        "sequenceType",
+        "mandateId",
+        "orderId",
+        "applicationFee",
+        "details",
+        "routing",
+        "subscriptionId",
+        "cancelUrl",
+        "captureBefore",
+        "captureMode",
+        "captureDelay",
+        "_links",
+    ),
+    object_type=Payment,
+    nested=_AMOUNTS,
+)
+
+CompactOrderLine = compact_model(
+    "CompactOrderLine",
+    (
+        "resource",
+        "id",
+        "orderId",
+        "type",
+        "name",
+        "status",
+        "isCancelable",
+        "quantity",
+        "quantityShipped",
+        "amountShipped",
+        "quantityRefunded",
+        "amountRefunded",
+        "quantityCanceled",
+        "amountCanceled",
+        "shippableQuantity",
+        "refundableQuantity",
+        "cancelableQuantity",
+        "unitPrice",
+        "discountAmount",
+        "totalAmount",
+        "vatRate",
+        "vatAmount",
+        "sku",
+        "createdAt",
+        "metadata",
+        "_links",
+    ),
+    object_type=OrderLine,
+    nested=_AMOUNTS,
+)
+
+CompactOrder = compact_model(
+    "CompactOrder",
+    (
+        "resource",
+        "id",
+        "profileId",
+        "method",
+        "mode",
+        "amount",
+        "amountCaptured",
+        "amountRefunded",
+        "status",
+        "isCancelable",
+        "billingAddress",
+        "consumerDateOfBirth",
+        "orderNumber",
+        "shippingAddress",
+        "locale",
+        "metadata",
+        "redirectUrl",
+        "webhookUrl",
+        "createdAt",
+        "expiresAt",
+        "expiredAt",
+        "paidAt",
+        "authorizedAt",
+        "canceledAt",
+        "completedAt",
+        "cancelUrl",
+        "lines",
+        "_links",
+    ),
+    object_type=Order,
+    nested={**_AMOUNTS, "lines": CompactOrderLine},
+)
+
+CompactRefund = compact_model(
+    "CompactRefund",
+    (
+        "resource",
+        "id",
+        "amount",
+        "settlementId",
+        "settlementAmount",
+        "description",
+        "status",
+        "lines",
+        "paymentId",
+        "orderId",
+        "createdAt",
+        "metadata",
+        "_links",
+    ),
+    object_type=Refund,
+    nested={**_AMOUNTS, "lines": CompactOrderLine},
+)
+
+CompactChargeback = compact_model(
+    "CompactChargeback",
+    (
+        "resource",
+        "id",
+        "amount",
+        "settlementAmount",
+        "createdAt",
+        "reason",
+        "reversedAt",
+        "paymentId",
+        "_links",
+    ),
+    object_type=Chargeback,
+    nested=_AMOUNTS,
+)
+
+CompactCapture = compact_model(
+    "CompactCapture",
+    (
+        "resource",
+        "id",
+        "mode",
+        "amount",
+        "settlementAmount",
+        "paymentId",
+        "shipmentId",
+        "settlementId",
+        "createdAt",
+        "_links",
+    ),
+    object_type=Capture,
+    nested=_AMOUNTS,
+)
+
+CompactSettlement = compact_model(
+    "CompactSettlement",
+    (
+        "resource",
+        "id",
+        "reference",
+        "createdAt",
+        "settledAt",
+        "status",
+        "amount",
+        "periods",
+        "_links",
+    ),
+    object_type=Settlement,
+    nested=_AMOUNTS,
+)
@@ -1,15 +1,25 @@
+import contextvars
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Type
 
+from ..streaming import iter_hal_list
 from .base import ObjectBase
 
 if TYPE_CHECKING:
+    import requests
+
     from mollie.api.client import Client
     from mollie.api.resources.base import ResourceBase
 
 
 class ListBase(ObjectBase, ABC):
     current = None
+    # The embedded objects of the list, looked up once. The objects are
+    # wrapped on each access, so that changes to a returned object do not
+    # show up in later accesses.
+    _data: Optional[List[Any]] = None
 
     def __len__(self):
         """Return the count field."""
@@ -26,42 +36,42 @@ class ListBase(ObjectBase, ABC):
             self.current = 0
         else:
             self.current += 1
-        try:
-            item = self["_embedded"][self.object_type.get_object_name()][
-                self.current
-            ]
-            return self.object_type(item, self.client)
-        except IndexError:
+        data = self._get_data()
+        if self.current >= len(data):
             self.current = None
             raise StopIteration
+        return self.object_type(data[self.current], self.client)
 
     def __getitem__(self, key):
         """Implement Sequence interface."""
-        object_name = self.object_type.get_object_name()
         if isinstance(key, int):
             # Return an index-based search from the "_embedded" dataset
-            item = self["_embedded"][object_name][key]
-            return self.object_type(item, self.client)
+            return self.object_type(self._get_data()[key], self.client)
 
         if isinstance(key, slice):
-            _start = key.start or 0
-            _stop = key.stop or self["count"]
-            _step = key.step or 1
-            sliced_data = [
-                self["_embedded"][object_name][x]
-                for x in range(_start, _stop, _step)
-            ]
+            sliced_data = self._get_data()[key]
             # Now we mock a result based on the sliced data
-            sliced_result = {
-                "_embedded": {
-                    object_name: sliced_data,
-                },
-                "count": len(sliced_data),
-            }
-            return self.new(sliced_result)
+            sliced_result = self.new(
+                {
+                    "_embedded": {
+                        self.object_type.get_object_name(): sliced_data,
+                    },
+                    "count": len(sliced_data),
+                }
+            )
+            sliced_result._data = sliced_data
+            return sliced_result
 
         return super().__getitem__(key)
 
+    def _get_data(self) -> List[Any]:
+        """Return the embedded objects, looked up once."""
+        data = self._data
+        if data is None:
+            data = self["_embedded"][self.object_type.get_object_name()]
+            self._data = data
+        return data
+
     @property
     def count(self):
         if "count" not in self:
@@ -77,6 +87,59 @@ class ListBase(ObjectBase, ABC):
         set."""
         return self._get_link("previous") is not None
 
+    def iterate_all(self, prefetch: int = 1) -> Iterator[Any]:
+        """Iterate the objects in this set and in all next sets.
+
+        While the objects of a set are consumed, the next sets are retrieved
+        from the API in a background thread. Only the current set and at
+        most `prefetch` sets read ahead are kept in memory.
+
+        :param prefetch: The number of sets to retrieve ahead of the
+            consumer, use 0 to retrieve each set when it is needed.
+        """
+        if prefetch < 1:
+            page = self
+            while page is not None:
+                yield from page
+                page = page.get_next()
+            return
+
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_pages() -> None:
+            page = self
+            try:
+                while not stop.is_set() and page.has_next():
+                    page = page.get_next()
+                    put(page)
+            except BaseException as err:
+                put(err)
+            put(None)
+
+        context = contextvars.copy_context()
+        fetcher = threading.Thread(
+            target=context.run, args=(fetch_pages,), daemon=True
+        )
+        fetcher.start()
+        try:
+            page = self
+            while page is not None:
+                yield from page
+                page = pages.get()
+                if isinstance(page, BaseException):
+                    raise page
+        finally:
+            stop.set()
+
     @abstractmethod
     def get_next(self):
         ...
@@ -145,6 +208,93 @@ class PaginationList(ListBase):
         return PaginationList(result, self._parent, self.client)
 
 
+class StreamingPaginationList:
+    """A page of a paginated list that is decoded while it is iterated.
+
+    The objects on the page are returned one at a time, and the response
+    is read from the network as they are needed. A page can be iterated
+    only once. The `count` and the links to other pages are known after
+    the iteration has finished.
+
+        for payment in client.payments.stream(limit=250):
+            ...
+    """
+
+    STREAM_CHUNK_SIZE: int = 16 * 1024
+
+    _parent: "ResourceBase"
+    _response: "requests.Response"
+    _fields: Dict[str, Any]
+
+    def __init__(
+        self,
+        response: "requests.Response",
+        parent: "ResourceBase",
+        client: "Client",
+    ):
+        self._response = response
+        self._parent = parent
+        self._fields = {}
+        self._consumed = False
+        self.client = client
+
+    def __enter__(self) -> "StreamingPaginationList":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._consumed:
+            raise RuntimeError("A streaming list can only be iterated once.")
+        self._consumed = True
+        object_type = self.object_type
+        items = iter_hal_list(
+            self._response.iter_content(self.STREAM_CHUNK_SIZE),
+            object_type.get_object_name(),
+            self._fields,
+        )
+        try:
+            for item in items:
+                yield object_type(item, self.client)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection of an unfinished iteration."""
+        self._response.close()
+
+    @property
+    def object_type(self) -> Type[ObjectBase]:
+        return self._parent.object_type
+
+    @property
+    def count(self) -> Optional[int]:
+        if "count" not in self._fields:
+            return None
+        return int(self._fields["count"])
+
+    def _get_link(self, name: str) -> Optional[str]:
+        try:
+            return self._fields["_links"][name]["href"]
+        except (KeyError, TypeError):
+            return None
+
+    def has_next(self) -> bool:
+        """Return True if the page links to a next page."""
+        return self._get_link("next") is not None
+
+    def get_next(self) -> Optional["StreamingPaginationList"]:
+        """Return the next page in the paginated list."""
+        url = self._get_link("next")
+        if url is None:
+            return None
+        resp = self._parent.perform_streaming_api_call(
+            self._parent.REST_READ, url
+        )
+        return StreamingPaginationList(resp, self._parent, self.client)
+
+
 class ObjectList(ListBase):
     """Object lists are used to return an embedded list on an object.
 
@@ -0,0 +1,104 @@
+import threading
+from typing import Any, Dict, Type
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool
+
+__all__ = [
+    "PoolStatsAdapter",
+]
+
+
+class PoolStatsAdapter(HTTPAdapter):
+    """HTTP adapter that keeps statistics about its connection pool.
+
+    The statistics can be used to size the pool of a Client that is shared
+    between threads:
+    - requests: the number of requests sent through the adapter.
+    - in_use: the number of connections that are in use. A streamed
+      response keeps its connection until it is read to the end or closed.
+    - peak_in_use: the highest number of connections in use at once.
+    - waits: the number of requests that were started while all pooled
+      connections were busy. With pool_block these requests waited for a
+      free connection, otherwise an extra connection was opened that is
+      discarded afterwards.
+    - connections_opened: the number of new (TLS) connections that were
+      established.
+    """
+
+    _stats_lock: threading.Lock
+    _stats: Dict[str, int]
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: Any = 0,
+        pool_block: bool = False,
+    ) -> None:
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "in_use": 0,
+            "peak_in_use": 0,
+            "waits": 0,
+            "connections_opened": 0,
+        }
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        # Substitute pool classes that report every new connection.
+        pool_classes = self.poolmanager.pool_classes_by_scheme
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool_class(pool_class)
+            for scheme, pool_class in pool_classes.items()
+        }
+
+    def _counting_pool_class(
+        self, base: Type[HTTPConnectionPool]
+    ) -> Type[HTTPConnectionPool]:
+        adapter = self
+
+        class CountingConnectionPool(base):  # type: ignore[valid-type,misc]
+            def _new_conn(self) -> Any:
+                with adapter._stats_lock:
+                    adapter._stats["connections_opened"] += 1
+                return super()._new_conn()
+
+            def _get_conn(self, *args: Any, **kwargs: Any) -> Any:
+                conn = super()._get_conn(*args, **kwargs)
+                with adapter._stats_lock:
+                    stats = adapter._stats
+                    stats["in_use"] += 1
+                    stats["peak_in_use"] = max(
+                        stats["peak_in_use"], stats["in_use"]
+                    )
+                return conn
+
+            def _put_conn(self, conn: Any) -> None:
+                # Called once for every connection from _get_conn(), also
+                # when it was closed, so that its slot in the pool is freed.
+                with adapter._stats_lock:
+                    adapter._stats["in_use"] -= 1
+                super()._put_conn(conn)
+
+        return CountingConnectionPool
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        with self._stats_lock:
+            stats = self._stats
+            if stats["in_use"] >= self._pool_maxsize:
+                stats["waits"] += 1
+            stats["requests"] += 1
+        return super().send(request, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return a snapshot of the pool statistics."""
+        with self._stats_lock:
+            return dict(self._stats)
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .error import RequestSetupError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+__all__ = [
+    "BucketBackend",
+    "FileBucketBackend",
+    "MemoryBucketBackend",
+    "RateLimiter",
+]
+
+
+class BucketBackend(ABC):
+    """Storage for the state of the token buckets.
+
+    Subclass this to share the buckets in another way, for example through
+    a database: reserve() must update the bucket atomically.
+    """
+
+    @abstractmethod
+    def reserve(
+        self, key: str, rate: float, burst: float, now: float
+    ) -> float:
+        """Take a token from a bucket, and return the seconds to wait for it.
+
+        The bucket can go into debt, so that the waiting callers get their
+        tokens in order.
+
+        :param key: The bucket.
+        :param rate: The number of tokens added per second.
+        :param burst: The maximum number of tokens in the bucket.
+        :param now: The current time.
+        """
+
+    @abstractmethod
+    def release(self, key: str, burst: float) -> None:
+        """Give back a token that was reserved for a call which was not
+        performed, such as a call that was cancelled while it waited.
+
+        :param key: The bucket.
+        :param burst: The maximum number of tokens in the bucket.
+        """
+
+    @staticmethod
+    def _take(
+        state: Optional[List[float]], rate: float, burst: float, now: float
+    ) -> Tuple[List[float], float]:
+        """Return the new state [tokens, updated] and the wait time."""
+        if state is None:
+            tokens = burst
+        else:
+            tokens, updated = state
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+        tokens -= 1
+        delay = -tokens / rate if tokens < 0 else 0.0
+        return [tokens, now], delay
+
+    @staticmethod
+    def _give_back(
+        state: Optional[List[float]], burst: float
+    ) -> Optional[List[float]]:
+        """Return the state with the token given back."""
+        if state is None:
+            return None
+        tokens, updated = state
+        return [min(burst, tokens + 1), updated]
+
+
+class MemoryBucketBackend(BucketBackend):
+    """Keeps the buckets in memory, shared by the threads of a process."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: str, rate: float, burst: float, now: float
+    ) -> float:
+        with self._lock:
+            state, delay = self._take(self._buckets.get(key), rate, burst, now)
+            self._buckets[key] = state
+        return delay
+
+    def release(self, key: str, burst: float) -> None:
+        with self._lock:
+            state = self._give_back(self._buckets.get(key), burst)
+            if state is not None:
+                self._buckets[key] = state
+
+
+class FileBucketBackend(BucketBackend):
+    """Keeps the buckets in a file, shared by the processes of a host.
+
+    The file is locked with flock() while a bucket is updated, so this
+    backend is only available on POSIX systems. Use a local file system:
+    the lock does not work reliably on network file systems.
+    """
+
+    def __init__(self, path: str) -> None:
+        if fcntl is None:
+            raise RequestSetupError(
+                "The file backend for rate limiting requires fcntl, which "
+                "is not available on this platform."
+            )
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: str, rate: float, burst: float, now: float
+    ) -> float:
+        delay = 0.0
+
+        def take(state: Optional[List[float]]) -> Optional[List[float]]:
+            nonlocal delay
+            state, delay = self._take(state, rate, burst, now)
+            return state
+
+        self._update(key, take)
+        return delay
+
+    def release(self, key: str, burst: float) -> None:
+        self._update(key, lambda state: self._give_back(state, burst))
+
+    def _update(
+        self,
+        key: str,
+        change: Callable[[Optional[List[float]]], Optional[List[float]]],
+    ) -> None:
+        """Change the state of a bucket while the file is locked."""
+        # The file is opened for every update: a file descriptor inherited
+        # through fork() would share its lock with the parent process.
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(fd, "r+", closefd=False) as file:
+                    try:
+                        buckets = json.loads(file.read() or "{}")
+                    except ValueError:
+                        buckets = {}
+                    state = change(buckets.get(key))
+                    if state is None:
+                        return
+                    buckets[key] = state
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(buckets))
+            finally:
+                os.close(fd)
+
+
+class RateLimiter:
+    """Token buckets that limit the API calls per API key or access token.
+
+    Reads (GET requests) and writes (all other requests) have their own
+    budget. The buckets allow bursts of `read_burst` and `write_burst`
+    calls, and are refilled at `read_rate` and `write_rate` calls per
+    second:
+
+        client.set_rate_limiter(RateLimiter(read_rate=20, write_rate=5))
+
+    To share the budget between the worker processes of a host, use a
+    FileBucketBackend:
+
+        limiter = RateLimiter(backend=FileBucketBackend("/tmp/mollie.rate"))
+
+    The statistics:
+    - calls: the number of calls that took a token.
+    - waits: the number of calls that waited for a token.
+    - wait_seconds: the total time spent waiting for tokens.
+    - max_wait_seconds: the longest wait for a token.
+    - released: the number of tokens given back by calls that were
+      cancelled or ran out of time while waiting.
+    """
+
+    def __init__(
+        self,
+        read_rate: float = 25,
+        write_rate: float = 10,
+        read_burst: Optional[float] = None,
+        write_burst: Optional[float] = None,
+        backend: Optional[BucketBackend] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param read_rate: Reads per second (float).
+        :param write_rate: Writes per second (float).
+        :param read_burst: Reads allowed at once, defaults to read_rate.
+        :param write_burst: Writes allowed at once, defaults to write_rate.
+        :param backend: Where the buckets are kept, defaults to memory.
+        :param clock: The time in seconds, it must be the same for all
+            processes that share a backend.
+        """
+        self.budgets = {
+            "read": (read_rate, read_burst or read_rate),
+            "write": (write_rate, write_burst or write_rate),
+        }
+        self.backend = backend or MemoryBucketBackend()
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "released": 0,
+        }
+
+    def reserve(self, credential: str, http_method: str) -> float:
+        """Take a token for an API call, and return the seconds to wait
+        before performing it."""
+        key, rate, burst = self._get_bucket(credential, http_method)
+        delay = self.backend.reserve(key, rate, burst, self.clock())
+        with self._lock:
+            self._stats["calls"] += 1
+            if delay > 0:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += delay
+                self._stats["max_wait_seconds"] = max(
+                    self._stats["max_wait_seconds"], delay
+                )
+        return delay
+
+    def release(self, credential: str, http_method: str) -> None:
+        """Give back the token of a call that waited for it, but was not
+        performed."""
+        key, _, burst = self._get_bucket(credential, http_method)
+        self.backend.release(key, burst)
+        with self._lock:
+            self._stats["released"] += 1
+
+    def _get_bucket(
+        self, credential: str, http_method: str
+    ) -> Tuple[str, float, float]:
+        """Return the key, rate and burst of the bucket for a call."""
+        kind = "read" if http_method == "GET" else "write"
+        rate, burst = self.budgets[kind]
+        # Credentials are never stored, not even in a file backend.
+        digest = hashlib.sha256(credential.encode("utf-8")).hexdigest()
+        return f"{digest[:32]}:{kind}", rate, burst
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Return the counters of calls and of the time spent waiting."""
+        with self._lock:
+            return dict(self._stats)
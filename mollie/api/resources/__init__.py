@@ -1,20 +1,62 @@
-from .balances import *  # noqa: F401, F403
-from .captures import *  # noqa: F401, F403
-from .chargebacks import *  # noqa: F401, F403
-from .clients import *  # noqa: F401, F403
-from .customers import *  # noqa: F401, F403
-from .invoices import *  # noqa: F401, F403
-from .mandates import *  # noqa: F401, F403
-from .methods import *  # noqa: F401, F403
-from .onboarding import *  # noqa: F401, F403
-from .order_lines import *  # noqa: F401, F403
-from .orders import *  # noqa: F401, F403
-from .organizations import *  # noqa: F401, F403
-from .payment_links import *  # noqa: F401, F403
-from .payments import *  # noqa: F401, F403
-from .permissions import *  # noqa: F401, F403
-from .profiles import *  # noqa: F401, F403
-from .refunds import *  # noqa: F401, F403
-from .settlements import *  # noqa: F401, F403
-from .shipments import *  # noqa: F401, F403
-from .subscriptions import *  # noqa: F401, F403
+import importlib
+from typing import Any, Dict, List
+
+# The module of every resource class. A module is imported when one of its
+# classes is first used, so importing the client does not import them all.
+_MODULES: Dict[str, str] = {
+    "Balances": "balances",
+    "BalanceReports": "balances",
+    "BalanceTransactions": "balances",
+    "PaymentCaptures": "captures",
+    "SettlementCaptures": "captures",
+    "Chargebacks": "chargebacks",
+    "PaymentChargebacks": "chargebacks",
+    "ProfileChargebacks": "chargebacks",
+    "SettlementChargebacks": "chargebacks",
+    "Clients": "clients",
+    "Customers": "customers",
+    "Invoices": "invoices",
+    "CustomerMandates": "mandates",
+    "Methods": "methods",
+    "ProfileMethods": "methods",
+    "Onboarding": "onboarding",
+    "OrderLines": "order_lines",
+    "Orders": "orders",
+    "Organizations": "organizations",
+    "PaymentLinks": "payment_links",
+    "CustomerPayments": "payments",
+    "OrderPayments": "payments",
+    "Payments": "payments",
+    "ProfilePayments": "payments",
+    "SettlementPayments": "payments",
+    "SubscriptionPayments": "payments",
+    "Permissions": "permissions",
+    "Profiles": "profiles",
+    "OrderRefunds": "refunds",
+    "PaymentRefunds": "refunds",
+    "ProfileRefunds": "refunds",
+    "Refunds": "refunds",
+    "SettlementRefunds": "refunds",
+    "Settlements": "settlements",
+    "OrderShipments": "shipments",
+    "CustomerSubscriptions": "subscriptions",
+    "Subscriptions": "subscriptions",
+}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
@@ -1,13 +1,37 @@
+import contextvars
+import json
 import logging
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from mollie.api.objects.base import ObjectBase
 
-from ..error import IdentifierError, ResponseError, ResponseHandlingError
-from ..objects.list import PaginationList
+from ..error import (
+    Error,
+    IdentifierError,
+    ResponseError,
+    ResponseHandlingError,
+)
+from ..objects.list import PaginationList, StreamingPaginationList
 
 if TYPE_CHECKING:
+    import requests
+
+    from ..cache import ResponseCache
     from ..client import Client
 
 
@@ -22,6 +46,19 @@ class ResourceBase:
 
     RESOURCE_ID_PREFIX: str = ""
 
+    # Seconds to keep GET responses in the response cache of the client,
+    # 0 for resources that should not be cached.
+    CACHE_TTL: float = 0
+
+    # Whether objects of this resource are kept in the object cache of the
+    # client, see ObjectCache.
+    OBJECT_CACHE: bool = False
+
+    # Seconds to keep objects with a status in the object cache, None to
+    # keep them until they are invalidated. Other statuses use the default
+    # TTL of the cache.
+    STATUS_TTLS: Dict[str, Optional[float]] = {}
+
     object_type: Type[ObjectBase]
 
     def __init__(self, client: "Client") -> None:
@@ -39,14 +76,142 @@ class ResourceBase:
         params: Optional[Dict[str, Any]] = None,
         idempotency_key: str = "",
     ) -> Dict[str, Any]:
+        if params and "deadline" in params:
+            params = dict(params)
+            with self.client.deadline(params.pop("deadline")):
+                return self.perform_api_call(
+                    http_method, path, data, params, idempotency_key
+                )
+        if params and "coalesce" in params:
+            params = dict(params)
+            with self.client.coalescing(params.pop("coalesce")):
+                return self.perform_api_call(
+                    http_method, path, data, params, idempotency_key
+                )
+
+        cache = self.client.response_cache
+        if cache is not None and self.CACHE_TTL:
+            if http_method == self.REST_READ:
+                ttl = cache.get_ttl(type(self).__name__, self.CACHE_TTL)
+                if ttl > 0:
+                    return self._perform_cached_api_call(
+                        cache, ttl, path, params
+                    )
+            else:
+                # The change may affect any of the cached responses.
+                cache.clear()
+
         resp = self.client.perform_http_call(
             http_method, path, data, params, idempotency_key
         )
+        return self._handle_response(resp, idempotency_key)
+
+    def _perform_cached_api_call(
+        self,
+        cache: "ResponseCache",
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        key = (
+            self.client._get_credential_key(),
+            str(self.client.testmode),
+            path,
+            json.dumps(params or {}, sort_keys=True, default=str),
+        )
+        body, etag = cache.lookup(key)
+        if body is not None:
+            return self.client.json_codec.loads(body)
+
+        headers = {"If-None-Match": etag} if etag else None
+        resp = self.client.perform_http_call(
+            self.REST_READ, path, params=params, headers=headers
+        )
+        if etag and resp.status_code == 304:
+            body = cache.renew(key, ttl)
+            if body is not None:
+                return self.client.json_codec.loads(body)
+            # The entry was evicted in the meantime.
+            resp = self.client.perform_http_call(
+                self.REST_READ, path, params=params
+            )
+        result = self._handle_response(resp, "")
+        cache.store(key, resp.content, ttl, resp.headers.get("ETag", ""))
+        return result
+
+    def _get_object_cache_key(self, resource_id: str) -> Tuple[str, ...]:
+        return (
+            self.client._get_credential_key(),
+            str(self.client.testmode),
+            resource_id,
+        )
+
+    def _get_cached_object(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        cache = self.client.object_cache
+        if cache is None or not self.OBJECT_CACHE:
+            return None
+        return cache.lookup(self._get_object_cache_key(resource_id))
+
+    def _cache_object(self, result: Dict[str, Any]) -> None:
+        """Store an object returned by the API in the object cache."""
+        cache = self.client.object_cache
+        if cache is None or not self.OBJECT_CACHE or "id" not in result:
+            return
+        ttl = cache.get_ttl(
+            self.object_type.__name__,
+            result.get("status", ""),
+            self.STATUS_TTLS,
+        )
+        cache.store(self._get_object_cache_key(result["id"]), result, ttl)
+
+    def _invalidate_cached_object(self, resource_id: str) -> None:
+        cache = self.client.object_cache
+        if cache is not None:
+            cache.invalidate(resource_id)
+
+    def perform_streaming_api_call(
+        self,
+        http_method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> "requests.Response":
+        """Perform an API call, but leave reading the response body to the
+        caller.
+
+        Error responses are read and raised like in perform_api_call(). The
+        caller must close a successful response when it is done with it.
+        """
+        if params and "deadline" in params:
+            params = dict(params)
+            with self.client.deadline(params.pop("deadline")):
+                return self.perform_streaming_api_call(
+                    http_method, path, params
+                )
+
+        resp = self.client.perform_http_call(
+            http_method, path, params=params, stream=True
+        )
+        if resp.status_code < 200 or resp.status_code > 299:
+            try:
+                self._handle_response(resp, "")
+            finally:
+                resp.close()
+        return resp
+
+    def _handle_response(
+        self, resp: "requests.Response", idempotency_key: str
+    ) -> Dict[str, Any]:
+        """Decode the response body and raise errors reported by the API."""
         if "application/hal+json" in resp.headers.get("Content-Type", ""):
             # set the content type according to the media type definition
             resp.encoding = "utf-8"
         try:
-            result = resp.json() if resp.status_code != 204 else {}
+            # decode the raw body, without converting it to text first
+            result = (
+                self.client.json_codec.loads(resp.content)
+                if resp.status_code != 204
+                else {}
+            )
         except Exception:
             raise ResponseHandlingError(
                 f"Unable to decode Mollie API response (status code: {resp.status_code}): '{resp.text}'.",
@@ -106,16 +271,130 @@ class ResourceCreateMixin(ResourceBase):
             params,
             idempotency_key=idempotency_key,
         )
+        self._cache_object(result)
         return self.object_type(result, self.client)
 
 
 class ResourceGetMixin(ResourceBase):
+    # get_many() scans the list of a resource when it is asked for at least
+    # this many objects, and keeps scanning while at least this fraction of
+    # the objects on a page was asked for.
+    GET_MANY_SCAN_MIN_IDS: int = 100
+    GET_MANY_SCAN_RATIO: float = 0.2
+    GET_MANY_SCAN_LIMIT: int = 250
+
     def get(self, resource_id: str, **params: Any) -> Any:
+        if "deadline" in params:
+            with self.client.deadline(params.pop("deadline")):
+                return self.get(resource_id, **params)
+        if "coalesce" in params:
+            with self.client.coalescing(params.pop("coalesce")):
+                return self.get(resource_id, **params)
+        use_cache = params.pop("cache", True)
+
+        if not params and use_cache:
+            cached = self._get_cached_object(resource_id)
+            if cached is not None:
+                return self.object_type(cached, self.client)
+
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{resource_id}"
         result = self.perform_api_call(self.REST_READ, path, params=params)
+        if not params:
+            self._cache_object(result)
         return self.object_type(result, self.client)
 
+    def get_many(
+        self,
+        resource_ids: Iterable[str],
+        max_concurrency: int = 8,
+        scan: bool = True,
+        **params: Any,
+    ) -> "OrderedDict[str, Any]":
+        """Retrieve many objects, using up to `max_concurrency` threads.
+
+        The objects are returned by ID, in the order of the IDs. When an
+        object cannot be retrieved, its error is returned in its place and
+        the other objects are still retrieved.
+
+        For many IDs, the newest objects are listed first: when most of the
+        objects on the first pages were asked for, listing them takes fewer
+        API calls than retrieving them one by one. The objects that are not
+        found on these pages are retrieved individually. Listing is skipped
+        when parameters are given, or with `scan=False`.
+
+        :param resource_ids: The IDs of the objects to retrieve.
+        :param max_concurrency: The maximum number of API calls in flight.
+        :param scan: Whether the list of the resource may be scanned.
+        """
+        if "deadline" in params:
+            # All objects are retrieved within the deadline.
+            with self.client.deadline(params.pop("deadline")):
+                return self.get_many(
+                    resource_ids, max_concurrency, scan, **params
+                )
+
+        ids: List[str] = list(dict.fromkeys(resource_ids))
+        results: Dict[str, Any] = {}
+        if scan and not params and len(ids) >= self.GET_MANY_SCAN_MIN_IDS:
+            results.update(self._scan_list(ids))
+
+        remaining = [
+            resource_id for resource_id in ids if resource_id not in results
+        ]
+        if remaining:
+            workers = max(1, min(max_concurrency, len(remaining)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Every call gets its own copy of the context, so the
+                # cancellation and the deadline of the caller apply to it.
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._get_or_error,
+                        resource_id,
+                        params,
+                    )
+                    for resource_id in remaining
+                ]
+                for resource_id, future in zip(remaining, futures):
+                    results[resource_id] = future.result()
+
+        return OrderedDict(
+            (resource_id, results[resource_id]) for resource_id in ids
+        )
+
+    def _get_or_error(
+        self, resource_id: str, params: Dict[str, Any]
+    ) -> Union[Any, Error]:
+        try:
+            return self.get(resource_id, **params)
+        except Error as err:
+            return err
+
+    def _scan_list(self, ids: List[str]) -> Dict[str, Any]:
+        """Find objects in the list, for as long as the pages are dense."""
+        list_objects = getattr(self, "list", None)
+        if list_objects is None:
+            return {}
+
+        wanted = set(ids)
+        found: Dict[str, Any] = {}
+        page: Optional[PaginationList] = list_objects(
+            limit=self.GET_MANY_SCAN_LIMIT
+        )
+        while page is not None:
+            matches = 0
+            for item in page:
+                if item.id in wanted:
+                    found[item.id] = item
+                    matches += 1
+            if len(found) == len(wanted):
+                break
+            if matches < (page.count or 0) * self.GET_MANY_SCAN_RATIO:
+                break
+            page = page.get_next()
+        return found
+
     def from_url(
         self, url: str, params: Optional[Dict[str, Any]] = None
     ) -> Any:
@@ -135,6 +414,81 @@ class ResourceListMixin(ResourceBase):
         result = self.perform_api_call(self.REST_LIST, path, params=params)
         return PaginationList(result, self, self.client)
 
+    def list_all(self, prefetch: int = 1, **params: Any) -> Iterator[Any]:
+        """Iterate all objects, retrieving the next pages in the background.
+
+        See PaginationList.iterate_all() for the prefetch parameter. Use the
+        `limit` parameter to set the number of objects per page.
+        """
+        return self.list(**params).iterate_all(prefetch)
+
+    def stream(self, **params: Any) -> StreamingPaginationList:
+        """List objects like list(), but parse the response while iterating.
+
+        Only one object of the page is decoded at a time, so the memory
+        used does not grow with the page size (the `limit` parameter).
+        """
+        path = self.get_resource_path()
+        resp = self.perform_streaming_api_call(
+            self.REST_LIST, path, params=params
+        )
+        return StreamingPaginationList(resp, self, self.client)
+
+
+class ResourceListSinceMixin(ResourceBase):
+    """Iterate lists up to a cutoff, for resources that are listed newest
+    first.
+
+    The resource provides the list() method, either through
+    ResourceListMixin or by itself.
+    """
+
+    def list_since(
+        self,
+        created_after: Union[datetime, str, None] = None,
+        until_id: str = "",
+        **params: Any,
+    ) -> Iterator[Any]:
+        """Iterate the objects that were created since a previous scan.
+
+        Objects are listed newest first, so the iteration stops at the first
+        object that was created at or before `created_after`, or at the
+        object with the ID `until_id`. That object is not returned, and no
+        further pages are retrieved. To start at an older object instead of
+        the newest, pass its ID in the `from` parameter.
+
+        :param created_after: A datetime or an ISO 8601 timestamp, naive
+            datetimes are taken to be UTC.
+        :param until_id: The ID of the newest object of the previous scan.
+        """
+        cutoff = None
+        if created_after is not None:
+            cutoff = _parse_timestamp(created_after)
+
+        page: Optional[PaginationList] = self.list(**params)
+        while page is not None:
+            for item in page:
+                if until_id and item.id == until_id:
+                    return
+                if (
+                    cutoff is not None
+                    and _parse_timestamp(item.created_at) <= cutoff
+                ):
+                    return
+                yield item
+            page = page.get_next()
+
+
+def _parse_timestamp(value: Union[datetime, str]) -> datetime:
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            # datetime.fromisoformat() accepts 'Z' from Python 3.11 on.
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
 
 class ResourceUpdateMixin(ResourceBase):
     def update(
@@ -154,6 +508,7 @@ class ResourceUpdateMixin(ResourceBase):
             params,
             idempotency_key=idempotency_key,
         )
+        self._cache_object(result)
         return self.object_type(result, self.client)
 
 
@@ -164,9 +519,15 @@ class ResourceDeleteMixin(ResourceBase):
         idempotency_key = idempotency_key or self._generate_idempotency_key()
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{resource_id}"
-        return self.perform_api_call(
+        result = self.perform_api_call(
             self.REST_DELETE,
             path,
             params=params,
             idempotency_key=idempotency_key,
         )
+        if result:
+            # Canceling payments and orders returns the updated object.
+            self._cache_object(result)
+        elif self.OBJECT_CACHE:
+            self._invalidate_cached_object(resource_id)
+        return result
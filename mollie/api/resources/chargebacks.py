@@ -2,7 +2,12 @@ from typing import TYPE_CHECKING, Any
 
 from ..objects.chargeback import Chargeback
 from ..objects.list import PaginationList
-from .base import ResourceBase, ResourceGetMixin, ResourceListMixin
+from .base import (
+    ResourceBase,
+    ResourceGetMixin,
+    ResourceListMixin,
+    ResourceListSinceMixin,
+)
 
 if TYPE_CHECKING:
     from ..client import Client
@@ -23,7 +28,7 @@ class ChargebacksBase(ResourceBase):
     object_type = Chargeback
 
 
-class Chargebacks(ChargebacksBase, ResourceListMixin):
+class Chargebacks(ChargebacksBase, ResourceListMixin, ResourceListSinceMixin):
     """Resource handler for the `/chargebacks` endpoint."""
 
 
@@ -59,7 +64,7 @@ class SettlementChargebacks(ChargebacksBase, ResourceListMixin):
         return f"settlements/{self._settlement.id}/chargebacks"
 
 
-class ProfileChargebacks(ChargebacksBase):
+class ProfileChargebacks(ChargebacksBase, ResourceListSinceMixin):
     """Resource handler for the `/chargebacks?profileId=:profile_id:` endpoint.
 
     This is separate from the `Chargebacks` resource handler to make it easier to inject the profileId.
@@ -6,6 +6,7 @@ from .base import (
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
     ResourceUpdateMixin,
 )
 
@@ -15,6 +16,7 @@ class Customers(
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
     ResourceUpdateMixin,
 ):
     """Resource handler for the `/customers` endpoint."""
@@ -19,6 +19,7 @@ __all__ = [
 
 class MethodsBase(ResourceBase):
     object_type = Method
+    CACHE_TTL: float = 300
 
 
 class Methods(MethodsBase, ResourceGetMixin, ResourceListMixin):
@@ -51,6 +52,11 @@ class ProfileMethods(MethodsBase):
     def get_resource_path(self) -> str:
         return f"profiles/{self._profile.id}/methods"
 
+    def _invalidate_catalog(self) -> None:
+        """Drop the cached methods of the profile from the catalog."""
+        if self.client.methods_catalog is not None:
+            self.client.methods_catalog.invalidate(self._profile.id)
+
     def enable(self, method_id: str, **params: Any) -> Method:
         """Enable payment method for profile.
 
@@ -68,6 +74,7 @@ class ProfileMethods(MethodsBase):
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{method_id}"
         result = self.perform_api_call(self.REST_CREATE, path, params=params)
+        self._invalidate_catalog()
         return Method(result, self.client)
 
     def disable(self, method_id: str, **params: Any) -> Method:
@@ -87,6 +94,7 @@ class ProfileMethods(MethodsBase):
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{method_id}"
         result = self.perform_api_call(self.REST_DELETE, path, params=params)
+        self._invalidate_catalog()
         return Method(result, self.client)
 
     def list(self, **params: Any) -> PaginationList:
@@ -121,6 +129,7 @@ class ProfileMethods(MethodsBase):
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{method_id}/issuers/{issuer_id}"
         result = self.perform_api_call(self.REST_CREATE, path, data, params)
+        self._invalidate_catalog()
         return Issuer(result, self.client)
 
     def disable_issuer(
@@ -144,4 +153,5 @@ class ProfileMethods(MethodsBase):
         resource_path = self.get_resource_path()
         path = f"{resource_path}/{method_id}/issuers/{issuer_id}"
         result = self.perform_api_call(self.REST_DELETE, path, params=params)
+        self._invalidate_catalog()
         return Issuer(result, self.client)
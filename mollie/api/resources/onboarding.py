@@ -14,6 +14,7 @@ class Onboarding(ResourceGetMixin):
     """Resource handler for the `/onboarding` endpoint."""
 
     object_type = OnboardingObject
+    CACHE_TTL: float = 60
 
     def get(self, resource_id: str, **params: Any) -> OnboardingObject:
         if resource_id != "me":
@@ -65,9 +65,11 @@ class OrderLines(ResourceBase):
             data = {"lines": []}
 
         path = self.get_resource_path()
-        return self.perform_api_call(
+        result = self.perform_api_call(
             self.REST_DELETE, path, data=data, params=params
         )
+        self._invalidate_cached_object(self._order.id)
+        return result
 
     def delete(self, order_line_id: str, **params: Any) -> dict:
         """Cancel a single orderline.
@@ -103,6 +105,7 @@ class OrderLines(ResourceBase):
         result = self.perform_api_call(
             self.REST_UPDATE, path, data=data, params=params
         )
+        self._invalidate_cached_object(self._order.id)
 
         for line in result["lines"]:
             if line["id"] == order_line_id:
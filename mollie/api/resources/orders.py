@@ -24,6 +24,13 @@ class Orders(
     """Resource handler for the `/orders` endpoint."""
 
     RESOURCE_ID_PREFIX: str = "ord_"
+    OBJECT_CACHE: bool = True
+    # A paid or authorized order still changes while it is shipped.
+    STATUS_TTLS: Dict[str, Optional[float]] = {
+        "completed": 3600,
+        "canceled": 3600,
+        "expired": 3600,
+    }
     object_type = Order
 
     def get(self, resource_id: str, **params: Any) -> Order:
@@ -13,6 +13,7 @@ class Organizations(ResourceGetMixin):
 
     RESOURCE_ID_PREFIX: str = "org_"
     object_type = Organization
+    CACHE_TTL: float = 3600
 
     def get(self, resource_id: str, **params: Any) -> Organization:
         if resource_id != "me":
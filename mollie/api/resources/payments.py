@@ -12,6 +12,7 @@ from .base import (
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
     ResourceUpdateMixin,
 )
 
@@ -31,6 +32,14 @@ __all__ = [
 
 class PaymentsBase(ResourceBase):
     RESOURCE_ID_PREFIX: str = "tr_"
+    OBJECT_CACHE: bool = True
+    # Only refunds and chargebacks change a payment with a final status.
+    STATUS_TTLS: Dict[str, Optional[float]] = {
+        "paid": 3600,
+        "failed": 3600,
+        "canceled": 3600,
+        "expired": 3600,
+    }
     object_type = Payment
 
 
@@ -40,6 +49,7 @@ class Payments(
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
     ResourceUpdateMixin,
 ):
     """Resource handler for the `/payments` endpoint."""
@@ -148,7 +158,7 @@ class SettlementPayments(PaymentsBase, ResourceListMixin):
         return f"settlements/{self._settlement.id}/payments"
 
 
-class ProfilePayments(PaymentsBase):
+class ProfilePayments(PaymentsBase, ResourceListSinceMixin):
     """Resource handler for the `/payments?profileId=:profile_id:` endpoint.
 
     This is separate from the `Payments` resource handler to make it easier to inject the profileId.
@@ -14,6 +14,7 @@ class Permissions(ResourceGetMixin, ResourceListMixin):
     """Resource handler for the `/permissions` endpoint."""
 
     object_type = Permission
+    CACHE_TTL: float = 3600
 
     @staticmethod
     def validate_permission_id(permission_id: str) -> None:
@@ -25,6 +25,7 @@ class Profiles(
 
     RESOURCE_ID_PREFIX: str = "pfl_"
     object_type = Profile
+    CACHE_TTL: float = 300
 
     def get(self, resource_id: str, **params: Any) -> Profile:
         if resource_id != "me":
@@ -11,6 +11,7 @@ from .base import (
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
 )
 
 if TYPE_CHECKING:
@@ -31,7 +32,7 @@ class RefundsBase(ResourceBase):
     object_type = Refund
 
 
-class Refunds(RefundsBase, ResourceListMixin):
+class Refunds(RefundsBase, ResourceListMixin, ResourceListSinceMixin):
     """Resource handler for the `/refunds` endpoint."""
 
 
@@ -41,6 +42,7 @@ class PaymentRefunds(
     ResourceDeleteMixin,
     ResourceGetMixin,
     ResourceListMixin,
+    ResourceListSinceMixin,
 ):
     """Resource handler for the `/payments/:payment_id:/refunds` endpoint."""
 
@@ -53,6 +55,17 @@ class PaymentRefunds(
     def get_resource_path(self) -> str:
         return f"payments/{self._payment.id}/refunds"
 
+    def create(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: str = "",
+        **params: Any,
+    ) -> Refund:
+        refund = super().create(data, idempotency_key, **params)
+        # The refund changes the amounts of the payment.
+        self._invalidate_cached_object(self._payment.id)
+        return refund
+
     def get(self, resource_id: str, **params: Any) -> Refund:
         self.validate_resource_id(resource_id, "Refund ID")
         return super().get(resource_id, **params)
@@ -61,7 +74,9 @@ class PaymentRefunds(
         self, resource_id: str, idempotency_key: str = "", **params: Any
     ) -> dict:
         self.validate_resource_id(resource_id, "Refund ID")
-        return super().delete(resource_id, idempotency_key, **params)
+        result = super().delete(resource_id, idempotency_key, **params)
+        self._invalidate_cached_object(self._payment.id)
+        return result
 
 
 class OrderRefunds(RefundsBase, ResourceCreateMixin, ResourceListMixin):
@@ -89,7 +104,10 @@ class OrderRefunds(RefundsBase, ResourceCreateMixin, ResourceListMixin):
         """
         if not data:
             data = {"lines": []}
-        return super().create(data, idempotency_key, **params)
+        refund = super().create(data, idempotency_key, **params)
+        # The refund changes the amounts of the order.
+        self._invalidate_cached_object(self._order.id)
+        return refund
 
 
 class SettlementRefunds(RefundsBase, ResourceListMixin):
@@ -106,7 +124,7 @@ class SettlementRefunds(RefundsBase, ResourceListMixin):
         return f"settlements/{self._settlement.id}/refunds"
 
 
-class ProfileRefunds(RefundsBase):
+class ProfileRefunds(RefundsBase, ResourceListSinceMixin):
     """Resource handler for the `/refunds?profileId=:profile_id:` endpoint.
 
     This is separate from the `Refunds` resource handler to make it easier to inject the profileId.
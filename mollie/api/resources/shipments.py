@@ -50,7 +50,9 @@ class OrderShipments(
         """
         if data is None:
             data = {"lines": []}
-        return super().create(data, idempotency_key, **params)
+        shipment = super().create(data, idempotency_key, **params)
+        self._invalidate_cached_object(self._order.id)
+        return shipment
 
     def get(self, resource_id: str, **params: Any) -> Shipment:
         self.validate_resource_id(resource_id, "shipment ID")
@@ -0,0 +1,192 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+
+__all__ = [
+    "RetryBudget",
+    "RetryPolicy",
+]
+
+
+class RetryBudget:
+    """Limits the retries (or other extra requests) to a fraction of the
+    requests.
+
+    Every request adds `ratio` to the balance, every retry takes 1 from it.
+    The balance also grows by `min_per_second`, so that a client with few
+    requests can still retry. During an outage, when most requests fail,
+    the balance is exhausted and the failures are no longer multiplied by
+    retries.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1,
+        capacity: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.clock = clock
+        self._balance = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._balance = min(
+            self.capacity,
+            self._balance + (now - self._updated) * self.min_per_second,
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._refill()
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget, return False when it is spent."""
+        with self._lock:
+            self._refill()
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides which failed API calls are retried, and when.
+
+    A call is retried when the API responds with one of the `statuses`
+    (throttling or an unavailable gateway), and it is safe to send it
+    again: GET requests, and requests with an Idempotency-Key. The delay
+    before a retry follows the Retry-After header of the response when it
+    has one, otherwise it grows with decorrelated jitter between
+    `base_delay` and `max_delay`. Retries are limited by a RetryBudget,
+    share a policy between clients to share its budget:
+
+        client.set_retry_policy(RetryPolicy(max_attempts=4))
+
+    The statistics:
+    - retries: the number of retries performed.
+    - budget_exhausted: the number of retries skipped for the budget.
+    - gave_up: the number of calls that failed after all attempts.
+    """
+
+    DEFAULT_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET"})
+    IDEMPOTENCY_KEY_METHODS: FrozenSet[str] = frozenset(
+        {"POST", "PATCH", "DELETE"}
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        statuses: Iterable[int] = DEFAULT_STATUSES,
+        base_delay: float = 0.25,
+        max_delay: float = 10,
+        max_retry_after: float = 30,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        :param max_attempts: The maximum number of attempts of a call,
+            including the first one (int).
+        :param base_delay: The minimum delay before a retry (float).
+        :param max_delay: The maximum delay computed with jitter (float).
+        :param max_retry_after: A call is not retried when the API asks to
+            wait longer than this (float).
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget or RetryBudget()
+        self._lock = threading.Lock()
+        self._stats = {
+            "retries": 0,
+            "budget_exhausted": 0,
+            "gave_up": 0,
+        }
+
+    def is_retryable(self, http_method: str, idempotency_key: str) -> bool:
+        """Return whether a call can be sent more than once."""
+        if http_method in self.IDEMPOTENT_METHODS:
+            return True
+        return (
+            bool(idempotency_key)
+            and http_method in self.IDEMPOTENCY_KEY_METHODS
+        )
+
+    def get_delay(
+        self,
+        attempt: int,
+        status_code: int,
+        headers: Dict[str, str],
+        previous_delay: float,
+    ) -> Optional[float]:
+        """Return the seconds to wait before the next attempt of a call, or
+        None when the call should not be retried.
+
+        :param attempt: The number of the attempt that failed, from 1.
+        :param previous_delay: The delay before the attempt that failed, 0
+            for the first attempt.
+        """
+        if status_code not in self.statuses:
+            return None
+        if attempt >= self.max_attempts:
+            self._count("gave_up")
+            return None
+
+        # Decorrelated jitter: spread the retries of concurrent callers.
+        delay = min(
+            self.max_delay,
+            random.uniform(
+                self.base_delay, max(self.base_delay, previous_delay * 3)
+            ),
+        )
+        retry_after = self._parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                self._count("gave_up")
+                return None
+            delay = max(delay, retry_after)
+
+        if not self.budget.withdraw():
+            self._count("budget_exhausted")
+            return None
+        self._count("retries")
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse the seconds or the HTTP date of a Retry-After header."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(
+                0.0, parsedate_to_datetime(value).timestamp() - time.time()
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the counters of retries and of calls that were not
+        retried."""
+        with self._lock:
+            return dict(self._stats)
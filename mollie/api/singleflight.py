@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+__all__ = [
+    "SingleFlight",
+]
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Shares one call between the threads that make it at the same time.
+
+    The first thread to call do() with a key performs the call, the threads
+    that call do() with the same key while it is in flight wait for it and
+    receive the same result, or the same exception. The call is not
+    remembered once it has finished, so this is not a cache.
+
+    The statistics:
+    - calls: the number of calls that were performed.
+    - saved_calls: the number of calls that were shared instead.
+    - in_flight: the number of calls that are currently in flight.
+    """
+
+    # Seconds between the checks of a waiting thread, see do().
+    POLL_INTERVAL: float = 0.05
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "saved_calls": 0,
+        }
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        check: Optional[Callable[[], None]] = None,
+    ) -> Any:
+        """Return the result of func(), sharing it with identical calls.
+
+        :param key: The key of identical calls.
+        :param func: The call to perform.
+        :param check: Called regularly while waiting for the call of another
+            thread, it can raise an exception to stop waiting.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats["saved_calls"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            while not call.done.wait(self.POLL_INTERVAL):
+                if check is not None:
+                    check()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the counters of performed and shared calls."""
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
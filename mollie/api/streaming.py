@@ -0,0 +1,135 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .error import ResponseHandlingError
+
+__all__ = [
+    "iter_hal_list",
+]
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _StreamReader:
+    """Decodes JSON values one at a time from a stream of byte chunks.
+
+    Only the part of the stream that has not been decoded yet is kept in
+    memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, return False at the end of the stream."""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            chunk = b""
+        text = self._decoder.decode(chunk, final=self._eof)
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace."""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ResponseHandlingError(
+                    "Unexpected end of Mollie API response."
+                )
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ResponseHandlingError(
+                f"Unable to decode Mollie API response: expected '{char}' "
+                f"at '{self._buffer[self._pos : self._pos + 20]}'."
+            )
+        self._pos += 1
+
+    def skip(self, char: str) -> bool:
+        """Consume the next character when it matches."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                if self._fill():
+                    continue
+                raise ResponseHandlingError(
+                    f"Unable to decode Mollie API response: {err}."
+                )
+            if (
+                isinstance(value, (int, float))
+                and (
+                    end == len(self._buffer)
+                    or self._buffer[end] in _NUMBER_CHARS
+                )
+                and self._fill()
+            ):
+                # The number could continue in the next chunk.
+                continue
+            self._pos = end
+            return value
+
+
+def iter_hal_list(
+    chunks: Iterable[bytes],
+    object_name: str,
+    fields: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a HAL list response while it is being received.
+
+    The items in `_embedded[object_name]` are yielded one at a time. All
+    other members of the response, such as `count` and `_links`, are stored
+    in `fields`, which is complete once the iteration has finished.
+    """
+    if fields is None:
+        fields = {}
+    reader = _StreamReader(chunks)
+    reader.expect("{")
+    while not reader.skip("}"):
+        reader.skip(",")
+        key = reader.value()
+        reader.expect(":")
+        if key != "_embedded":
+            fields[key] = reader.value()
+            continue
+
+        embedded = fields.setdefault("_embedded", {})
+        reader.expect("{")
+        while not reader.skip("}"):
+            reader.skip(",")
+            name = reader.value()
+            reader.expect(":")
+            if name != object_name:
+                embedded[name] = reader.value()
+                continue
+            reader.expect("[")
+            while not reader.skip("]"):
+                reader.skip(",")
+                yield reader.value()
@@ -0,0 +1,381 @@
+import io
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util import Retry
+
+from .error import RequestError
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = [
+    "InMemoryTransport",
+    "RequestsTransport",
+    "Transport",
+    "Urllib3Transport",
+]
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of a Client.
+
+    A transport returns a requests.Response, so the rest of the client does
+    not depend on how the request was sent. Errors while communicating are
+    raised as RequestError. Use Client.set_transport() to replace the
+    default RequestsTransport.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request.
+
+        :param url: The full URL, including the querystring.
+        :param data: The request body, empty for requests without one.
+        :param stream: Whether the body of the response is read by the
+            caller, instead of before returning.
+        """
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Return statistics of the connection pool, see PoolStatsAdapter."""
+        return {}
+
+    def close(self) -> None:
+        """Close the connections of the transport."""
+
+
+class RequestsTransport(Transport):
+    """Transport using a requests Session, such as the session the Client
+    creates with a PoolStatsAdapter, or an OAuth2Session."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        try:
+            return self.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                timeout=timeout,
+                stream=stream,
+            )
+        except requests.exceptions.RequestException as err:
+            raise RequestError(f"Unable to communicate with Mollie: {err}")
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        # Imported here, pool imports requests adapters only.
+        from .pool import PoolStatsAdapter
+
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, PoolStatsAdapter):
+                return adapter.get_stats()
+        return {}
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Transport using a urllib3 PoolManager directly.
+
+    This skips the preparation of requests and responses by requests
+    (sessions, hooks, cookies, proxies from the environment), which is a
+    large part of the time spent by the client on a request. Only API key
+    and access token authentication can use it: OAuth keeps its session.
+    Create it with the pool and retry settings of a client:
+
+        client.set_transport(Urllib3Transport.for_client(client))
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retries: Union[int, Retry] = 0,
+    ) -> None:
+        """
+        :param pool_connections: The number of connection pools to cache,
+            one pool is used per host (integer).
+        :param pool_maxsize: The maximum number of connections to keep open
+            in a pool (integer).
+        :param pool_block: Whether a request should wait for a free
+            connection when all connections are in use (boolean).
+        :param retries: The retries for connect errors, an int or a Retry
+            (such as the one returned by Client.get_retry()).
+        """
+        self.retries = (
+            retries
+            if isinstance(retries, Retry)
+            else Retry(total=retries, read=False, redirect=False)
+        )
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "in_use": 0,
+            "peak_in_use": 0,
+            "waits": 0,
+            "connections_opened": 0,
+        }
+        self.pool_maxsize = pool_maxsize
+        self.pool = urllib3.PoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=requests.certs.where(),
+        )
+        # Count the new connections and those in use, like PoolStatsAdapter.
+        self.pool.pool_classes_by_scheme = {
+            scheme: self._counting_pool_class(pool_class)
+            for scheme, pool_class in self.pool.pool_classes_by_scheme.items()
+        }
+
+    @classmethod
+    def for_client(cls, client: "Client") -> "Urllib3Transport":
+        """Return a transport with the connection pool settings and the
+        connect retries of a client, which stop at its deadline."""
+        return cls(
+            pool_connections=client.pool_connections,
+            pool_maxsize=client.pool_maxsize,
+            pool_block=client.pool_block,
+            retries=client.get_retry(),
+        )
+
+    def _counting_pool_class(
+        self, base: Type[HTTPConnectionPool]
+    ) -> Type[HTTPConnectionPool]:
+        transport = self
+
+        class CountingConnectionPool(base):  # type: ignore[valid-type,misc]
+            def _new_conn(self) -> Any:
+                with transport._stats_lock:
+                    transport._stats["connections_opened"] += 1
+                return super()._new_conn()
+
+            def _get_conn(self, *args: Any, **kwargs: Any) -> Any:
+                conn = super()._get_conn(*args, **kwargs)
+                with transport._stats_lock:
+                    stats = transport._stats
+                    stats["in_use"] += 1
+                    stats["peak_in_use"] = max(
+                        stats["peak_in_use"], stats["in_use"]
+                    )
+                return conn
+
+            def _put_conn(self, conn: Any) -> None:
+                with transport._stats_lock:
+                    transport._stats["in_use"] -= 1
+                super()._put_conn(conn)
+
+        return CountingConnectionPool
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            pool_timeout = urllib3.Timeout(connect=connect, read=read)
+        else:
+            pool_timeout = urllib3.Timeout(connect=timeout, read=timeout)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        with self._stats_lock:
+            stats = self._stats
+            if stats["in_use"] >= self.pool_maxsize:
+                stats["waits"] += 1
+            stats["requests"] += 1
+        try:
+            raw = self.pool.urlopen(
+                method,
+                url,
+                body=data or None,
+                headers=headers,
+                timeout=pool_timeout,
+                retries=self.retries,
+                redirect=False,
+                preload_content=not stream,
+                decode_content=True,
+            )
+        except urllib3.exceptions.HTTPError as err:
+            raise RequestError(f"Unable to communicate with Mollie: {err}")
+
+        response = requests.Response()
+        response.status_code = raw.status
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = raw.reason
+        response.url = url
+        response.raw = raw
+        if not stream:
+            response._content = raw.data
+        return response
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+class InMemoryTransport(Transport):
+    """Transport that answers requests with canned responses, without any
+    network I/O. Use it to test or benchmark code that uses the client:
+
+        transport = InMemoryTransport()
+        transport.add("GET", "payments/tr_7UhSN1zuXS", {"id": "tr_7UhSN1zuXS"})
+        client.set_transport(transport)
+
+    A response is chosen by the HTTP method and the path of the request,
+    after the API version. A response added with `prefix=True` also answers
+    the paths below its path, the longest matching path wins. Requests that
+    match no response are answered with a 404 error.
+
+    The method and URL of the last `max_requests` requests are kept in
+    `requests`, the total number of requests in `request_count`.
+    """
+
+    DEFAULT_MAX_REQUESTS: int = 1000
+
+    def __init__(self, max_requests: int = DEFAULT_MAX_REQUESTS) -> None:
+        self._responses: List[
+            Tuple[str, str, bool, int, Dict[str, str], bytes]
+        ] = []
+        self.requests: Deque[Tuple[str, str]] = deque(maxlen=max_requests)
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        body: Union[Dict[str, Any], bytes],
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        prefix: bool = False,
+    ) -> None:
+        """Add a canned response.
+
+        :param path: The path without the API version, such as 'payments'
+            or 'payments/tr_7UhSN1zuXS'.
+        :param body: The body as a dict, or as the raw bytes.
+        :param prefix: Whether to also answer the paths below the path.
+        """
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+        response_headers = {"Content-Type": "application/hal+json"}
+        response_headers.update(headers or {})
+        with self._lock:
+            self._responses.append(
+                (
+                    method,
+                    path.strip("/"),
+                    prefix,
+                    status,
+                    response_headers,
+                    body,
+                )
+            )
+            # Match the longest paths first.
+            self._responses.sort(key=lambda item: len(item[1]), reverse=True)
+
+    def _find(
+        self, method: str, path: str
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        with self._lock:
+            for (
+                response_method,
+                response_path,
+                prefix,
+                status,
+                headers,
+                body,
+            ) in self._responses:
+                if method == response_method and (
+                    path == response_path
+                    or (prefix and path.startswith(response_path + "/"))
+                ):
+                    return status, headers, body
+        body = json.dumps(
+            {
+                "status": 404,
+                "title": "Not Found",
+                "detail": f"No response for {method} {path}",
+            }
+        ).encode("utf-8")
+        return 404, {"Content-Type": "application/hal+json"}, body
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        # Drop the API version from the path.
+        path = urlsplit(url).path.strip("/").partition("/")[2]
+        with self._lock:
+            self.requests.append((method, url))
+            self.request_count += 1
+        status, headers, body = self._find(method, path)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response.raw = io.BytesIO(body)
+        if not stream:
+            response._content = body
+        return response
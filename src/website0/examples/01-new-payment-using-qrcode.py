@@ -4,8 +4,8 @@
 import os
 import time
 
-from mollie.api.client import Client
 from mollie.api.error import Error
+from src.website0.helper_mollie_client import get_mollie_client
 from src.website0.helper_mollie_database import database_write, get_public_url
 
 PUBLIC_URL = get_public_url()
@@ -19,8 +19,7 @@ def main():
         # See: https://www.mollie.com/dashboard/settings/profiles
         #
         api_key = os.environ.get("MOLLIE_API_KEY", "test_test")
-        mollie_client = Client()
-        mollie_client.set_api_key(api_key)
+        mollie_client = get_mollie_client(api_key=api_key)
 
         #
         # Generate a unique webshop order id for this example. It is important to include this unique attribute
@@ -6,8 +6,8 @@ import os
 
 import flask
 
-from mollie.api.client import Client
 from mollie.api.error import Error
+from src.website0.helper_mollie_client import get_mollie_client
 from src.website0.helper_mollie_database import database_write
 
 
@@ -19,8 +19,7 @@ def main():
         # See: https://www.mollie.com/dashboard/settings/profiles
         #
         api_key = os.environ.get("MOLLIE_API_KEY", "test_test")
-        mollie_client = Client()
-        mollie_client.set_api_key(api_key)
+        mollie_client = get_mollie_client(api_key=api_key)
 
         #
         # Retrieve the payment's current state.
@@ -29,7 +28,13 @@ def main():
             flask.abort(404, "Unknown payment id")
 
         payment_id = flask.request.form["id"]
-        payment = mollie_client.payments.get(payment_id)
+        #
+        # The webhook is called because the payment changed, so don't use a cached copy, and
+        # don't share the request with one that was sent before the payment changed.
+        #
+        payment = mollie_client.payments.get(
+            payment_id, cache=False, coalesce=False
+        )
         my_webshop_id = payment.metadata["my_webshop_id"]
 
         #
@@ -3,8 +3,8 @@
 
 import os
 
-from mollie.api.client import Client
 from mollie.api.error import Error
+from src.website0.helper_mollie_client import get_mollie_client
 
 
 def main():
@@ -15,8 +15,7 @@ def main():
         # See: https://www.mollie.com/dashboard/settings/profiles
         #
         api_key = os.environ.get("MOLLIE_API_KEY", "test_test")
-        mollie_client = Client()
-        mollie_client.set_api_key(api_key)
+        mollie_client = get_mollie_client(api_key=api_key)
 
         #
         # Get the first page of payments for this API key ordered by newest.
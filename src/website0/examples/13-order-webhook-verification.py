@@ -5,8 +5,8 @@ import os
 
 import flask
 
-from mollie.api.client import Client
 from mollie.api.error import Error
+from src.website0.helper_mollie_client import get_mollie_client
 from src.website0.helper_mollie_database import database_write
 
 
@@ -18,8 +18,7 @@ def main():
         # See: https://www.mollie.com/dashboard/settings/profiles
         #
         api_key = os.environ.get("MOLLIE_API_KEY", "test_test")
-        mollie_client = Client()
-        mollie_client.set_api_key(api_key)
+        mollie_client = get_mollie_client(api_key=api_key)
         #
         # After your webhook has been called with the order ID in its body, you'd like
         # to handle the order's status change. This is how you can do that.
@@ -30,7 +29,11 @@ def main():
             flask.abort(404, "Unknown order id")
 
         order_id = flask.request.form["id"]
-        order = mollie_client.orders.get(order_id)
+        #
+        # The webhook is called because the order changed, so don't use a cached copy, and
+        # don't share the request with one that was sent before the order changed.
+        #
+        order = mollie_client.orders.get(order_id, cache=False, coalesce=False)
         my_webshop_id = order.metadata["my_webshop_id"]
         #
         # Update the order in the database.
@@ -8,13 +8,12 @@ import os
 
 import flask
 
-from mollie.api.client import Client
+from src.website0.helper_mollie_client import get_mollie_client
 
 
 def main():
     api_key = os.environ.get("MOLLIE_API_KEY", "test_test")
-    mollie_client = Client()
-    mollie_client.set_api_key(api_key)
+    mollie_client = get_mollie_client(api_key=api_key)
 
     if "my_webshop_id" not in flask.request.args:
         flask.abort(404, "Unknown webshop id")
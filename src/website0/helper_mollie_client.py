@@ -0,0 +1,110 @@
+"""Hands out shared Mollie API clients to the Flask request handlers.
+
+Creating a Client for every HTTP request instantiates all its resource
+handlers and opens a new TLS connection to the Mollie API. Instead, one
+client per API key (or OAuth access token) is kept for the lifetime of
+the process, so its connection pool is reused by all requests.
+
+Pre-forking WSGI servers (such as gunicorn) fork the workers after the
+application module is imported. A forked worker must not reuse the
+sockets of its parent, so each process builds its own clients.
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from typeguard import typechecked
+
+from mollie.api.cache import ObjectCache
+from mollie.api.circuit import CircuitBreaker
+from mollie.api.client import Client
+from mollie.api.ratelimit import FileBucketBackend, RateLimiter
+
+# Size the connection pool of the shared clients to the number of threads
+# of the WSGI server that use them.
+MOLLIE_POOL_MAXSIZE: int = int(os.environ.get("MOLLIE_POOL_MAXSIZE", "10"))
+# Point the clients to another API endpoint, such as a mock server.
+MOLLIE_API_ENDPOINT: str = os.environ.get("MOLLIE_API_ENDPOINT", "")
+# Set to 1 to keep payments and orders retrieved by the webhooks and return
+# pages. Only for a single process: a webhook invalidates the cache of the
+# worker that receives it, other workers would return stale statuses.
+MOLLIE_OBJECT_CACHE: bool = os.environ.get("MOLLIE_OBJECT_CACHE", "0") == "1"
+# Share the rate limit of the Mollie API between the worker processes, by
+# keeping the token buckets in this file. Rate limiting is off when unset.
+MOLLIE_RATE_LIMIT_FILE: str = os.environ.get("MOLLIE_RATE_LIMIT_FILE", "")
+
+_clients: Dict[Tuple[str, str], Client] = {}
+_clients_lock: threading.Lock = threading.Lock()
+_clients_pid: int = os.getpid()
+
+
+@typechecked
+def get_mollie_client(
+    api_key: Optional[str] = None, access_token: Optional[str] = None
+) -> Client:
+    """Return the shared Mollie client for an API key or access token.
+
+    The client is created, configured and given its HTTP session on first
+    use, later calls in the same process return the same client.
+    """
+    if access_token:
+        key: Tuple[str, str] = ("access_token", access_token)
+    elif api_key:
+        key = ("api_key", api_key)
+    else:
+        raise ValueError("Pass either an API key or an access token.")
+
+    _reset_after_fork()
+    client: Optional[Client] = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = Client(
+                api_endpoint=MOLLIE_API_ENDPOINT,
+                pool_maxsize=MOLLIE_POOL_MAXSIZE,
+                pool_block=True,
+                thread_safe=True,
+            )
+            if access_token:
+                client.set_access_token(access_token)
+            else:
+                client.set_api_key(key[1])
+            if MOLLIE_OBJECT_CACHE:
+                client.set_object_cache(ObjectCache())
+            # Webhooks and return pages often retrieve the same payment or
+            # order at the same time.
+            client.set_request_coalescing(True)
+            # Fail fast during Mollie incidents, instead of tying up the
+            # worker threads until the requests time out.
+            client.set_circuit_breaker(CircuitBreaker())
+            if MOLLIE_RATE_LIMIT_FILE:
+                client.set_rate_limiter(
+                    RateLimiter(
+                        backend=FileBucketBackend(MOLLIE_RATE_LIMIT_FILE)
+                    )
+                )
+            _clients[key] = client
+    return client
+
+
+@typechecked
+def clear_mollie_clients() -> None:
+    """Drop all shared clients, for example after rotating an API key."""
+    with _clients_lock:
+        _clients.clear()
+
+
+def _reset_after_fork() -> None:
+    """Forget the clients of the parent process in a forked worker."""
+    global _clients_lock, _clients_pid  # pylint: disable=global-statement
+    if _clients_pid != os.getpid():
+        _clients.clear()
+        _clients_lock = threading.Lock()
+        _clients_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,154 @@
+"""Tests the state changes of the circuit breaker."""
+import unittest
+from typing import List, Tuple
+
+from typeguard import typechecked
+
+from mollie.api.circuit import CircuitBreaker, endpoint_family
+from mollie.api.client import Client
+from mollie.api.error import CircuitOpenError, ResponseError
+from mollie.api.transport import InMemoryTransport
+
+CLOSED: str = CircuitBreaker.CLOSED
+OPEN: str = CircuitBreaker.OPEN
+HALF_OPEN: str = CircuitBreaker.HALF_OPEN
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Test_circuit(unittest.TestCase):
+    """Object used to test the CircuitBreaker."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.breaker = CircuitBreaker(
+            failure_ratio=0.5,
+            min_requests=4,
+            window=10,
+            open_duration=5,
+            clock=self.clock,
+        )
+        self.changes: List[Tuple[str, str, str]] = []
+        self.breaker.add_listener(
+            lambda family, old, new: self.changes.append((family, old, new))
+        )
+
+    def call(self, family: str, failed: bool) -> None:
+        self.breaker.before_call(family)
+        if failed:
+            self.breaker.record_failure(family)
+        else:
+            self.breaker.record_success(family)
+
+    def open_circuit(self, family: str) -> None:
+        for failed in (True, False, True, False):
+            self.call(family, failed)
+
+    @typechecked
+    def test_opens_at_failure_ratio(self) -> None:
+        """Tests that the circuit opens once half of at least min_requests
+        requests failed, and only for its part of the API."""
+        for failed in (True, True, True):
+            self.call("payments", failed)
+        self.assertEqual(CLOSED, self.breaker.state("payments"))
+        self.call("payments", False)
+        self.assertEqual(OPEN, self.breaker.state("payments"))
+        self.assertEqual([("payments", CLOSED, OPEN)], self.changes)
+
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.before_call("payments")
+        self.assertEqual("payments", context.exception.family)
+        self.assertEqual(5, context.exception.retry_after)
+        self.breaker.before_call("orders")
+
+    @typechecked
+    def test_window_resets_counts(self) -> None:
+        """Tests that failures of an earlier window are not counted."""
+        for failed in (True, True, True):
+            self.call("payments", failed)
+        self.clock.now += 10
+        for failed in (False, False, False, True):
+            self.call("payments", failed)
+        self.assertEqual(CLOSED, self.breaker.state("payments"))
+
+    @typechecked
+    def test_probe_closes(self) -> None:
+        """Tests that the circuit is half-open after open_duration, allows
+        one probe, and closes when the probe succeeds."""
+        self.open_circuit("payments")
+        self.clock.now += 5
+        self.breaker.before_call("payments")
+        self.assertEqual(HALF_OPEN, self.breaker.state("payments"))
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call("payments")
+        self.breaker.record_success("payments")
+        self.assertEqual(CLOSED, self.breaker.state("payments"))
+        self.assertEqual(
+            [
+                ("payments", CLOSED, OPEN),
+                ("payments", OPEN, HALF_OPEN),
+                ("payments", HALF_OPEN, CLOSED),
+            ],
+            self.changes,
+        )
+
+    @typechecked
+    def test_probe_failure_opens_again(self) -> None:
+        """Tests that a failed probe opens the circuit for another
+        open_duration, and that a released probe can be sent again."""
+        self.open_circuit("payments")
+        self.clock.now += 5
+        self.breaker.before_call("payments")
+        self.breaker.release("payments")
+        self.call("payments", True)
+        self.assertEqual(OPEN, self.breaker.state("payments"))
+        self.clock.now += 4
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call("payments")
+
+    @typechecked
+    def test_endpoint_family(self) -> None:
+        """Tests that the part of the API is the first path segment."""
+        self.assertEqual("payments", endpoint_family("payments/tr_1"))
+        self.assertEqual("payments", endpoint_family("payments/tr_1/refunds"))
+        self.assertEqual(
+            "orders",
+            endpoint_family("https://api.mollie.com/v2/orders?limit=5"),
+        )
+
+    @typechecked
+    def test_client_stops_sending(self) -> None:
+        """Tests that the client counts 5xx responses as failures, and sends
+        no requests while the circuit is open."""
+        transport = InMemoryTransport()
+        transport.add(
+            "GET",
+            "payments",
+            {"status": 502, "title": "Bad Gateway", "detail": "Down"},
+            status=502,
+            prefix=True,
+        )
+        client = Client()
+        client.set_api_key("test_testtesttesttesttesttesttest00")
+        client.set_transport(transport)
+        client.set_circuit_breaker(self.breaker)
+
+        for _ in range(4):
+            with self.assertRaises(ResponseError):
+                client.payments.get("tr_1")
+        with self.assertRaises(CircuitOpenError):
+            client.payments.get("tr_1")
+        self.assertEqual(4, transport.request_count)
+        self.assertEqual({"payments": OPEN}, self.breaker.states)
+
+
+if __name__ == "__main__":
+    unittest.main()
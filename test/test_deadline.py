@@ -0,0 +1,130 @@
+"""Tests propagating a deadline across attempts, waits and threads."""
+import time
+import unittest
+from typing import Dict, List, Union
+
+import requests
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.error import DeadlineExceeded
+from mollie.api.ratelimit import RateLimiter
+from mollie.api.retry import RetryPolicy
+from mollie.api.transport import InMemoryTransport, Timeout
+
+
+class TimeoutsTransport(InMemoryTransport):
+    """Keeps the timeout of every request."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.timeouts: List[Timeout] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.timeouts.append(timeout)
+        return super().request(method, url, headers, data, timeout, stream)
+
+
+class Test_deadline(unittest.TestCase):
+    """Object used to test Client.deadline()."""
+
+    def setUp(self) -> None:
+        self.transport = TimeoutsTransport()
+        for payment_id in ("tr_1", "tr_2", "tr_3"):
+            self.transport.add(
+                "GET",
+                f"payments/{payment_id}",
+                {"resource": "payment", "id": payment_id},
+            )
+        self.client = Client(timeout=(2, 10))
+        self.client.set_api_key("test_testtesttesttesttesttesttest00")
+        self.client.set_transport(self.transport)
+
+    def assert_timeouts_within(self, seconds: float) -> None:
+        self.assertTrue(self.transport.timeouts)
+        for timeout in self.transport.timeouts:
+            self.assertIsInstance(timeout, tuple)
+            connect, read = timeout  # type: ignore[misc]
+            self.assertLessEqual(connect, seconds)
+            self.assertLessEqual(read, seconds)
+
+    @typechecked
+    def test_timeouts_shortened(self) -> None:
+        """Tests that requests get at most the time that is left, and the
+        configured timeouts outside a deadline."""
+        self.client.payments.get("tr_1")
+        self.assertEqual([(2, 10)], self.transport.timeouts)
+        self.transport.timeouts.clear()
+        with self.client.deadline(0.5):
+            self.client.payments.get("tr_1")
+        self.assert_timeouts_within(0.5)
+
+    @typechecked
+    def test_nested_deadline_only_shortens(self) -> None:
+        """Tests that a nested deadline cannot extend the outer one."""
+        with self.client.deadline(0.5):
+            with self.client.deadline(60):
+                self.client.payments.get("tr_1")
+        self.assert_timeouts_within(0.5)
+
+    @typechecked
+    def test_passed_deadline(self) -> None:
+        """Tests that no request is sent once the deadline has passed."""
+        with self.assertRaises(DeadlineExceeded):
+            self.client.payments.get("tr_1", deadline=0)
+        self.assertEqual(0, self.transport.request_count)
+
+    @typechecked
+    def test_threads_share_deadline(self) -> None:
+        """Tests that the threads of get_many() use the deadline of the
+        caller."""
+        results = self.client.payments.get_many(
+            ["tr_1", "tr_2", "tr_3"], deadline=0.5
+        )
+        self.assertEqual(["tr_1", "tr_2", "tr_3"], list(results))
+        self.assertEqual(3, self.transport.request_count)
+        self.assert_timeouts_within(0.5)
+
+    @typechecked
+    def test_retry_after_deadline(self) -> None:
+        """Tests that a retry that would start after the deadline raises
+        DeadlineExceeded right away, instead of waiting."""
+        self.transport.add(
+            "GET",
+            "payments/tr_throttled",
+            {"status": 429, "title": "Too Many Requests", "detail": "Slow"},
+            status=429,
+            headers={"Retry-After": "10"},
+        )
+        self.client.set_retry_policy(RetryPolicy())
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            self.client.payments.get("tr_throttled", deadline=1)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(1, self.transport.request_count)
+
+    @typechecked
+    def test_rate_limit_wait_after_deadline(self) -> None:
+        """Tests that a call that would wait for the rate limiter past the
+        deadline is not performed, and gives back its token."""
+        limiter = RateLimiter(read_rate=1, read_burst=1)
+        self.client.set_rate_limiter(limiter)
+        self.client.payments.get("tr_1")
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            self.client.payments.get("tr_2", deadline=0.2)
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertEqual(1, self.transport.request_count)
+        self.assertEqual(1, limiter.stats["released"])
+
+
+if __name__ == "__main__":
+    unittest.main()
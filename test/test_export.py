@@ -0,0 +1,244 @@
+"""Tests resuming an interrupted export from its checkpoint."""
+import io
+import json
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.error import RequestError
+from mollie.api.export import (
+    DEFAULT_COLUMNS,
+    WRITERS,
+    Column,
+    CSVWriter,
+    Exporter,
+    ExportWriter,
+    NDJSONWriter,
+    Row,
+)
+from mollie.api.transport import Timeout, Transport
+
+TOTAL: int = 53
+
+
+@typechecked
+def payment(index: int) -> Dict[str, Any]:
+    """Return a payment, with values that need quoting in CSV."""
+    return {
+        "resource": "payment",
+        "id": f"tr_{index:010d}",
+        "createdAt": f"2023-10-01T12:{index // 60:02d}:{index % 60:02d}+00:00",
+        "status": "paid" if index % 3 else "open",
+        "amount": {"value": f"{index}.{index % 100:02d}", "currency": "EUR"},
+        "description": f'Order {index}, "café"\nline two',
+    }
+
+
+class PagesTransport(Transport):
+    """Serves the pages of a list of TOTAL payments, and fails with a
+    RequestError on request number `fail_at`."""
+
+    def __init__(self, fail_at: Optional[int] = None) -> None:
+        self.fail_at = fail_at
+        self.request_count = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.request_count += 1
+        if self.request_count == self.fail_at:
+            raise RequestError("Unable to communicate with Mollie: reset")
+        query = parse_qs(urlsplit(url).query)
+        limit = int(query["limit"][0])
+        start = int(query["from"][0][3:]) if "from" in query else 0
+        stop = min(start + limit, TOTAL)
+        next_link = None
+        if stop < TOTAL:
+            next_link = {
+                "href": "https://api.mollie.com/v2/payments"
+                f"?from=tr_{stop:010d}&limit={limit}"
+            }
+        body = json.dumps(
+            {
+                "count": stop - start,
+                "_embedded": {
+                    "payments": [payment(i) for i in range(start, stop)]
+                },
+                "_links": {"next": next_link},
+            }
+        ).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/hal+json"}
+        )
+        response.raw = io.BytesIO(body)
+        return response
+
+
+class Test_export(unittest.TestCase):
+    """Object used to test the checkpoints of the Exporter."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def export(
+        self,
+        name: str,
+        transport: Transport,
+        checkpoint: Optional[str],
+        columns: Iterable[Union[Column, str]] = DEFAULT_COLUMNS,
+        **params: Any,
+    ) -> int:
+        """Export the payments to a file in the temporary directory."""
+        client = Client()
+        client.set_api_key("test_testtesttesttesttesttesttest00")
+        client.set_transport(transport)
+        exporter = Exporter(
+            client.payments, columns, batch_size=12, page_size=5
+        )
+        return exporter.export(
+            os.path.join(self.directory.name, name),
+            checkpoint=checkpoint,
+            **params,
+        )
+
+    def read(self, name: str) -> bytes:
+        with open(os.path.join(self.directory.name, name), "rb") as file:
+            return file.read()
+
+    @typechecked
+    def test_resume_after_request_error(self) -> None:
+        """Tests that an export which fails while fetching a page in the
+        middle of a batch resumes to the same file as a complete export."""
+        for format in ("csv", "ndjson"):
+            with self.subTest(format=format):
+                expected_rows = self.export(
+                    f"expected.{format}", PagesTransport(), None
+                )
+                self.assertEqual(TOTAL, expected_rows)
+
+                checkpoint = os.path.join(self.directory.name, f"{format}.cp")
+                with self.assertRaises(RequestError):
+                    # Fails after the first batch (pages 1-3) and one more
+                    # page of the second batch.
+                    self.export(
+                        f"actual.{format}", PagesTransport(5), checkpoint
+                    )
+                with open(checkpoint, encoding="utf-8") as file:
+                    self.assertEqual(15, json.load(file)["rows"])
+
+                actual_rows = self.export(
+                    f"actual.{format}", PagesTransport(), checkpoint
+                )
+                self.assertEqual(expected_rows, actual_rows)
+                self.assertEqual(
+                    self.read(f"expected.{format}"),
+                    self.read(f"actual.{format}"),
+                )
+
+    @typechecked
+    def test_resume_after_partly_written_batch(self) -> None:
+        """Tests that rows written after the last checkpoint, by a batch
+        that was interrupted while writing, are replaced on resume."""
+        writers: Dict[str, Type[ExportWriter]] = {
+            "csv": CSVWriter,
+            "ndjson": NDJSONWriter,
+        }
+        for format, writer_class in writers.items():
+            with self.subTest(format=format):
+                self.export(f"expected.{format}", PagesTransport(), None)
+
+                class CrashingWriter(writer_class):  # type: ignore
+                    batches = 0
+
+                    def write_batch(self, rows: List[Row]) -> None:
+                        CrashingWriter.batches += 1
+                        if CrashingWriter.batches == 2:
+                            super().write_batch(rows[: len(rows) // 2])
+                            self.file.flush()
+                            raise OSError("No space left on device")
+                        super().write_batch(rows)
+
+                checkpoint = os.path.join(self.directory.name, f"{format}.cp")
+                with mock.patch.dict(WRITERS, {format: CrashingWriter}):
+                    with self.assertRaises(OSError):
+                        self.export(
+                            f"actual.{format}", PagesTransport(), checkpoint
+                        )
+
+                self.export(f"actual.{format}", PagesTransport(), checkpoint)
+                self.assertEqual(
+                    self.read(f"expected.{format}"),
+                    self.read(f"actual.{format}"),
+                )
+
+    @typechecked
+    def test_finished_export_is_not_repeated(self) -> None:
+        """Tests that a finished export returns its rows from the
+        checkpoint, without requests."""
+        checkpoint = os.path.join(self.directory.name, "done.cp")
+        self.export("done.csv", PagesTransport(), checkpoint)
+        transport = PagesTransport()
+        self.assertEqual(TOTAL, self.export("done.csv", transport, checkpoint))
+        self.assertEqual(0, transport.request_count)
+
+    @typechecked
+    def test_checkpoint_of_other_export(self) -> None:
+        """Tests that a checkpoint is not used for an export with another
+        path, format, columns, period or parameters."""
+        checkpoint = os.path.join(self.directory.name, "other.cp")
+        with self.assertRaises(RequestError):
+            self.export("other.csv", PagesTransport(5), checkpoint)
+
+        changes: Dict[str, Dict[str, Any]] = {
+            "path": {"name": "renamed.csv"},
+            "format": {"format": "ndjson"},
+            "columns": {"columns": ["id", "status"]},
+            "period": {"created_after": "2023-10-01T12:00:30+00:00"},
+            "params": {"profileId": "pfl_1"},
+        }
+        for change, arguments in changes.items():
+            with self.subTest(change=change):
+                name = arguments.pop("name", "other.csv")
+                transport = PagesTransport()
+                with self.assertRaises(ValueError):
+                    self.export(name, transport, checkpoint, **arguments)
+                self.assertEqual(0, transport.request_count)
+
+        self.assertEqual(
+            TOTAL, self.export("other.csv", PagesTransport(), checkpoint)
+        )
+
+    @typechecked
+    def test_finished_checkpoint_of_other_export(self) -> None:
+        """Tests that the checkpoint of a finished export is not used for
+        an export with other parameters."""
+        checkpoint = os.path.join(self.directory.name, "done.cp")
+        self.export("done.csv", PagesTransport(), checkpoint)
+        with self.assertRaises(ValueError):
+            self.export(
+                "done.csv",
+                PagesTransport(),
+                checkpoint,
+                created_after="2023-10-01T12:00:30+00:00",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests retrieving many objects at once with get_many()."""
+import unittest
+from typing import Any, Dict, List
+
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.error import NotFoundError
+from mollie.api.transport import InMemoryTransport
+
+
+@typechecked
+def payment(payment_id: str) -> Dict[str, Any]:
+    return {"resource": "payment", "id": payment_id, "status": "paid"}
+
+
+class Test_get_many(unittest.TestCase):
+    """Object used to test the get_many method of the resources."""
+
+    def setUp(self) -> None:
+        self.transport = InMemoryTransport()
+        self.client = Client()
+        self.client.set_api_key("test_testtesttesttesttesttesttest00")
+        self.client.set_transport(self.transport)
+
+    def add_payments(self, ids: List[str]) -> None:
+        for payment_id in ids:
+            self.transport.add(
+                "GET", f"payments/{payment_id}", payment(payment_id)
+            )
+
+    def requested_paths(self) -> List[str]:
+        return sorted(
+            url.split("/v2/")[1] for _, url in self.transport.requests
+        )
+
+    @typechecked
+    def test_results_in_order_of_ids(self) -> None:
+        """Tests that the objects are returned in the order of the IDs,
+        once for a repeated ID, and with the error of a missing object in
+        its place."""
+        self.add_payments(["tr_1", "tr_2", "tr_3"])
+        results = self.client.payments.get_many(
+            ["tr_3", "tr_missing", "tr_1", "tr_3", "tr_2"], max_concurrency=2
+        )
+        self.assertEqual(["tr_3", "tr_missing", "tr_1", "tr_2"], list(results))
+        self.assertIsInstance(results["tr_missing"], NotFoundError)
+        for payment_id in ("tr_1", "tr_2", "tr_3"):
+            self.assertEqual(payment_id, results[payment_id].id)
+        self.assertEqual(4, self.transport.request_count)
+
+    @typechecked
+    def test_scan_lists_dense_pages(self) -> None:
+        """Tests that many IDs are first looked up in the list, and that only
+        the objects that were not listed are retrieved one by one."""
+        payments = self.client.payments
+        payments.GET_MANY_SCAN_MIN_IDS = 3
+        listed = ["tr_1", "tr_2", "tr_3"]
+        self.transport.add(
+            "GET",
+            "payments",
+            {
+                "count": len(listed),
+                "_embedded": {"payments": [payment(i) for i in listed]},
+                "_links": {"next": None},
+            },
+        )
+        self.add_payments(["tr_old"])
+
+        results = payments.get_many(["tr_2", "tr_old", "tr_1"])
+        self.assertEqual(["tr_2", "tr_old", "tr_1"], list(results))
+        self.assertEqual(
+            ["tr_2", "tr_old", "tr_1"],
+            [result.id for result in results.values()],
+        )
+        self.assertEqual(
+            ["payments/tr_old", "payments?limit=250"], self.requested_paths()
+        )
+
+    @typechecked
+    def test_scan_disabled(self) -> None:
+        """Tests that with scan=False, or with parameters, every object is
+        retrieved on its own."""
+        payments = self.client.payments
+        payments.GET_MANY_SCAN_MIN_IDS = 1
+        self.add_payments(["tr_1", "tr_2"])
+        payments.get_many(["tr_1", "tr_2"], scan=False)
+        payments.get_many(["tr_1"], include="details.qrCode")
+        self.assertEqual(
+            [
+                "payments/tr_1",
+                "payments/tr_1?include=details.qrCode",
+                "payments/tr_2",
+            ],
+            self.requested_paths(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
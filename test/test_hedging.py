@@ -0,0 +1,138 @@
+"""Tests sending slow GET requests again with a HedgePolicy."""
+import io
+import json
+import threading
+import time
+import unittest
+from typing import Dict, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.error import DeadlineExceeded
+from mollie.api.hedging import HedgePolicy
+from mollie.api.transport import Timeout, Transport
+
+ENDPOINT: str = "payments/{id}"
+
+
+class StallingTransport(Transport):
+    """Answers the first `stalled` requests only once `release` is set, and
+    the other requests right away. The status of the payment is the number
+    of the request."""
+
+    def __init__(self, stalled: int) -> None:
+        self.stalled = stalled
+        self.release = threading.Event()
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        with self._lock:
+            self.request_count += 1
+            number = self.request_count
+        if number <= self.stalled:
+            self.release.wait(5)
+        body = json.dumps(
+            {"resource": "payment", "id": "tr_1", "status": str(number)}
+        ).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/hal+json"}
+        )
+        response.raw = io.BytesIO(body)
+        response._content = body
+        return response
+
+
+class Test_hedging(unittest.TestCase):
+    """Object used to test hedged requests of the client."""
+
+    def create_client(
+        self, transport: Transport, latency: float, policy: HedgePolicy
+    ) -> Client:
+        """Return a client that learned the latency of the endpoint."""
+        client = Client()
+        client.set_api_key("test_testtesttesttesttesttesttest00")
+        client.set_transport(transport)
+        client.set_hedge_policy(policy)
+        for _ in range(policy.min_samples):
+            client.latency.record(ENDPOINT, latency)
+        return client
+
+    @typechecked
+    def test_hedge_answers_first(self) -> None:
+        """Tests that a request that is slower than the learned latency is
+        sent again, and that the response of the extra request is used."""
+        transport = StallingTransport(stalled=1)
+        self.addCleanup(transport.release.set)
+        policy = HedgePolicy(min_samples=5, min_delay=0.01)
+        client = self.create_client(transport, 0.01, policy)
+
+        payment = client.payments.get("tr_1")
+        self.assertEqual("2", payment.status)
+        self.assertEqual(2, transport.request_count)
+        stats = policy.stats
+        self.assertEqual(1, stats["hedges_fired"])
+        self.assertEqual(1, stats["hedges_won"])
+
+    @typechecked
+    def test_fast_response_is_not_hedged(self) -> None:
+        """Tests that no extra request is sent for a fast response, nor
+        before enough latencies were recorded."""
+        transport = StallingTransport(stalled=0)
+        policy = HedgePolicy(min_samples=5)
+        client = self.create_client(transport, 1.0, policy)
+        client.payments.get("tr_1")
+
+        unlearned = HedgePolicy(min_samples=5, min_delay=0)
+        client.set_hedge_policy(unlearned)
+        client.latency.record(ENDPOINT, 0.001)
+        client.payments.get("tr_1")
+
+        self.assertEqual(2, transport.request_count)
+        self.assertEqual(0, policy.stats["hedges_fired"])
+        self.assertEqual(0, unlearned.stats["hedges_fired"])
+
+    @typechecked
+    def test_max_hedges(self) -> None:
+        """Tests that no more than max_hedges extra requests are sent."""
+        transport = StallingTransport(stalled=3)
+        policy = HedgePolicy(
+            min_samples=5, min_delay=0.01, max_hedges=2, max_ratio=1
+        )
+        client = self.create_client(transport, 0.01, policy)
+        threading.Timer(0.3, transport.release.set).start()
+
+        client.payments.get("tr_1")
+        self.assertEqual(3, transport.request_count)
+        self.assertEqual(2, policy.stats["hedges_fired"])
+
+    @typechecked
+    def test_deadline_while_hedging(self) -> None:
+        """Tests that DeadlineExceeded is raised while the requests are in
+        flight, without waiting for them."""
+        transport = StallingTransport(stalled=2)
+        self.addCleanup(transport.release.set)
+        policy = HedgePolicy(min_samples=5, min_delay=0.01)
+        client = self.create_client(transport, 0.01, policy)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            client.payments.get("tr_1", deadline=0.2)
+        self.assertLess(time.monotonic() - started, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
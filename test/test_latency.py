@@ -0,0 +1,143 @@
+"""Tests the latency percentiles and the timeouts learned from them."""
+import unittest
+from typing import Dict, List, Union
+
+import requests
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.latency import (
+    AdaptiveTimeouts,
+    LatencyRecorder,
+    endpoint_template,
+)
+from mollie.api.transport import InMemoryTransport, Timeout
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TimeoutsTransport(InMemoryTransport):
+    """Keeps the timeout of every request."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.timeouts: List[Timeout] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.timeouts.append(timeout)
+        return super().request(method, url, headers, data, timeout, stream)
+
+
+class Test_latency(unittest.TestCase):
+    """Object used to test the LatencyRecorder and AdaptiveTimeouts."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.latency = LatencyRecorder(window=60, clock=self.clock)
+
+    @typechecked
+    def test_endpoint_template(self) -> None:
+        """Tests that the IDs in paths and URLs are replaced."""
+        self.assertEqual("payments/{id}", endpoint_template("payments/tr_1"))
+        self.assertEqual(
+            "settlements/{id}/payments",
+            endpoint_template(
+                "https://api.mollie.com/v2/settlements/stl_jDk30akdN/"
+                "payments?limit=5"
+            ),
+        )
+        self.assertEqual("methods", endpoint_template("methods?locale=nl_NL"))
+
+    @typechecked
+    def test_percentiles(self) -> None:
+        """Tests the percentiles within the precision of a bucket."""
+        for index in range(1, 101):
+            self.latency.record("payments/{id}", index / 1000)
+        for percentile, expected in ((50, 0.05), (95, 0.095), (100, 0.1)):
+            with self.subTest(percentile=percentile):
+                value = self.latency.percentile("payments/{id}", percentile)
+                self.assertIsNotNone(value)
+                self.assertGreaterEqual(value, expected)
+                self.assertLessEqual(value, expected * 1.1)
+        self.assertIsNone(
+            self.latency.percentile("payments/{id}", 50, min_samples=101)
+        )
+        self.assertIsNone(self.latency.percentile("orders/{id}", 50))
+
+    @typechecked
+    def test_windows(self) -> None:
+        """Tests that the latencies of the previous window are used, and
+        older latencies are not."""
+        self.latency.record("payments/{id}", 0.1)
+        self.clock.now += 60
+        self.latency.record("payments/{id}", 0.1)
+        self.assertEqual(2, self.latency.count("payments/{id}"))
+        self.clock.now += 60
+        self.assertEqual(1, self.latency.count("payments/{id}"))
+        self.clock.now += 120
+        self.assertEqual(0, self.latency.count("payments/{id}"))
+        self.assertEqual([], self.latency.endpoints())
+
+    @typechecked
+    def test_read_timeouts(self) -> None:
+        """Tests the multiplier, the floor and the ceiling of the learned
+        read timeouts, and that none are learned from too few latencies."""
+        timeouts = AdaptiveTimeouts(
+            percentile=100, multiplier=3, floor=0.5, ceiling=30, min_samples=3
+        )
+        latencies = {"methods": 0.01, "payments/{id}": 1.0, "settlements": 20}
+        for endpoint, seconds in latencies.items():
+            for _ in range(3):
+                self.latency.record(endpoint, seconds)
+        self.latency.record("orders", 1.0)
+
+        learned = timeouts.get_read_timeouts(self.latency)
+        self.assertEqual(
+            ["methods", "payments/{id}", "settlements"], sorted(learned)
+        )
+        self.assertEqual(0.5, learned["methods"])
+        self.assertAlmostEqual(3.0, learned["payments/{id}"], delta=0.3)
+        self.assertEqual(30, learned["settlements"])
+
+    @typechecked
+    def test_client_uses_learned_timeout(self) -> None:
+        """Tests that the client keeps its connect timeout, and uses the
+        learned read timeout of the endpoint once it is known."""
+        transport = TimeoutsTransport()
+        transport.add("GET", "payments", {"id": "tr_1"}, prefix=True)
+        client = Client(timeout=(2, 10))
+        client.set_api_key("test_testtesttesttesttesttesttest00")
+        client.set_transport(transport)
+        client.set_adaptive_timeouts(
+            AdaptiveTimeouts(percentile=100, multiplier=3, min_samples=3)
+        )
+        for _ in range(3):
+            client.latency.record("payments/{id}", 1.0)
+
+        client.payments.get("tr_1")
+        client.payments.list()
+        connect, read = transport.timeouts[0]  # type: ignore[misc]
+        self.assertEqual(2, connect)
+        self.assertAlmostEqual(3.0, read, delta=0.3)
+        self.assertEqual((2, 10), transport.timeouts[1])
+        self.assertEqual(["payments/{id}"], list(client.learned_timeouts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests the fixed-point Money type and collecting amounts."""
+import pickle
+import unittest
+from typing import Any, Dict, List
+
+from typeguard import typechecked
+
+from mollie.api import money
+from mollie.api.money import Money, collect_amounts
+
+
+@typechecked
+def payment(value: str, currency: str, status: str) -> Dict[str, Any]:
+    return {
+        "amount": {"value": value, "currency": currency},
+        "status": status,
+    }
+
+
+PAYMENTS: List[Dict[str, Any]] = [
+    payment("10.00", "EUR", "paid"),
+    payment("0.10", "EUR", "open"),
+    payment("1500", "JPY", "paid"),
+    payment("0.20", "EUR", "paid"),
+    {"status": "open"},
+    payment("1.5", "EUR", "paid"),
+    payment("-0.30", "EUR", "open"),
+    payment("1.234", "BHD", "paid"),
+    payment("10.00", "EUR", "paid"),
+]
+
+
+class Test_money(unittest.TestCase):
+    """Object used to test Money and collect_amounts."""
+
+    @typechecked
+    def test_parse_and_format(self) -> None:
+        """Tests that values are parsed in the decimals of their currency,
+        and formatted as the API does."""
+        cases = [
+            ("10.00", "EUR", 1000, "10.00"),
+            ("0.1", "EUR", 10, "0.10"),
+            (".5", "EUR", 50, "0.50"),
+            ("-0.05", "EUR", -5, "-0.05"),
+            ("12", "EUR", 1200, "12.00"),
+            ("10.000", "EUR", 1000, "10.00"),
+            ("1500", "JPY", 1500, "1500"),
+            ("1.234", "BHD", 1234, "1.234"),
+        ]
+        for value, currency, units, formatted in cases:
+            with self.subTest(value=value, currency=currency):
+                amount = Money.from_value(value, currency)
+                self.assertEqual(units, amount.units)
+                self.assertEqual(formatted, amount.to_value())
+
+    @typechecked
+    def test_no_rounding(self) -> None:
+        """Tests that values with more decimals than the currency has are
+        rejected instead of rounded."""
+        for value, currency in (
+            ("10.005", "EUR"),
+            ("1.5", "JPY"),
+            ("0.0001", "BHD"),
+            ("ten", "EUR"),
+            ("", "EUR"),
+        ):
+            with self.subTest(value=value, currency=currency):
+                with self.assertRaises(ValueError):
+                    Money.from_value(value, currency)
+
+    @typechecked
+    def test_exact_arithmetic(self) -> None:
+        """Tests that sums of amounts are exact."""
+        total = sum([Money.from_value("0.10", "EUR")] * 3, Money(0, "EUR"))
+        self.assertEqual(Money.from_value("0.30", "EUR"), total)
+        self.assertEqual(Money(90, "EUR"), 3 * Money(30, "EUR"))
+        self.assertEqual(Money(-5, "EUR"), Money(10, "EUR") - Money(15, "EUR"))
+        self.assertEqual("0.30", str(total.to_decimal()))
+        self.assertEqual(total, pickle.loads(pickle.dumps(total)))
+        with self.assertRaises(AttributeError):
+            total.units = 0  # type: ignore[misc]
+
+    @typechecked
+    def test_mixed_currencies(self) -> None:
+        """Tests that amounts in different currencies are not equal, and
+        cannot be added or ordered."""
+        euro = Money(100, "EUR")
+        dollar = Money(100, "USD")
+        self.assertNotEqual(euro, dollar)
+        with self.assertRaises(ValueError):
+            euro + dollar
+        with self.assertRaises(ValueError):
+            euro < dollar
+        with self.assertRaises(TypeError):
+            euro < 1  # type: ignore[operator]
+        with self.assertRaises(TypeError):
+            euro + 1  # type: ignore[operator]
+        self.assertNotEqual(euro, 100)
+
+    @typechecked
+    def test_collect_amounts(self) -> None:
+        """Tests that amounts are collected by currency, with their keys,
+        and summed, grouped and counted."""
+        amounts = collect_amounts(PAYMENTS, key="status", use_numpy=False)
+        self.assertEqual(["EUR", "JPY", "BHD"], list(amounts))
+        euros = amounts["EUR"]
+        self.assertEqual(6, len(euros))
+        self.assertEqual(Money.from_value("21.50", "EUR"), euros.sum())
+        self.assertEqual(
+            {
+                "paid": Money.from_value("21.70", "EUR"),
+                "open": Money.from_value("-0.20", "EUR"),
+            },
+            euros.group_by(),
+        )
+        self.assertEqual(
+            [1, 2, 1, 2], euros.histogram(["0.00", "1.00", "10.00"])
+        )
+        self.assertEqual(Money(1234, "BHD"), amounts["BHD"].sum())
+
+        by_function = collect_amounts(
+            PAYMENTS, key=lambda obj: obj["status"] == "paid", use_numpy=False
+        )
+        self.assertEqual(
+            Money(1500, "JPY"), by_function["JPY"].group_by()[True]
+        )
+        with self.assertRaises(ValueError):
+            collect_amounts(PAYMENTS, use_numpy=False)["EUR"].group_by()
+
+    @typechecked
+    def test_collect_invalid_value(self) -> None:
+        """Tests that an invalid value raises ValueError, also when the
+        values parsed before are remembered."""
+        with self.assertRaises(ValueError):
+            collect_amounts(
+                PAYMENTS + [payment("0.005", "EUR", "paid")], use_numpy=False
+            )
+
+    @unittest.skipIf(money.numpy is None, "NumPy is not installed.")
+    @typechecked
+    def test_collect_numpy(self) -> None:
+        """Tests that the NumPy arrays give the same results."""
+        expected_result = collect_amounts(
+            PAYMENTS, key="status", use_numpy=False
+        )
+        actual_result = collect_amounts(PAYMENTS, key="status", use_numpy=True)
+        for currency, amounts in expected_result.items():
+            with self.subTest(currency=currency):
+                actual = actual_result[currency]
+                self.assertEqual(amounts.sum(), actual.sum())
+                self.assertEqual(amounts.group_by(), actual.group_by())
+                self.assertEqual(
+                    amounts.histogram(["0.00", "1.00"]),
+                    actual.histogram(["0.00", "1.00"]),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests caching payments and orders with TTLs by their status."""
+import unittest
+
+from typeguard import typechecked
+
+from mollie.api.cache import ObjectCache
+from mollie.api.client import Client
+from mollie.api.resources.orders import Orders
+from mollie.api.resources.payments import PaymentsBase
+from mollie.api.transport import InMemoryTransport
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Test_object_cache(unittest.TestCase):
+    """Object used to test the ObjectCache of the client."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.client = Client()
+        self.client.set_api_key("test_testtesttesttesttesttesttest00")
+
+    def serve(self, path: str, status: str) -> InMemoryTransport:
+        """Answer the path with an object in the status."""
+        resource, object_id = path.split("/")
+        transport = InMemoryTransport()
+        transport.add(
+            "GET",
+            path,
+            {"resource": resource[:-1], "id": object_id, "status": status},
+        )
+        self.client.set_transport(transport)
+        return transport
+
+    @typechecked
+    def test_ttls_by_status(self) -> None:
+        """Tests the TTLs of the resources by status, and overriding them
+        per object type."""
+        cache = ObjectCache(
+            status_ttls={"Payment": {"paid": None, "open": 0}},
+            default_ttl=7,
+        )
+        payments = PaymentsBase.STATUS_TTLS
+        orders = Orders.STATUS_TTLS
+        self.assertIsNone(cache.get_ttl("Payment", "paid", payments))
+        self.assertEqual(0, cache.get_ttl("Payment", "open", payments))
+        self.assertEqual(3600, cache.get_ttl("Payment", "failed", payments))
+        self.assertEqual(7, cache.get_ttl("Payment", "pending", payments))
+        self.assertEqual(3600, cache.get_ttl("Order", "completed", orders))
+        self.assertEqual(7, cache.get_ttl("Order", "paid", orders))
+
+    @typechecked
+    def test_final_status_is_kept_longer(self) -> None:
+        """Tests that a paid payment is cached for an hour, and an open
+        payment for the default TTL."""
+        self.client.set_object_cache(ObjectCache(clock=self.clock))
+        transport = self.serve("payments/tr_1", "paid")
+        self.client.payments.get("tr_1")
+        self.clock.now += 3599
+        self.assertEqual("paid", self.client.payments.get("tr_1").status)
+        self.assertEqual(1, transport.request_count)
+        self.clock.now += 1
+        self.client.payments.get("tr_1")
+        self.assertEqual(2, transport.request_count)
+
+        transport = self.serve("orders/ord_1", "created")
+        self.client.orders.get("ord_1")
+        self.clock.now += 4
+        self.client.orders.get("ord_1")
+        self.assertEqual(1, transport.request_count)
+        self.clock.now += 1
+        self.client.orders.get("ord_1")
+        self.assertEqual(2, transport.request_count)
+
+    @typechecked
+    def test_ttl_none_and_zero(self) -> None:
+        """Tests that a TTL of None keeps an object until it is invalidated,
+        and that a TTL of 0 does not cache it."""
+        cache = ObjectCache(
+            status_ttls={"Payment": {"paid": None, "open": 0}},
+            clock=self.clock,
+        )
+        self.client.set_object_cache(cache)
+        transport = self.serve("payments/tr_1", "paid")
+        self.client.payments.get("tr_1")
+        self.clock.now += 10**6
+        self.client.payments.get("tr_1")
+        self.assertEqual(1, transport.request_count)
+        cache.invalidate("tr_1")
+        self.client.payments.get("tr_1")
+        self.assertEqual(2, transport.request_count)
+
+        transport = self.serve("payments/tr_2", "open")
+        self.client.payments.get("tr_2")
+        self.client.payments.get("tr_2")
+        self.assertEqual(2, transport.request_count)
+        self.assertEqual(1, cache.stats["size"])
+
+    @typechecked
+    def test_bypass_and_copies(self) -> None:
+        """Tests that calls with parameters are not cached, that
+        cache=False retrieves and stores the new status, and that changes
+        to a returned object do not change the cache."""
+        self.client.set_object_cache(ObjectCache(clock=self.clock))
+        self.serve("payments/tr_1", "open")
+        payment = self.client.payments.get("tr_1")
+        payment["status"] = "changed"
+        self.assertEqual("open", self.client.payments.get("tr_1").status)
+
+        transport = self.serve("payments/tr_1", "paid")
+        self.client.payments.get("tr_1", include="details.qrCode")
+        self.assertEqual("open", self.client.payments.get("tr_1").status)
+        self.client.payments.get("tr_1", cache=False)
+        self.assertEqual("paid", self.client.payments.get("tr_1").status)
+        self.assertEqual(2, transport.request_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
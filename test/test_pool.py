@@ -0,0 +1,115 @@
+"""Tests the connection pool statistics of PoolStatsAdapter and
+Urllib3Transport."""
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from typeguard import typechecked
+
+from mollie.api.pool import PoolStatsAdapter
+from mollie.api.transport import Urllib3Transport
+
+BODY: bytes = b'{"resource": "payment", "id": "tr_1"}' * 1000
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/hal+json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # The tests close connections of responses that were not read.
+        pass
+
+
+class Test_pool(unittest.TestCase):
+    """Object used to test the statistics of the PoolStatsAdapter."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/v2/payments"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.adapter = PoolStatsAdapter(pool_maxsize=2)
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.addCleanup(self.session.close)
+
+    @typechecked
+    def test_requests(self) -> None:
+        """Tests that connections are reused, and in use only during a
+        request."""
+        for _ in range(3):
+            self.session.get(self.url)
+        self.assertEqual(
+            {
+                "requests": 3,
+                "in_use": 0,
+                "peak_in_use": 1,
+                "waits": 0,
+                "connections_opened": 1,
+            },
+            self.adapter.get_stats(),
+        )
+
+    @typechecked
+    def test_streamed_responses(self) -> None:
+        """Tests that a streamed response keeps its connection in use until
+        it is read to the end or closed."""
+        first = self.session.get(self.url, stream=True)
+        second = self.session.get(self.url, stream=True)
+        self.assertEqual(2, self.adapter.get_stats()["in_use"])
+        third = self.session.get(self.url, stream=True)
+        stats = self.adapter.get_stats()
+        self.assertEqual(3, stats["in_use"])
+        self.assertEqual(1, stats["waits"])
+
+        self.assertEqual(BODY, first.content)
+        self.assertEqual(2, self.adapter.get_stats()["in_use"])
+        next(second.iter_content(10))
+        second.close()
+        with third:
+            pass
+        stats = self.adapter.get_stats()
+        self.assertEqual(0, stats["in_use"])
+        self.assertEqual(3, stats["peak_in_use"])
+
+    @typechecked
+    def test_urllib3_transport(self) -> None:
+        """Tests that the urllib3 transport counts streamed responses in
+        the same way."""
+        transport = Urllib3Transport(pool_maxsize=2)
+        self.addCleanup(transport.close)
+        transport.request("GET", self.url, {}, b"", (1, 1))
+        streamed = transport.request("GET", self.url, {}, b"", (1, 1), True)
+        self.assertEqual(1, transport.pool_stats["in_use"])
+        next(streamed.iter_content(10))
+        streamed.close()
+        stats = transport.pool_stats
+        self.assertEqual(0, stats["in_use"])
+        self.assertEqual(1, stats["peak_in_use"])
+        self.assertEqual(2, stats["requests"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests the querystrings generated for the Mollie API."""
+import unittest
+from urllib.parse import urlencode
+
+from typeguard import typechecked
+
+from mollie.api.client import generate_querystring
+
+
+class Test_querystring(unittest.TestCase):
+    """Object used to test the generate_querystring function."""
+
+    @typechecked
+    def test_empty_params(self) -> None:
+        """Tests that no querystring is generated without parameters."""
+        self.assertIsNone(generate_querystring(None))
+        self.assertIsNone(generate_querystring({}))
+
+    @typechecked
+    def test_flat_params_match_urlencode(self) -> None:
+        """Tests that scalar values are encoded like urlencode() does."""
+        params = {
+            "limit": 5,
+            "from": "tr_7UhSN1zuXS",
+            "description": "Order #12 & more",
+            "amount": 10.5,
+        }
+        self.assertEqual(urlencode(params), generate_querystring(params))
+
+    @typechecked
+    def test_nested_dict(self) -> None:
+        """Tests that dictionaries are encoded with square brackets."""
+        actual_result = generate_querystring(
+            {
+                "amount": {"value": "100.00", "currency": "USD"},
+                "locale": "nl_NL",
+            }
+        )
+        expected_result: str = (
+            "amount%5Bvalue%5D=100.00&amount%5Bcurrency%5D=USD&locale=nl_NL"
+        )
+        self.assertEqual(expected_result, actual_result)
+
+    @typechecked
+    def test_list_items_keyed_by_index(self) -> None:
+        """Tests that list items are keyed by their index, also when the
+        items are dictionaries."""
+        actual_result = generate_querystring(
+            {"include": ["issuers", "pricing"], "lines": [{"id": "odl_1"}]}
+        )
+        expected_result: str = (
+            "include%5B0%5D=issuers&include%5B1%5D=pricing"
+            "&lines%5B0%5D%5Bid%5D=odl_1"
+        )
+        self.assertEqual(expected_result, actual_result)
+
+    @typechecked
+    def test_deeply_nested_values(self) -> None:
+        """Tests that lists in dictionaries in lists are encoded
+        recursively, and that tuples are encoded like lists."""
+        actual_result = generate_querystring(
+            {
+                "lines": [
+                    {"id": "odl_1", "amount": {"value": "1.00"}},
+                    {"id": "odl_2", "tags": ("a b", "c&d")},
+                ]
+            }
+        )
+        expected_result: str = "&".join(
+            [
+                "lines%5B0%5D%5Bid%5D=odl_1",
+                "lines%5B0%5D%5Bamount%5D%5Bvalue%5D=1.00",
+                "lines%5B1%5D%5Bid%5D=odl_2",
+                "lines%5B1%5D%5Btags%5D%5B0%5D=a+b",
+                "lines%5B1%5D%5Btags%5D%5B1%5D=c%26d",
+            ]
+        )
+        self.assertEqual(expected_result, actual_result)
+
+    @typechecked
+    def test_empty_containers_are_left_out(self) -> None:
+        """Tests that empty dictionaries and lists add no parameters."""
+        self.assertEqual(
+            "limit=5",
+            generate_querystring({"metadata": {}, "include": [], "limit": 5}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
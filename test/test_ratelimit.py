@@ -0,0 +1,108 @@
+"""Tests the token buckets of the client-side rate limiter."""
+import os
+import tempfile
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from mollie.api.ratelimit import FileBucketBackend, RateLimiter
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Test_ratelimit(unittest.TestCase):
+    """Object used to test the RateLimiter and its backends."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+
+    def reserve(self, limiter: RateLimiter, count: int) -> List[float]:
+        return [limiter.reserve("key", "GET") for _ in range(count)]
+
+    @typechecked
+    def test_burst_then_debt(self) -> None:
+        """Tests that a burst is allowed at once, and that the next calls
+        wait in order for the tokens that are refilled."""
+        limiter = RateLimiter(read_rate=2, read_burst=3, clock=self.clock)
+        self.assertEqual([0, 0, 0, 0.5, 1.0], self.reserve(limiter, 5))
+        stats = limiter.stats
+        self.assertEqual(5, stats["calls"])
+        self.assertEqual(2, stats["waits"])
+        self.assertEqual(1.5, stats["wait_seconds"])
+        self.assertEqual(1.0, stats["max_wait_seconds"])
+
+    @typechecked
+    def test_refill(self) -> None:
+        """Tests that tokens are refilled at the rate, up to the burst, and
+        that debt is paid back first."""
+        limiter = RateLimiter(read_rate=2, read_burst=3, clock=self.clock)
+        self.reserve(limiter, 5)  # 2 tokens in debt
+        self.clock.now += 1.5  # 1 token
+        self.assertEqual([0, 0.5], self.reserve(limiter, 2))
+        self.clock.now += 100
+        self.assertEqual([0, 0, 0, 0.5], self.reserve(limiter, 4))
+
+    @typechecked
+    def test_separate_buckets(self) -> None:
+        """Tests that reads, writes and credentials have their own bucket."""
+        limiter = RateLimiter(
+            read_rate=1,
+            write_rate=1,
+            read_burst=1,
+            write_burst=1,
+            clock=self.clock,
+        )
+        self.assertEqual(0, limiter.reserve("key", "GET"))
+        self.assertEqual(0, limiter.reserve("key", "POST"))
+        self.assertEqual(0, limiter.reserve("other key", "GET"))
+        self.assertEqual(1, limiter.reserve("key", "DELETE"))
+        self.assertEqual(1, limiter.reserve("key", "GET"))
+
+    @typechecked
+    def test_release(self) -> None:
+        """Tests that a released token is used by the next call, and that
+        releasing never fills the bucket above the burst."""
+        limiter = RateLimiter(read_rate=1, read_burst=2, clock=self.clock)
+        self.assertEqual([0, 0, 1], self.reserve(limiter, 3))
+        limiter.release("key", "GET")
+        self.assertEqual([1], self.reserve(limiter, 1))
+        self.clock.now += 100
+        limiter.release("key", "GET")
+        self.assertEqual([0, 0, 1], self.reserve(limiter, 3))
+        self.assertEqual(2, limiter.stats["released"])
+
+    @typechecked
+    def test_file_backend_is_shared(self) -> None:
+        """Tests that limiters with the same file share their buckets, as
+        the worker processes of a host do."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "mollie.rate")
+            limiters = [
+                RateLimiter(
+                    read_rate=1,
+                    read_burst=2,
+                    backend=FileBucketBackend(path),
+                    clock=self.clock,
+                )
+                for _ in range(2)
+            ]
+            self.assertEqual(0, limiters[0].reserve("key", "GET"))
+            self.assertEqual(0, limiters[1].reserve("key", "GET"))
+            self.assertEqual(1, limiters[0].reserve("key", "GET"))
+            limiters[0].release("key", "GET")
+            self.assertEqual(1, limiters[1].reserve("key", "GET"))
+            with open(path, encoding="utf-8") as file:
+                self.assertNotIn("key", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests caching and revalidating responses with the ResponseCache."""
+import io
+import json
+import unittest
+from typing import Dict, List, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from typeguard import typechecked
+
+from mollie.api.cache import CacheEntry, CacheKey, ResponseCache
+from mollie.api.client import Client
+from mollie.api.transport import Timeout, Transport
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ETagTransport(Transport):
+    """Answers with a profile and its ETag, or with 304 Not Modified when
+    the request has the current ETag in If-None-Match."""
+
+    def __init__(self) -> None:
+        self.name = "Shop"
+        self.etag = '"v1"'
+        self.statuses: List[int] = []
+        self.if_none_match: List[Optional[str]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Union[str, bytes],
+        timeout: Timeout,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.if_none_match.append(headers.get("If-None-Match"))
+        profile_id = url.split("?")[0].rsplit("/", 1)[1]
+        body = b""
+        status = 304
+        if headers.get("If-None-Match") != self.etag:
+            status = 200
+            body = json.dumps(
+                {"resource": "profile", "id": profile_id, "name": self.name}
+            ).encode("utf-8")
+        self.statuses.append(status)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/hal+json", "ETag": self.etag}
+        )
+        response.raw = io.BytesIO(body)
+        response._content = body
+        return response
+
+
+class Test_response_cache(unittest.TestCase):
+    """Object used to test the ResponseCache of the client."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.transport = ETagTransport()
+        self.client = Client()
+        self.client.set_api_key("test_testtesttesttesttesttesttest00")
+        self.client.set_transport(self.transport)
+
+    def set_cache(self, cache: ResponseCache) -> ResponseCache:
+        self.client.set_response_cache(cache)
+        return cache
+
+    @typechecked
+    def test_fresh_hit(self) -> None:
+        """Tests that a fresh response is used without a request."""
+        cache = self.set_cache(ResponseCache(clock=self.clock))
+        self.assertEqual("Shop", self.client.profiles.get("pfl_1").name)
+        self.clock.now += 299
+        self.assertEqual("Shop", self.client.profiles.get("pfl_1").name)
+        self.assertEqual([200], self.transport.statuses)
+        self.assertEqual(
+            {
+                "hits": 1,
+                "misses": 1,
+                "revalidations": 0,
+                "evictions": 0,
+                "size": 1,
+            },
+            cache.stats,
+        )
+
+    @typechecked
+    def test_revalidation_not_modified(self) -> None:
+        """Tests that an expired response is revalidated with its ETag, and
+        that a 304 response renews it for another TTL."""
+        cache = self.set_cache(ResponseCache(clock=self.clock))
+        self.client.profiles.get("pfl_1")
+        self.clock.now += 300
+        self.assertEqual("Shop", self.client.profiles.get("pfl_1").name)
+        self.clock.now += 299
+        self.client.profiles.get("pfl_1")
+        self.assertEqual([200, 304], self.transport.statuses)
+        self.assertEqual([None, '"v1"'], self.transport.if_none_match)
+        self.assertEqual(1, cache.stats["revalidations"])
+
+    @typechecked
+    def test_revalidation_modified(self) -> None:
+        """Tests that a changed resource replaces the expired response."""
+        self.set_cache(ResponseCache(clock=self.clock))
+        self.client.profiles.get("pfl_1")
+        self.transport.name = "New shop"
+        self.transport.etag = '"v2"'
+        self.clock.now += 300
+        self.assertEqual("New shop", self.client.profiles.get("pfl_1").name)
+        self.client.profiles.get("pfl_1")
+        self.assertEqual([200, 200], self.transport.statuses)
+
+    @typechecked
+    def test_ttl_policies_and_eviction(self) -> None:
+        """Tests that a TTL of 0 disables caching, and that the least
+        recently used response is evicted."""
+        cache = self.set_cache(
+            ResponseCache(maxsize=2, ttl_policies={"Methods": 0})
+        )
+        self.assertEqual(0, cache.get_ttl("Methods", 300))
+        for profile_id in ("pfl_1", "pfl_2", "pfl_1", "pfl_3", "pfl_2"):
+            self.client.profiles.get(profile_id)
+        self.assertEqual(4, len(self.transport.statuses))
+        self.assertEqual(2, cache.stats["evictions"])
+
+    @typechecked
+    def test_renewal_goes_through_set(self) -> None:
+        """Tests that a renewed entry is stored with set(), as a new
+        entry."""
+        stored: List[CacheEntry] = []
+
+        class RecordingCache(ResponseCache):
+            def set(self, key: CacheKey, entry: CacheEntry) -> None:
+                stored.append(entry)
+                super().set(key, entry)
+
+        self.set_cache(RecordingCache(clock=self.clock))
+        self.client.profiles.get("pfl_1")
+        self.clock.now += 300
+        self.client.profiles.get("pfl_1")
+        self.assertEqual(2, len(stored))
+        self.assertIsNot(stored[0], stored[1])
+        self.assertEqual(1300, stored[0].expires_at)
+        self.assertEqual(1600, stored[1].expires_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
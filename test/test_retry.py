@@ -0,0 +1,131 @@
+"""Tests retrying failed API calls within a retry budget."""
+import unittest
+
+from typeguard import typechecked
+
+from mollie.api.client import Client
+from mollie.api.error import NotFoundError, ResponseError
+from mollie.api.retry import RetryBudget, RetryPolicy
+from mollie.api.transport import InMemoryTransport
+
+
+class Clock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Test_retry(unittest.TestCase):
+    """Object used to test the RetryBudget and the RetryPolicy."""
+
+    @typechecked
+    def test_budget_ratio(self) -> None:
+        """Tests that every request adds the ratio to the budget, up to the
+        capacity."""
+        clock = Clock()
+        budget = RetryBudget(
+            ratio=0.5, min_per_second=0, capacity=2, clock=clock
+        )
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(
+            [True, True, False], [budget.withdraw() for _ in range(3)]
+        )
+
+    @typechecked
+    def test_budget_refills_over_time(self) -> None:
+        """Tests that the budget grows by min_per_second without requests."""
+        clock = Clock()
+        budget = RetryBudget(
+            ratio=0, min_per_second=0.5, capacity=1, clock=clock
+        )
+        self.assertTrue(budget.withdraw())
+        clock.now += 1
+        self.assertFalse(budget.withdraw())
+        clock.now += 1
+        self.assertTrue(budget.withdraw())
+        clock.now += 100
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    @typechecked
+    def test_retryable_calls(self) -> None:
+        """Tests that GET requests, and writes with an Idempotency-Key, are
+        retried."""
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable("GET", ""))
+        self.assertTrue(policy.is_retryable("POST", "key"))
+        self.assertFalse(policy.is_retryable("POST", ""))
+
+    @typechecked
+    def test_delays(self) -> None:
+        """Tests the jitter bounds, the Retry-After header and the statuses
+        that are not retried."""
+        policy = RetryPolicy(
+            max_attempts=100,
+            base_delay=0.5,
+            max_delay=2,
+            budget=RetryBudget(min_per_second=0, capacity=100),
+        )
+        delay = 0.0
+        for attempt in range(1, 30):
+            delay = policy.get_delay(attempt, 503, {}, delay) or 0.0
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 2)
+
+        self.assertEqual(7, policy.get_delay(1, 429, {"Retry-After": "7"}, 0))
+        self.assertIsNone(policy.get_delay(1, 429, {"Retry-After": "31"}, 0))
+        self.assertIsNone(policy.get_delay(1, 500, {}, 0))
+        self.assertIsNone(policy.get_delay(1, 404, {}, 0))
+
+    @typechecked
+    def test_budget_exhausted(self) -> None:
+        """Tests that no retries are made once the budget is spent."""
+        budget = RetryBudget(ratio=0, min_per_second=0, capacity=1)
+        policy = RetryPolicy(budget=budget)
+        self.assertIsNotNone(policy.get_delay(1, 503, {}, 0))
+        self.assertIsNone(policy.get_delay(1, 503, {}, 0))
+        self.assertEqual(
+            {"retries": 1, "budget_exhausted": 1, "gave_up": 0}, policy.stats
+        )
+
+    @typechecked
+    def test_client_attempts(self) -> None:
+        """Tests that the client makes max_attempts attempts of a call that
+        keeps failing with a retryable status, and one of any other call."""
+        transport = InMemoryTransport()
+        transport.add(
+            "GET",
+            "payments/tr_unavailable",
+            {"status": 503, "title": "Service Unavailable", "detail": "Down"},
+            status=503,
+        )
+        client = Client()
+        client.set_api_key("test_testtesttesttesttesttesttest00")
+        client.set_transport(transport)
+        policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+        client.set_retry_policy(policy)
+
+        with self.assertRaises(ResponseError):
+            client.payments.get("tr_unavailable")
+        self.assertEqual(3, transport.request_count)
+        self.assertEqual(1, policy.stats["gave_up"])
+
+        with self.assertRaises(NotFoundError):
+            client.payments.get("tr_missing")
+        self.assertEqual(4, transport.request_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
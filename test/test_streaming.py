@@ -0,0 +1,114 @@
+"""Tests the incremental decoding of HAL list responses."""
+import json
+import random
+import unittest
+from typing import Any, Dict, List
+
+from typeguard import typechecked
+
+from mollie.api.error import ResponseHandlingError
+from mollie.api.streaming import iter_hal_list
+
+BODY: bytes = json.dumps(
+    {
+        "count": 3,
+        "_embedded": {
+            "payments": [
+                {
+                    "resource": "payment",
+                    "id": "tr_7UhSN1zuXS",
+                    "amount": {"value": "10.00", "currency": "EUR"},
+                    "description": "Bestelling №12 — café «Ünïcode» 😀",
+                    "metadata": {"order_id": 12345, "rate": -1.5e-3},
+                    "isCancelable": True,
+                    "details": None,
+                },
+                {
+                    "resource": "payment",
+                    "id": "tr_WDqYK6vllg",
+                    "description": 'Quotes " and \\ backslashes\n',
+                    "metadata": [],
+                    "isCancelable": False,
+                    "sequence": [1, 22, 333, 4444],
+                },
+                {"resource": "payment", "id": "tr_1", "count": 1000000},
+            ],
+            "other": {"resource": "list"},
+        },
+        "_links": {
+            "self": {"href": "https://api.mollie.com/v2/payments"},
+            "next": None,
+        },
+    },
+    indent=1,
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+@typechecked
+def split(body: bytes, sizes: List[int]) -> List[bytes]:
+    """Return the body in chunks of the sizes, repeated."""
+    chunks = []
+    position = 0
+    index = 0
+    while position < len(body):
+        size = sizes[index % len(sizes)]
+        chunks.append(body[position : position + size])
+        position += size
+        index += 1
+    return chunks
+
+
+class Test_streaming(unittest.TestCase):
+    """Object used to test the iter_hal_list function."""
+
+    def assert_decoded(self, chunks: List[bytes]) -> None:
+        """Asserts that the chunks are decoded like json.loads() does."""
+        expected_result: Dict[str, Any] = json.loads(BODY)
+        fields: Dict[str, Any] = {}
+        items = list(iter_hal_list(chunks, "payments", fields))
+        self.assertEqual(expected_result["_embedded"]["payments"], items)
+        del expected_result["_embedded"]["payments"]
+        self.assertEqual(expected_result, fields)
+
+    @typechecked
+    def test_single_chunk(self) -> None:
+        """Tests decoding the body received at once."""
+        self.assert_decoded([BODY])
+
+    @typechecked
+    def test_every_chunk_size(self) -> None:
+        """Tests chunks of a fixed size, which split the strings, numbers,
+        literals and multi-byte characters at every offset."""
+        for size in range(1, 40):
+            with self.subTest(size=size):
+                self.assert_decoded(split(BODY, [size]))
+
+    @typechecked
+    def test_random_chunk_splits(self) -> None:
+        """Tests random chunk sizes, including empty chunks."""
+        generator = random.Random(6)
+        for _ in range(200):
+            sizes = [generator.randint(0, 25) for _ in range(10)]
+            if not any(sizes):
+                continue
+            with self.subTest(sizes=sizes):
+                self.assert_decoded(split(BODY, sizes))
+
+    @typechecked
+    def test_truncated_body(self) -> None:
+        """Tests that a body that ends early raises an error."""
+        for end in (0, len(BODY) // 3, len(BODY) - 2):
+            with self.subTest(end=end):
+                with self.assertRaises(ResponseHandlingError):
+                    list(iter_hal_list(split(BODY[:end], [7]), "payments"))
+
+    @typechecked
+    def test_invalid_body(self) -> None:
+        """Tests that a body that is no JSON object raises an error."""
+        with self.assertRaises(ResponseHandlingError):
+            list(iter_hal_list([b"[1, 2]"], "payments"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Tests parsing the timestamps of the Mollie API."""
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from typeguard import typechecked
+
+from mollie.api.resources.base import _parse_timestamp
+
+EXPECTED: datetime = datetime(2023, 10, 1, 12, 30, 5, tzinfo=timezone.utc)
+
+
+class Test_timestamps(unittest.TestCase):
+    """Object used to test the _parse_timestamp function."""
+
+    @typechecked
+    def test_utc_designators(self) -> None:
+        """Tests that a trailing 'Z' and a zero offset are both UTC."""
+        for value in ("2023-10-01T12:30:05Z", "2023-10-01T12:30:05+00:00"):
+            with self.subTest(value=value):
+                self.assertEqual(EXPECTED, _parse_timestamp(value))
+
+    @typechecked
+    def test_fractional_seconds_with_z(self) -> None:
+        """Tests a trailing 'Z' after fractional seconds."""
+        self.assertEqual(
+            EXPECTED.replace(microsecond=123000),
+            _parse_timestamp("2023-10-01T12:30:05.123Z"),
+        )
+
+    @typechecked
+    def test_other_offset(self) -> None:
+        """Tests that an offset other than UTC is kept."""
+        actual_result = _parse_timestamp("2023-10-01T14:30:05+02:00")
+        self.assertEqual(EXPECTED, actual_result)
+        self.assertEqual(timedelta(hours=2), actual_result.utcoffset())
+
+    @typechecked
+    def test_naive_values_are_utc(self) -> None:
+        """Tests that strings and datetimes without an offset are taken
+        as UTC."""
+        naive = EXPECTED.replace(tzinfo=None)
+        self.assertEqual(EXPECTED, _parse_timestamp(naive))
+        self.assertEqual(EXPECTED, _parse_timestamp(naive.isoformat()))
+
+
+if __name__ == "__main__":
+    unittest.main()